@@ -1,6 +1,7 @@
 # app.py - 수정된 버전
 import streamlit as st
 import pandas as pd
+import json
 from datetime import datetime
 import time
 
@@ -11,9 +12,15 @@ from logging_config import StreamlitLogger, LoggingDecorators, SystemMonitor
 @st.cache_resource
 def init_logging_system():
     """로깅 시스템 초기화 (한 번만 실행)"""
-    logger = StreamlitLogger(log_dir="./logs")  # 로컬 테스트용 경로
+    logger = StreamlitLogger(  # 로컬 테스트용 경로
+        log_dir="./logs",
+        compress_backups=True,
+        async_mode=True,
+        overflow_policy='drop_debug',
+        buffered_streams=('access',)  # 요청마다 쓰는 access 로그만 모아서 기록
+    )
     decorators = LoggingDecorators(logger)
-    monitor = SystemMonitor(logger)
+    monitor = SystemMonitor(logger, interval_seconds=60)  # 1분마다 백그라운드 샘플링
     return logger, decorators, monitor
 
 # 전역 객체 생성
@@ -277,25 +284,53 @@ def report_page():
         if st.button("로그 분석 보고서"):
             show_log_analysis()
 
+    # 현재 세션의 요청별 span 트리 (chrome://tracing, Perfetto에서 열기)
+    if logger.tracer is not None:
+        with st.expander("🧭 요청 트레이스"):
+            session_id = st.session_state.get('session_id')
+            traces = logger.tracer.recent_traces(limit=10, session_id=session_id)
+            if traces:
+                st.dataframe(pd.DataFrame(traces)[['name', 'total_ms', 'self_ms', 'status', 'trace_id']])
+            st.download_button(
+                "Chrome trace 내보내기 (JSON)",
+                data=json.dumps(logger.tracer.export_chrome_trace(session_id=session_id)),
+                file_name="trace.json",
+                mime="application/json"
+            )
+
 @decorators.log_execution_time("system_status_check")
 def check_system_status():
     """시스템 상태 확인"""
     logger.info("시스템 상태 확인 시작")
     
     try:
-        # 시스템 모니터링
-        monitor.log_system_stats()
+        # 백그라운드 샘플러가 모은 값을 읽음 (비어 있으면 즉시 1회 수집)
+        history = monitor.get_history()
+        latest = history[-1] if history else monitor.get_latest()
+        if latest is None:
+            st.warning("시스템 통계를 수집하지 못했습니다.")
+            return
+        previous = history[-2] if len(history) > 1 else None
+        
+        def delta(key):
+            return None if previous is None else f"{latest[key] - previous[key]:+.1f}%"
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("CPU 사용률", "45%", "2%")
+            st.metric("CPU 사용률", f"{latest['cpu_percent']:.1f}%", delta('cpu_percent'))
         
         with col2:
-            st.metric("메모리 사용률", "67%", "-3%")
+            st.metric("메모리 사용률", f"{latest['memory_percent']:.1f}%", delta('memory_percent'))
         
         with col3:
-            st.metric("디스크 사용률", "23%", "1%")
+            st.metric("디스크 사용률", f"{latest['disk_percent']:.1f}%", delta('disk_percent'))
+        
+        if len(history) > 1:
+            st.line_chart(
+                pd.DataFrame(history).set_index('timestamp')[['cpu_percent', 'memory_percent', 'disk_percent']]
+            )
+        st.caption(f"마지막 샘플: {latest['timestamp']}")
         
         st.success("시스템 상태가 정상입니다!")
         logger.info("시스템 상태 확인 완료")
@@ -306,9 +341,9 @@ def check_system_status():
 def show_log_analysis():
     """로그 분석 결과 표시"""
     try:
-        from log_analyzer import LogAnalyzer
+        from log_analyzer import IncrementalLogAnalyzer
         
-        analyzer = LogAnalyzer(log_dir="./logs")  # 로컬 경로로 수정
+        analyzer = IncrementalLogAnalyzer.get_shared(log_dir="./logs")  # 프로세스당 한 번만 상태 로드
         report = analyzer.generate_report(hours=24)
         
         st.subheader("🔍 최근 24시간 활동 분석")
@@ -322,6 +357,14 @@ def show_log_analysis():
                 st.write("**에러 유형별 분류:**")
                 for error_type, count in error_data['error_types'].items():
                     st.write(f"- {error_type}: {count}회")
+            
+            if error_data.get('fingerprints'):
+                st.write("**에러 그룹 (상위 5개):**")
+                for fingerprint, entry in list(error_data['fingerprints'].items())[:5]:
+                    st.write(
+                        f"- `{fingerprint}` {entry['exception_type'] or '메시지'}: {entry['count']}회 "
+                        f"(최초 {entry['first_seen']:%H:%M:%S}, 최근 {entry['last_seen']:%H:%M:%S})"
+                    )
         else:
             st.success("✅ 에러가 발생하지 않았습니다.")
         
@@ -337,7 +380,13 @@ def show_log_analysis():
                 st.metric("고유 사용자", activity_data.get('unique_users', 0))
             with col3:
                 st.metric("고유 세션", activity_data.get('unique_sessions', 0))
-        
+
+        # 작업별 실행 시간 (프로세스 메모리 집계, 파일을 읽지 않음)
+        operation_metrics = logger.get_operation_metrics()
+        if operation_metrics:
+            st.subheader("⏱️ 작업별 실행 시간 (현재 프로세스)")
+            st.dataframe(pd.DataFrame.from_dict(operation_metrics, orient='index'))
+
         logger.info("로그 분석 보고서 생성 완료")
         
     except ImportError:
@@ -347,6 +396,12 @@ def show_log_analysis():
         logger.error("로그 분석 중 오류", exception=e)
         st.error("로그 분석 중 오류가 발생했습니다.")
 
+@st.cache_resource
+def get_log_manager():
+    """사용량 캐시를 유지하도록 LogManager를 한 번만 생성"""
+    from log_analyzer import LogManager
+    return LogManager(log_dir="./logs")
+
 def settings_page():
     """설정 페이지"""
     st.header("⚙️ 시스템 설정")
@@ -359,15 +414,20 @@ def settings_page():
         # 현재 로그 파일 크기 표시
         if st.button("로그 파일 상태 확인"):
             try:
-                from log_analyzer import LogManager
-                manager = LogManager(log_dir="./logs")
-                sizes = manager.get_log_sizes()
+                usage = get_log_manager().get_usage_report()
+                
+                st.write("**로거별 사용량 (로테이션/압축 파일 포함):**")
+                for logger_name, info in usage['loggers'].items():
+                    growth = info['growth_bytes_per_hour']
+                    growth_text = f", {growth / (1024 * 1024):.2f} MB/h" if growth is not None else ""
+                    st.write(f"- {logger_name}: {info['total_mb']} MB ({info['files']}개 파일{growth_text})")
                 
-                st.write("**현재 로그 파일 크기:**")
-                for filename, size_mb in sizes.items():
-                    st.write(f"- {filename}: {size_mb} MB")
+                st.write(f"**전체:** {usage['total_mb']} MB / 디스크 여유 {usage['disk_free_gb']} GB")
+                if usage['hours_until_full'] is not None:
+                    st.write(f"**디스크 고갈 예상:** 약 {usage['hours_until_full']}시간 후")
                 
-                logger.info("로그 파일 상태 확인", file_sizes=sizes)
+                logger.info("로그 파일 상태 확인", total_mb=usage['total_mb'],
+                            growth_bytes_per_hour=usage['growth_bytes_per_hour'])
             except Exception as e:
                 logger.error("로그 파일 상태 확인 중 오류", exception=e)
                 st.error("로그 파일 상태 확인 중 오류가 발생했습니다.")
@@ -328,19 +328,57 @@ def check_system_status():
     logger.info("시스템 상태 확인 시작")
     
     try:
-        # 시스템 모니터링
-        monitor.log_system_stats()
+        # 백그라운드 샘플러가 모은 값을 읽음 (비어 있으면 즉시 1회 수집)
+        history = monitor.get_history()
+        latest = history[-1] if history else monitor.get_latest()
+        if latest is None:
+            st.warning("시스템 통계를 수집하지 못했습니다.")
+            return
+        previous = history[-2] if len(history) > 1 else None
+        
+        def delta(key):
+            return None if previous is None else f"{latest[key] - previous[key]:+.1f}%"
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("CPU 사용률", "45%", "2%")
+            st.metric("CPU 사용률", f"{latest['cpu_percent']:.1f}%", delta('cpu_percent'))
         
         with col2:
-            st.metric("메모리 사용률", "67%", "-3%")
+            st.metric("메모리 사용률", f"{latest['memory_percent']:.1f}%", delta('memory_percent'))
         
         with col3:
-            st.metric("디스크 사용률", "23%", "1%")
+            st.metric("디스크 사용률", f"{latest['disk_percent']:.1f}%", delta('disk_percent'))
+        
+        if len(history) > 1:
+            st.line_chart(
+                pd.DataFrame(history).set_index('timestamp')[['cpu_percent', 'memory_percent', 'disk_percent']]
+            )
+        st.caption(f"마지막 샘플: {latest['timestamp']}")
+        
+        # 서버 프로세스 자원 (monitoring.process_stats)
+        process = latest.get('process')
+        if process:
+            st.write("**Streamlit 서버 프로세스**")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("RSS", f"{process['rss_mb']} MB")
+            with col2:
+                st.metric("USS", f"{process['uss_mb']} MB" if 'uss_mb' in process else "-")
+            with col3:
+                st.metric("스레드 / FD", f"{process['threads']} / {process.get('open_fds', '-')}")
+            with col4:
+                st.metric("세션당 메모리", f"{process['memory_per_session_mb']} MB"
+                          if 'memory_per_session_mb' in process else "-",
+                          help=f"최근 활동 세션 {process['active_sessions']}개 기준")
+            
+            gc_pauses = pd.DataFrame(process['gc']).T
+            st.write("GC 세대별 횟수/일시정지")
+            st.dataframe(gc_pauses)
+            
+            if process['top_memory_operations']:
+                st.write("메모리를 가장 많이 늘린 작업")
+                st.dataframe(pd.DataFrame(process['top_memory_operations']))
         
         st.success("시스템 상태가 정상입니다!")
         logger.info("시스템 상태 확인 완료")
@@ -351,9 +389,9 @@ def check_system_status():
 def show_log_analysis():
     """로그 분석 결과 표시"""
     try:
-        from log_analyzer import LogAnalyzer
+        from log_analyzer import IncrementalLogAnalyzer
         
-        analyzer = LogAnalyzer(log_dir=logger.log_dir)  # YAML 설정의 log_dir 사용
+        analyzer = IncrementalLogAnalyzer.get_shared(log_dir=logger.log_dir)  # YAML 설정의 log_dir, 프로세스당 한 번만 상태 로드
         report = analyzer.generate_report(hours=24)
         
         st.subheader("🔍 최근 24시간 활동 분석")
@@ -367,6 +405,14 @@ def show_log_analysis():
                 st.write("**에러 유형별 분류:**")
                 for error_type, count in error_data['error_types'].items():
                     st.write(f"- {error_type}: {count}회")
+            
+            if error_data.get('fingerprints'):
+                st.write("**에러 그룹 (상위 5개):**")
+                for fingerprint, entry in list(error_data['fingerprints'].items())[:5]:
+                    st.write(
+                        f"- `{fingerprint}` {entry['exception_type'] or '메시지'}: {entry['count']}회 "
+                        f"(최초 {entry['first_seen']:%H:%M:%S}, 최근 {entry['last_seen']:%H:%M:%S})"
+                    )
         else:
             st.success("✅ 에러가 발생하지 않았습니다.")
         
@@ -456,6 +502,15 @@ def show_current_settings():
         for logger_name in config_info['loggers']:
             st.write(f"✅ {logger_name}")
 
+    # 샘플링으로 버린 이벤트까지 포함한 정확한 집계
+    sampling_stats = logger.get_sampling_stats()
+    if any(sampling_stats.values()):
+        st.write("**샘플링 집계 (정확한 건수)**")
+        for stream, counters in sampling_stats.items():
+            if counters:
+                st.write(f"_{stream}_")
+                st.dataframe(pd.DataFrame.from_dict(counters, orient='index'))
+
 def check_log_file_status():
     """로그 파일 상태 확인"""
     try:
@@ -472,7 +527,7 @@ def check_log_file_status():
         st.write(f"**총 크기: {round(total_size, 2)} MB**")
         
         # 설정된 최대 크기와 비교
-        max_size_mb = logger.config_manager.get('environments.development.file_rotation.max_bytes', 100000000) // (1024*1024)
+        max_size_mb = logger.config_manager.settings.environment.file_rotation.max_bytes // (1024*1024)
         
         for filename, size_mb in sizes.items():
             if size_mb > max_size_mb * 0.8:  # 80% 초과시 경고
@@ -505,15 +560,19 @@ def cleanup_old_logs():
         st.error("로그 정리 중 오류가 발생했습니다.")
 
 def reload_config():
-    """설정 파일 다시 로드"""
+    """설정 파일 다시 로드 (살아 있는 핸들러에 변경분만 적용)"""
     try:
-        # 캐시 클리어하고 다시 초기화
-        st.cache_resource.clear()
+        old_settings = logger.config_manager.reload()
+        if old_settings is None:
+            st.info("설정 파일에 적용할 변경사항이 없습니다.")
+            return
         
+        changes = logger.apply_config(old_settings)
         st.success("설정 파일을 다시 로드했습니다!")
-        st.info("변경사항을 적용하려면 페이지를 새로고침하세요.")
+        for change in changes:
+            st.write(f"- {change}")
         
-        logger.info("설정 파일 재로드 요청")
+        logger.info("설정 파일 재로드 요청", changes=len(changes))
         
     except Exception as e:
         logger.error("설정 파일 재로드 중 오류", exception=e)
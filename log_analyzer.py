@@ -1,12 +1,635 @@
 # log_analyzer.py
 # 로그 분석 및 관리 유틸리티
 
+import fnmatch
+import gzip
+import hashlib
+import io
 import json
+import math
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 from pathlib import Path
-import pandas as pd
+# pandas는 벡터화/Parquet 경로에서만 함수 안에서 import (CLI/증분 분석 기동 속도)
+
+try:
+    import orjson  # 선택 의존성: 있으면 JSON lines 파싱에 사용
+except ImportError:
+    orjson = None
+
+
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+JSON_PATTERN = re.compile(r'\{.*\}')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# StreamlitLogger(per_process_files=True)의 프로세스별 파일 (access.1234.log)
+PROCESS_LOG_PATTERN = re.compile(r'^(.+)\.(\d+)\.log$')
+MINUTE_FORMAT = '%Y-%m-%d %H:%M'
+HOUR_KEY_LENGTH = len('YYYY-mm-dd HH')  # 시간 버킷 키 (분 버킷 키의 앞부분)
+
+# Parquet 컴팩션 설정
+PARQUET_DIR = "parquet"
+# 분석기/관리 도구 상태 파일 디렉토리: log_dir 바로 아래에 쓰면 log_dir의
+# mtime이 바뀌어 사용량 캐시의 "디렉토리 변경 없음" 경로가 무효가 됨
+STATE_DIR = ".state"
+PARQUET_SCHEMAS = {
+    'access': ['timestamp', 'user_id', 'session_id', 'action', 'page', 'count', 'extra'],
+    'performance': ['timestamp', 'operation', 'duration_ms', 'status', 'count', 'sum_ms', 'min_ms', 'max_ms', 'extra']
+}
+# 행이 대표하는 호출 수(sampled_count, 요약 레코드의 count)와 performance 합계/최소/최대 (ms)
+PARQUET_WEIGHT_COLUMNS = {
+    'access': ['count'],
+    'performance': ['count', 'sum_ms', 'min_ms', 'max_ms']
+}
+# 가중치 컬럼이 추가된 스키마 (manifest 항목의 'schema'가 이보다 낮으면 변환 시 업그레이드)
+PARQUET_SCHEMA_VERSION = 2
+
+
+def _extract_timestamp(line):
+    """로그 라인 앞부분의 타임스탬프 추출"""
+    timestamp_match = TIMESTAMP_PATTERN.match(line)
+    if timestamp_match:
+        return datetime.strptime(timestamp_match.group(1), TIMESTAMP_FORMAT)
+    return None
+
+
+def _extract_payload(line):
+    """로그 라인에 포함된 JSON 데이터 추출"""
+    json_match = JSON_PATTERN.search(line)
+    if json_match:
+        return json.loads(json_match.group())
+    return None
+
+
+# StreamlitLogger(structured=True)가 모든 레코드에 붙이는 공통 키
+JSON_RECORD_KEYS = ('ts', 'level', 'logger', 'stream', 'func', 'line')
+
+
+def _loads(text):
+    """JSON 역직렬화 (orjson이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_json_record(line):
+    """JSON lines 레코드 파싱 (정규식 없이 ts 키에서 시각을 읽음)"""
+    try:
+        entry = _loads(line)
+        return datetime.fromisoformat(entry['ts'][:19]), entry
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _json_payload(entry):
+    """JSON lines 레코드에서 공통 키를 뺀 페이로드"""
+    return {key: value for key, value in entry.items() if key not in JSON_RECORD_KEYS}
+
+
+FRAME_PATTERN = re.compile(r'\s+File "([^"]+)", line \d+, in (\S+)')
+EXCEPTION_LINE_PATTERN = re.compile(r'([A-Za-z_][\w.]*)(?::\s|:?$)')
+EXC_INFO_CLASS_PATTERN = re.compile(r"<class '([\w.]+)'>")
+VOLATILE_PATTERN = re.compile(r"0x[0-9a-fA-F]+|\d+|'[^']*'|\"[^\"]*\"")
+RECORD_START = re.compile(rb'\{|\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+# 로깅 데코레이터/컨텍스트 매니저 프레임은 지문에서 제외 (데코레이터 중첩 수에 따라 지문이 달라지지 않도록)
+WRAPPER_FRAME_FILES = ('logging_config*.py', 'contextlib.py')
+
+
+def _weight_values(stream, data, duration=None):
+    """레코드 하나의 가중치 컬럼 값 (PerformanceStats.add / AccessStats.add와 같은 규칙)
+    
+    샘플링된 레코드는 sampled_count개의 호출을, 요약 레코드는 count개의
+    호출을 대표합니다. 사용한 키는 data에서 제거합니다.
+    """
+    weight = data.pop('sampled_count', 1)
+    if stream == 'access':
+        return [weight]
+    if data.get('type') == 'summary':
+        return [data.pop('count', 1), data.pop('sum_ms', duration), data.pop('min_ms', duration),
+                data.pop('max_ms', duration)]
+    duration = duration or 0
+    return [weight, duration * weight, duration, duration]
+
+
+def _write_json_atomic(path, data, **dump_kwargs):
+    """JSON을 임시 파일에 쓴 뒤 교체 (임시 파일 이름이 고유해야 여러 프로세스가 동시에 저장해도 섞이지 않음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+        os.replace(tmp_file, path)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def _open_log(path):
+    """로그 세그먼트를 텍스트로 열기 (.gz는 스트림 압축 해제)"""
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _rotated_segments(log_dir, filename):
+    """로테이션된 세그먼트 경로를 오래된 것부터 반환 (app.log.N, app.log.N.gz)
+    
+    압축이 진행 중이라 app.log.N 과 app.log.N.gz 가 함께 있으면 압축 전
+    파일만 사용합니다. 압축 대기 중인 세그먼트(app.log.<ns>.pending)는
+    번호가 붙은 세그먼트보다 최근이므로 시각 순으로 마지막에 둡니다.
+    """
+    segments = {}
+    pending = {}
+    for path in Path(log_dir).glob(f"{filename}.*"):
+        suffix = path.name[len(filename) + 1:]
+        number = suffix.split('.')[0]
+        if not number.isdigit():
+            continue
+        if suffix == f"{number}.pending":
+            pending[int(number)] = path
+            continue
+        if suffix not in (number, f"{number}.gz"):
+            continue
+        if int(number) not in segments or suffix == number:
+            segments[int(number)] = path
+    return ([segments[number] for number in sorted(segments, reverse=True)] +
+            [pending[rotated_ns] for rotated_ns in sorted(pending)])
+
+
+def _head_digest(path, length):
+    """파일 앞부분 length 바이트의 해시 (압축 세그먼트는 압축 해제 기준)"""
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+
+def _is_checkpointed_file(path, checkpoint):
+    """path가 체크포인트 시점의 파일인지 앞부분 해시로 확인
+    
+    삭제된 파일(압축이 끝난 .pending 등)의 inode는 새 파일에 바로 재사용될
+    수 있으므로 inode만으로는 같은 파일로 보지 않습니다. 빈 파일에서 잡은
+    체크포인트(head_length 0)는 식별할 수 없으므로 항상 False입니다.
+    """
+    if not checkpoint.get('head_length'):
+        return False
+    return _head_digest(path, checkpoint['head_length']) == checkpoint['head']
+
+
+def _segments_after(segments, checkpoint):
+    """체크포인트 시점의 파일이 로테이션된 위치와 그 이후 세그먼트
+    
+    파일을 찾으면 (index, segments[index + 1:]), 찾지 못하면(빈 파일이었거나
+    이미 지워짐) (None, 체크포인트 이후 수정된 세그먼트)를 반환합니다.
+    """
+    for index in range(len(segments) - 1, -1, -1):
+        try:
+            if _is_checkpointed_file(segments[index], checkpoint):
+                return index, segments[index + 1:]
+        except OSError:
+            continue
+    return None, [seg for seg in segments if seg.stat().st_mtime_ns > checkpoint.get('mtime_ns', 0)]
+
+
+def _stream_files(log_dir, filename):
+    """스트림의 현재 파일 이름 목록: filename과 프로세스별 파일(pid 순)
+    
+    filename은 없더라도 항상 첫 번째로 포함하고(로테이션 세그먼트만 남은
+    경우), 프로세스별 파일은 존재하는 것만 반환합니다.
+    """
+    stem, ext = os.path.splitext(filename)
+    process_files = []
+    for path in Path(log_dir).glob(f"{stem}.*{ext}"):
+        match = PROCESS_LOG_PATTERN.match(path.name)
+        if match and match.group(1) == stem:
+            process_files.append((int(match.group(2)), path.name))
+    return [filename] + [name for _, name in sorted(process_files)]
+
+
+def _logger_name(filename):
+    """파일 이름의 로거 이름 (access.log.3.gz, access.1234.log -> access)"""
+    base = filename.partition('.log')[0]
+    match = PROCESS_LOG_PATTERN.match(base + '.log')
+    return match.group(1) if match else base
+
+
+def _iter_records(stats_class, lines):
+    """라인 스트림을 레코드 단위로 묶음
+    
+    여러 줄 레코드 스트림(error.log)은 타임스탬프로 시작하지 않는 라인
+    (exc_info 트레이스백)을 직전 레코드에 붙여 하나의 문자열로 만듭니다.
+    JSON lines 레코드는 트레이스백까지 한 줄에 담기므로 그대로 내보냅니다.
+    """
+    if not stats_class.multiline:
+        yield from lines
+        return
+    
+    record = None
+    for line in lines:
+        if line.startswith('{'):
+            if record is not None:
+                yield '\n'.join(record)
+                record = None
+            yield line.rstrip('\n')
+        elif TIMESTAMP_PATTERN.match(line):
+            if record is not None:
+                yield '\n'.join(record)
+            record = [line.rstrip('\n')]
+        elif record is not None:
+            record.append(line.rstrip('\n'))
+    if record is not None:
+        yield '\n'.join(record)
+
+
+def _fingerprint_error(header, traceback_lines, top_frames=3):
+    """예외 타입 + 정규화된 최상위 프레임으로 에러 지문 생성
+    
+    프레임은 파일명(디렉토리 제외)과 함수명만 사용하므로 라인 번호나
+    설치 경로가 달라도 같은 에러는 같은 지문을 가집니다. 로깅 데코레이터
+    래퍼 프레임은 최상위 프레임 선택 전에 제외합니다. 트레이스백이
+    없는 에러는 숫자/문자열을 지운 메시지 템플릿으로 묶습니다.
+    """
+    frames = []
+    exception_type = None
+    message = None
+    
+    for line in traceback_lines:
+        frame_match = FRAME_PATTERN.match(line)
+        if frame_match:
+            filename = os.path.basename(frame_match.group(1))
+            if not any(fnmatch.fnmatch(filename, pattern) for pattern in WRAPPER_FRAME_FILES):
+                frames.append(f"{filename}:{frame_match.group(2)}")
+        elif line and not line[0].isspace() and not line.startswith('Traceback') \
+                and not line.startswith('During handling') and not line.startswith('The above exception'):
+            exception_match = EXCEPTION_LINE_PATTERN.match(line)
+            if exception_match:
+                exception_type = exception_match.group(1)
+                message = line
+    
+    if exception_type is None:
+        class_match = EXC_INFO_CLASS_PATTERN.search(header)
+        if class_match:
+            exception_type = class_match.group(1)
+    
+    frames = frames[-top_frames:]
+    if exception_type is not None:
+        key = f"{exception_type}|{';'.join(frames)}"
+    else:
+        # 헤더: 시각 | 레벨 | 로거 | 함수:라인 | 메시지 ...
+        parts = header.split(' | ')
+        template = ' | '.join(parts[3:5]) if len(parts) > 3 else header
+        key = VOLATILE_PATTERN.sub('*', template)
+    
+    fingerprint = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    return fingerprint, exception_type, frames, message or header
+
+
+# === 스트림별 집계 (병합/저장 가능) ===
+
+class LatencySketch:
+    """상대 오차 기반 지연시간 분위수 스케치 (병합 가능)
+    
+    값을 로그 스케일 버킷에 세어 두므로 청크/파일/시간 버킷별 스케치를
+    그대로 더해 전체 분위수를 구할 수 있습니다.
+    """
+    
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.bins = Counter()
+        self.zero_count = 0
+        self.count = 0
+    
+    def add(self, value, count=1):
+        if value <= 0:
+            self.zero_count += count
+        else:
+            self.bins[math.ceil(math.log(value) / self.log_gamma)] += count
+        self.count += count
+    
+    def merge(self, other):
+        self.bins.update(other.bins)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+    
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return round(2 * self.gamma ** index / (self.gamma + 1), 2)
+        return round(2 * self.gamma ** max(self.bins) / (self.gamma + 1), 2)
+    
+    def to_state(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'bins': list(self.bins.items()),
+            'zero_count': self.zero_count
+        }
+    
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(state['relative_accuracy'])
+        sketch.bins = Counter(dict((index, count) for index, count in state['bins']))
+        sketch.zero_count = state['zero_count']
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+
+class ErrorStats:
+    """error.log 집계 (트레이스백 인식, 에러 지문별 집계)"""
+
+    filename = "error.log"
+    multiline = True
+
+    def __init__(self):
+        self.total = 0
+        self.error_types = Counter()
+        self.recent = deque(maxlen=10)
+        # fingerprint -> {exception_type, frames, message, count, first_seen, last_seen}
+        self.fingerprints = {}
+
+    @staticmethod
+    def parse(record):
+        if record.startswith('{'):
+            return ErrorStats._parse_json(record)
+        timestamp = _extract_timestamp(record)
+        if timestamp is None:
+            return None
+        header, *traceback_lines = record.split('\n')
+        return timestamp, (header.strip(), traceback_lines)
+
+    @staticmethod
+    def _parse_json(record):
+        """JSON lines 레코드를 텍스트 형식과 같은 헤더/트레이스백으로 변환"""
+        parsed = _parse_json_record(record)
+        if parsed is None:
+            return None
+        timestamp, entry = parsed
+        
+        parts = [entry['ts'][:19], entry.get('level', ''), entry.get('logger', ''),
+                 f"{entry.get('func')}:{entry.get('line')}", entry.get('message', '')]
+        parts.extend(f"{key}={value}" for key, value in (entry.get('fields') or {}).items())
+        if entry.get('exception') is not None:
+            parts.append(f"Exception: {entry['exception']}")
+        traceback_lines = entry['traceback'].split('\n') if entry.get('traceback') else []
+        return timestamp, (' | '.join(parts), traceback_lines)
+
+    def add(self, timestamp, data):
+        header, traceback_lines = data
+        self.total += 1
+        self.recent.append({'timestamp': timestamp, 'line': header})
+
+        fingerprint, exception_type, frames, message = _fingerprint_error(header, traceback_lines)
+        if exception_type is not None:
+            self.error_types[exception_type] += 1
+
+        entry = self.fingerprints.get(fingerprint)
+        if entry is None:
+            self.fingerprints[fingerprint] = {
+                'exception_type': exception_type,
+                'frames': frames,
+                'message': message,
+                'count': 1,
+                'first_seen': timestamp,
+                'last_seen': timestamp
+            }
+        else:
+            entry['count'] += 1
+            entry['first_seen'] = min(entry['first_seen'], timestamp)
+            if timestamp >= entry['last_seen']:
+                entry['last_seen'] = timestamp
+                entry['message'] = message
+
+    def merge(self, other):
+        self.total += other.total
+        self.error_types.update(other.error_types)
+        recent = sorted([*self.recent, *other.recent], key=lambda e: e['timestamp'])
+        self.recent = deque(recent, maxlen=10)
+
+        for fingerprint, other_entry in other.fingerprints.items():
+            entry = self.fingerprints.get(fingerprint)
+            if entry is None:
+                self.fingerprints[fingerprint] = dict(other_entry)
+                continue
+            entry['count'] += other_entry['count']
+            entry['first_seen'] = min(entry['first_seen'], other_entry['first_seen'])
+            if other_entry['last_seen'] >= entry['last_seen']:
+                entry['last_seen'] = other_entry['last_seen']
+                entry['message'] = other_entry['message']
+        return self
+
+    def to_dict(self):
+        fingerprints = sorted(self.fingerprints.items(), key=lambda item: item[1]['count'], reverse=True)
+        return {
+            'total_errors': self.total,
+            'error_types': dict(self.error_types),
+            'fingerprints': {fingerprint: dict(entry) for fingerprint, entry in fingerprints},
+            'recent_errors': list(self.recent)
+        }
+
+    def to_state(self):
+        return {
+            'total': self.total,
+            'error_types': dict(self.error_types),
+            'recent': [
+                {'timestamp': e['timestamp'].isoformat(), 'line': e['line']}
+                for e in self.recent
+            ],
+            'fingerprints': {
+                fingerprint: {
+                    **entry,
+                    'first_seen': entry['first_seen'].isoformat(),
+                    'last_seen': entry['last_seen'].isoformat()
+                }
+                for fingerprint, entry in self.fingerprints.items()
+            }
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.total = state['total']
+        stats.error_types = Counter(state['error_types'])
+        stats.recent.extend(
+            {'timestamp': datetime.fromisoformat(e['timestamp']), 'line': e['line']}
+            for e in state['recent']
+        )
+        for fingerprint, entry in state.get('fingerprints', {}).items():
+            stats.fingerprints[fingerprint] = {
+                **entry,
+                'first_seen': datetime.fromisoformat(entry['first_seen']),
+                'last_seen': datetime.fromisoformat(entry['last_seen'])
+            }
+        return stats
+
+
+class PerformanceStats:
+    """performance.log 집계"""
+
+    filename = "performance.log"
+    multiline = False
+
+    def __init__(self):
+        # operation -> [count, sum, min, max]
+        self.operations = {}
+        self.sketches = defaultdict(LatencySketch)
+
+    @staticmethod
+    def parse(line):
+        if line.startswith('{'):
+            parsed = _parse_json_record(line)
+            return parsed and (parsed[0], _json_payload(parsed[1]))
+        timestamp = _extract_timestamp(line)
+        if timestamp is None:
+            return None
+        data = _extract_payload(line)
+        if data is None:
+            return None
+        return timestamp, data
+
+    def add(self, timestamp, data):
+        operation = data.get('operation', 'unknown')
+        if data.get('type') == 'summary':
+            # log_execution_time 구간 요약: 같은 버킷의 히스토그램을 그대로 병합
+            self._add_values(operation, data['count'], data['sum_ms'], data['min_ms'], data['max_ms'])
+            self.sketches[operation].merge(LatencySketch.from_state(data['histogram']))
+            return
+        duration = data.get('duration_ms', 0)
+        # 샘플링된 레코드는 sampled_count개의 호출을 대표
+        weight = data.get('sampled_count', 1)
+        self._add_values(operation, weight, duration * weight, duration, duration)
+        self.sketches[operation].add(duration, weight)
+
+    def _add_values(self, operation, count, total, minimum, maximum):
+        values = self.operations.get(operation)
+        if values is None:
+            self.operations[operation] = [count, total, minimum, maximum]
+        else:
+            values[0] += count
+            values[1] += total
+            values[2] = min(values[2], minimum)
+            values[3] = max(values[3], maximum)
+
+    def merge(self, other):
+        for operation, values in other.operations.items():
+            self._add_values(operation, *values)
+        for operation, sketch in other.sketches.items():
+            self.sketches[operation].merge(sketch)
+        return self
+
+    def to_dict(self):
+        stats = {}
+        for op, (count, total, minimum, maximum) in self.operations.items():
+            sketch = self.sketches[op]
+            stats[op] = {
+                'count': count,
+                'avg_ms': round(total / count, 2),
+                'max_ms': maximum,
+                'min_ms': minimum,
+                'p50_ms': sketch.quantile(0.5),
+                'p95_ms': sketch.quantile(0.95),
+                'p99_ms': sketch.quantile(0.99)
+            }
+        return stats
+
+    def to_state(self):
+        return {
+            'operations': self.operations,
+            'sketches': {op: sketch.to_state() for op, sketch in self.sketches.items()}
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.operations = {op: list(values) for op, values in state['operations'].items()}
+        for op, sketch_state in state.get('sketches', {}).items():
+            stats.sketches[op] = LatencySketch.from_state(sketch_state)
+        return stats
+
+
+class AccessStats:
+    """access.log 집계
+    
+    건수는 sampled_count로 가중하므로 샘플링 중에도 정확하지만, 버려진
+    이벤트의 사용자/세션은 로그에 없으므로 고유 수는 근사값입니다.
+    """
+
+    filename = "access.log"
+    multiline = False
+
+    def __init__(self):
+        self.total = 0
+        self.users = set()
+        self.sessions = set()
+        self.actions = Counter()
+
+    @staticmethod
+    def parse(line):
+        if line.startswith('{'):
+            parsed = _parse_json_record(line)
+            return parsed and (parsed[0], _json_payload(parsed[1]))
+        timestamp = _extract_timestamp(line)
+        if timestamp is None:
+            return None
+        data = _extract_payload(line)
+        if data is None:
+            return None
+        return timestamp, data
+
+    def add(self, timestamp, data):
+        weight = data.get('sampled_count', 1)
+        self.total += weight
+        self.users.add(data.get('user_id'))
+        self.sessions.add(data.get('session_id'))
+        self.actions[data.get('action')] += weight
+
+    def merge(self, other):
+        self.total += other.total
+        self.users |= other.users
+        self.sessions |= other.sessions
+        self.actions.update(other.actions)
+        return self
+
+    def to_dict(self):
+        return {
+            'total_activities': self.total,
+            'unique_users': len(self.users),
+            'unique_sessions': len(self.sessions),
+            'top_actions': dict(self.actions.most_common(10))
+        }
+
+    def to_state(self):
+        # JSON 키는 문자열이어야 하므로 None 액션은 리스트로 저장
+        return {
+            'total': self.total,
+            'users': list(self.users),
+            'sessions': list(self.sessions),
+            'actions': list(self.actions.items())
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.total = state['total']
+        stats.users = set(state['users'])
+        stats.sessions = set(state['sessions'])
+        stats.actions = Counter(dict((action, count) for action, count in state['actions']))
+        return stats
 
 
 class LogAnalyzer:
@@ -15,135 +638,878 @@ class LogAnalyzer:
     def __init__(self, log_dir="/var/log/streamlit-app"):
         self.log_dir = Path(log_dir)
     
+    def _has_stream(self, filename):
+        """스트림의 현재 파일(단일 또는 프로세스별)이 하나라도 있는지"""
+        return any((self.log_dir / name).exists() for name in _stream_files(self.log_dir, filename))
+    
+    def _segments(self, filename, cutoff_time):
+        """기간에 걸치는 세그먼트 (로테이션/압축 파일 포함, 파일별로 현재 파일이 마지막)
+        
+        프로세스별 파일(access.<pid>.log)도 각각의 로테이션 세그먼트와 함께
+        포함하므로 여러 서버 프로세스의 로그가 하나의 집계로 병합됩니다.
+        """
+        segments = []
+        for name in _stream_files(self.log_dir, filename):
+            for path in _rotated_segments(self.log_dir, name):
+                try:
+                    # 마지막 기록 시각(mtime)이 기간 이전이면 건너뜀
+                    if path.stat().st_mtime >= cutoff_time.timestamp():
+                        segments.append(path)
+                except OSError:
+                    continue
+            
+            live_file = self.log_dir / name
+            if live_file.exists():
+                segments.append(live_file)
+        return segments
+    
+    def _analyze_file(self, stats_class, hours):
+        """로그 파일(로테이션된 세그먼트 포함)을 읽어 집계"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        stats = stats_class()
+        
+        for log_file in self._segments(stats_class.filename, cutoff_time):
+            with _open_log(log_file) as f:
+                for line in _iter_records(stats_class, f):
+                    try:
+                        record = stats.parse(line)
+                        if record and record[0] >= cutoff_time:
+                            stats.add(*record)
+                    except Exception:
+                        continue
+        
+        return stats
+    
     def analyze_errors(self, hours=24):
         """에러 로그 분석"""
-        error_file = self.log_dir / "error.log"
-        
-        if not error_file.exists():
+        if not self._has_stream(ErrorStats.filename):
             return {"message": "Error log file not found"}
         
+        return self._analyze_file(ErrorStats, hours).to_dict()
+    
+    def analyze_performance(self, hours=24):
+        """성능 로그 분석"""
+        if not self._has_stream(PerformanceStats.filename):
+            return {"message": "Performance log file not found"}
+        
+        return self._analyze_file(PerformanceStats, hours).to_dict()
+    
+    def analyze_user_activity(self, hours=24):
+        """사용자 활동 분석"""
+        if not self._has_stream(AccessStats.filename):
+            return {"message": "Access log file not found"}
+        
+        return self._analyze_file(AccessStats, hours).to_dict()
+    
+    def generate_report(self, hours=24):
+        """종합 보고서 생성"""
+        return {
+            'analysis_period': f"Last {hours} hours",
+            'timestamp': datetime.now().isoformat(),
+            'errors': self.analyze_errors(hours),
+            'performance': self.analyze_performance(hours),
+            'user_activity': self.analyze_user_activity(hours)
+        }
+    
+    def query(self, stream, columns=None, start=None, end=None, filters=None):
+        """컴팩션된 Parquet 로그 조회 (파티션/컬럼/조건 pushdown)
+        
+        stream은 'access' 또는 'performance'이며, start/end는 날짜 파티션과
+        timestamp 행 그룹 통계로 걸러지므로 필요한 파일만 읽습니다. 행 하나는
+        count개의 호출을 대표하므로(샘플링/요약 레코드) 집계는 count로 가중합니다.
+        """
+        import pandas as pd
+        
+        root = self.log_dir / PARQUET_DIR / stream
+        if not root.exists():
+            return pd.DataFrame(columns=columns or PARQUET_SCHEMAS[stream])
+        
+        predicates = list(filters or [])
+        if start is not None:
+            predicates.append(('date', '>=', start.strftime('%Y-%m-%d')))
+            predicates.append(('timestamp', '>=', pd.Timestamp(start)))
+        if end is not None:
+            predicates.append(('date', '<=', end.strftime('%Y-%m-%d')))
+            predicates.append(('timestamp', '<', pd.Timestamp(end)))
+        
+        return pd.read_parquet(root, columns=columns, filters=predicates or None)
+    
+    def analyze_performance_history(self, days=7):
+        """컴팩션된 성능 로그로 장기간 성능 분석"""
+        df = self.query(
+            'performance',
+            columns=['operation'] + PARQUET_WEIGHT_COLUMNS['performance'],
+            start=datetime.now() - timedelta(days=days)
+        )
+        if df.empty:
+            return {}
+        
+        # 요약/샘플링 레코드까지 PerformanceStats.add와 같은 가중 집계
+        grouped = df.groupby('operation', observed=True).agg(
+            count=('count', 'sum'), total=('sum_ms', 'sum'), minimum=('min_ms', 'min'), maximum=('max_ms', 'max'))
+        return {
+            str(op): {
+                'count': int(row['count']),
+                'avg_ms': round(float(row['total']) / row['count'], 2),
+                'max_ms': float(row['maximum']),
+                'min_ms': float(row['minimum'])
+            }
+            for op, row in grouped.iterrows()
+            if row['count']
+        }
+
+
+class VectorizedLogAnalyzer(LogAnalyzer):
+    """pandas 벡터 연산 기반 로그 분석 도구
+    
+    라인 단위 dict/Counter 루프 대신 타임스탬프와 JSON 페이로드를 한 번에
+    DataFrame 컬럼으로 파싱하고 groupby로 집계합니다. 샘플링/요약 레코드는
+    행을 복제하지 않고 가중치·합계·최소/최대 컬럼으로 합치며, 분위수는
+    LatencySketch와 같은 로그 스케일 버킷을 벡터로 세어 요약 레코드의
+    히스토그램과 병합하므로 LogAnalyzer와 같은 값이 나옵니다.
+    """
+    
+    def _load_payloads(self, filename, hours):
+        """기간 내 라인의 JSON 페이로드를 DataFrame으로 일괄 파싱"""
+        import pandas as pd
+        
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        errors = []
+        raw_lines = []
+        for log_file in self._segments(filename, cutoff_time):
+            with _open_log(log_file) as f:
+                raw_lines.extend(f.read().splitlines())
+        lines = pd.Series(raw_lines, dtype='object')
         
-        with open(error_file, 'r', encoding='utf-8') as f:
-            for line in f:
+        # JSON lines 레코드(structured=True)는 라인 전체가 페이로드
+        is_json = lines.str.startswith('{')
+        frames = [
+            frame for frame in (
+                self._parse_text_lines(lines[~is_json], cutoff_time),
+                self._parse_json_lines(lines[is_json], cutoff_time)
+            ) if not frame.empty
+        ]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        
+        # 샘플링된 레코드는 sampled_count개의 호출을 대표 (없으면 1)
+        if 'sampled_count' in df:
+            df['sampled_count'] = pd.to_numeric(df['sampled_count'], errors='coerce').fillna(1).astype('int64')
+        else:
+            df['sampled_count'] = 1
+        return df
+    
+    @staticmethod
+    def _read_json_lines(payloads):
+        """JSON 문자열 Series를 DataFrame으로 일괄 파싱"""
+        import pandas as pd
+        
+        try:
+            return pd.read_json(io.StringIO('\n'.join(payloads)), lines=True, dtype=False, precise_float=True)
+        except ValueError:
+            # 깨진 라인이 섞여 있으면 라인별로 파싱하고 건너뜀
+            records = []
+            for payload in payloads:
                 try:
-                    # 타임스탬프 추출
-                    timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if timestamp_match:
-                        timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                        if timestamp >= cutoff_time:
-                            errors.append({
-                                'timestamp': timestamp,
-                                'line': line.strip()
-                            })
-                except Exception:
+                    records.append(_loads(payload))
+                except ValueError:
                     continue
+            return pd.DataFrame.from_records(records)
+    
+    def _parse_text_lines(self, lines, cutoff_time):
+        """'시각 | ... | {json}' 텍스트 라인 파싱"""
+        import pandas as pd
         
-        # 에러 유형별 분류
-        error_types = Counter()
-        for error in errors:
-            if 'Exception:' in error['line']:
-                exception_type = re.search(r'Exception: (\w+)', error['line'])
-                if exception_type:
-                    error_types[exception_type.group(1)] += 1
+        if lines.empty:
+            return pd.DataFrame()
+        timestamps = pd.to_datetime(lines.str.slice(0, 19), format=TIMESTAMP_FORMAT, errors='coerce')
+        payloads = lines[timestamps >= cutoff_time].str.extract(r'(\{.*\})', expand=False).dropna()
+        if payloads.empty:
+            return pd.DataFrame()
+        return self._read_json_lines(payloads)
+    
+    def _parse_json_lines(self, lines, cutoff_time):
+        """JSON lines 레코드 파싱 (ts 컬럼으로 기간 필터)"""
+        import pandas as pd
         
-        return {
-            'total_errors': len(errors),
-            'error_types': dict(error_types),
-            'recent_errors': errors[-10:] if errors else []
-        }
+        if lines.empty:
+            return pd.DataFrame()
+        df = self._read_json_lines(lines)
+        if 'ts' not in df:
+            return pd.DataFrame()
+        timestamps = pd.to_datetime(df['ts'].astype(str).str.slice(0, 19), format=TIMESTAMP_FORMAT, errors='coerce')
+        df = df[timestamps >= cutoff_time]
+        return df.drop(columns=[key for key in JSON_RECORD_KEYS if key in df])
     
     def analyze_performance(self, hours=24):
-        """성능 로그 분석"""
-        perf_file = self.log_dir / "performance.log"
+        """성능 로그 분석 (가중 groupby + 벡터화한 스케치 버킷)"""
+        import numpy as np
+        import pandas as pd
         
-        if not perf_file.exists():
+        if not self._has_stream(PerformanceStats.filename):
             return {"message": "Performance log file not found"}
         
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        operations = defaultdict(list)
+        df = self._load_payloads(PerformanceStats.filename, hours)
+        if df.empty:
+            return {}
         
-        with open(perf_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                try:
-                    # 타임스탬프 추출
-                    timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if timestamp_match:
-                        timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                        if timestamp >= cutoff_time:
-                            # JSON 데이터 추출
-                            json_match = re.search(r'\{.*\}', line)
-                            if json_match:
-                                data = json.loads(json_match.group())
-                                operation = data.get('operation', 'unknown')
-                                duration = data.get('duration_ms', 0)
-                                operations[operation].append(duration)
-                except Exception:
-                    continue
+        def numeric(column, default):
+            if column not in df:
+                return default
+            return pd.to_numeric(df[column], errors='coerce').fillna(default)
+        
+        operations = df.get('operation', pd.Series('unknown', index=df.index)).fillna('unknown')
+        durations = numeric('duration_ms', 0)
+        weights = df['sampled_count']
+        is_summary = df['type'].eq('summary') if 'type' in df else pd.Series(False, index=df.index)
+        
+        # 일반 레코드는 (가중치, 값*가중치, 값, 값), 요약 레코드는 (count, sum, min, max)
+        values = pd.DataFrame({
+            'count': weights.where(~is_summary, numeric('count', 1)),
+            'total': (durations * weights).where(~is_summary, numeric('sum_ms', durations)),
+            'minimum': durations.where(~is_summary, numeric('min_ms', durations)),
+            'maximum': durations.where(~is_summary, numeric('max_ms', durations))
+        })
+        summary = values.groupby(operations, sort=False).agg(
+            {'count': 'sum', 'total': 'sum', 'minimum': 'min', 'maximum': 'max'})
+        
+        # 일반 레코드의 값을 LatencySketch 버킷 번호로 바꿔 (작업, 버킷)별 가중치 합산
+        reference = LatencySketch()
+        plain = ~is_summary
+        positive = plain & (durations > 0)
+        bin_index = np.ceil(np.log(durations[positive]) / reference.log_gamma).astype('int64')
+        bins = defaultdict(list)
+        for (op, index), count in weights[positive].groupby([operations[positive], bin_index]).sum().items():
+            bins[op].append((int(index), int(count)))
+        zero_counts = weights[plain & (durations <= 0)].groupby(operations[plain & (durations <= 0)]).sum()
+        
+        sketches = {}
+        for op in summary.index:
+            sketches[op] = LatencySketch.from_state({
+                'relative_accuracy': reference.relative_accuracy,
+                'bins': bins.get(op, []),
+                'zero_count': int(zero_counts.get(op, 0))
+            })
+        if is_summary.any():
+            for op, histogram in zip(operations[is_summary], df.loc[is_summary, 'histogram']):
+                if isinstance(histogram, dict):
+                    sketches[op].merge(LatencySketch.from_state(histogram))
         
-        # 통계 계산
         stats = {}
-        for op, durations in operations.items():
+        for op, row in summary.iterrows():
             stats[op] = {
-                'count': len(durations),
-                'avg_ms': round(sum(durations) / len(durations), 2),
-                'max_ms': max(durations),
-                'min_ms': min(durations)
+                'count': int(row['count']),
+                'avg_ms': round(float(row['total']) / row['count'], 2),
+                'max_ms': float(row['maximum']),
+                'min_ms': float(row['minimum']),
+                'p50_ms': sketches[op].quantile(0.5),
+                'p95_ms': sketches[op].quantile(0.95),
+                'p99_ms': sketches[op].quantile(0.99)
             }
-        
         return stats
     
     def analyze_user_activity(self, hours=24):
-        """사용자 활동 분석"""
-        access_file = self.log_dir / "access.log"
+        """사용자 활동 분석 (nunique/value_counts)"""
+        import pandas as pd
         
-        if not access_file.exists():
+        if not self._has_stream(AccessStats.filename):
             return {"message": "Access log file not found"}
         
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        activities = []
+        df = self._load_payloads(AccessStats.filename, hours)
+        if df.empty:
+            return AccessStats().to_dict()
         
-        with open(access_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                try:
-                    timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if timestamp_match:
-                        timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                        if timestamp >= cutoff_time:
-                            json_match = re.search(r'\{.*\}', line)
-                            if json_match:
-                                data = json.loads(json_match.group())
-                                activities.append({
-                                    'timestamp': timestamp,
-                                    'user_id': data.get('user_id'),
-                                    'action': data.get('action'),
-                                    'session_id': data.get('session_id')
-                                })
-                except Exception:
-                    continue
+        weights = df['sampled_count']
+        df = df.reindex(columns=['user_id', 'session_id', 'action'])
+        top_actions = weights.groupby(df['action'], dropna=False, sort=False).sum() \
+            .sort_values(ascending=False, kind='stable').head(10)
         
-        # 분석
-        unique_users = len(set(a['user_id'] for a in activities))
-        unique_sessions = len(set(a['session_id'] for a in activities))
-        action_counts = Counter(a['action'] for a in activities)
+        return {
+            'total_activities': int(weights.sum()),
+            'unique_users': int(df['user_id'].nunique(dropna=False)),
+            'unique_sessions': int(df['session_id'].nunique(dropna=False)),
+            'top_actions': {
+                (None if pd.isna(action) else action): int(count)
+                for action, count in top_actions.items()
+            }
+        }
+
+
+class IncrementalLogAnalyzer(LogAnalyzer):
+    """체크포인트 기반 증분 로그 분석 도구
+    
+    파일별 (inode, 바이트 오프셋)을 기억하고 새로 추가된 라인만 분 단위
+    버킷에 누적합니다. minute_retention_hours보다 오래된 분 버킷은 시간
+    버킷으로 합쳐 상태 크기가 보관 기간에 비례해 커지지 않게 합니다.
+    집계 상태는 log_dir/.state의 상태 파일에 저장되며, 앱에서는 get_shared()로
+    프로세스당 한 인스턴스를 재사용해야 보고서마다 상태를 다시 읽지 않습니다.
+    """
+    
+    STREAMS = {
+        'errors': ErrorStats,
+        'performance': PerformanceStats,
+        'user_activity': AccessStats
+    }
+    
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, log_dir="/var/log/streamlit-app", state_file=None, retention_hours=24 * 7,
+                 minute_retention_hours=25):
+        super().__init__(log_dir)
+        self.state_file = Path(state_file) if state_file else self.log_dir / STATE_DIR / "analyzer_state.json"
+        self.retention_hours = retention_hours
+        self.minute_retention_hours = minute_retention_hours
+        self.checkpoints = {}
+        # 스트림별 {'YYYY-mm-dd HH:MM' 또는 'YYYY-mm-dd HH': 집계}
+        self.buckets = {stream: {} for stream in self.STREAMS}
+        self._lock = threading.Lock()
+        self._load_state()
+    
+    @classmethod
+    def get_shared(cls, log_dir="/var/log/streamlit-app", **kwargs):
+        """log_dir별로 프로세스에서 공유하는 인스턴스 (상태 파일은 처음 한 번만 로드)"""
+        key = (str(Path(log_dir).resolve()), tuple(sorted(kwargs.items())))
+        with cls._shared_lock:
+            analyzer = cls._shared.get(key)
+            if analyzer is None:
+                analyzer = cls._shared[key] = cls(log_dir, **kwargs)
+            return analyzer
+    
+    def _load_state(self):
+        """저장된 체크포인트와 버킷 로드"""
+        if not self.state_file.exists():
+            return
+        
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            
+            self.checkpoints = state.get('checkpoints', {})
+            for stream, stats_class in self.STREAMS.items():
+                self.buckets[stream] = {
+                    minute: stats_class.from_state(bucket)
+                    for minute, bucket in state.get('buckets', {}).get(stream, {}).items()
+                }
+        except Exception as e:
+            # 상태가 손상되면 처음부터 다시 집계
+            print(f"Error loading analyzer state {self.state_file}: {e}")
+            self.checkpoints = {}
+            self.buckets = {stream: {} for stream in self.STREAMS}
+    
+    def _save_state(self):
+        """체크포인트와 버킷을 원자적으로 저장"""
+        state = {
+            'checkpoints': self.checkpoints,
+            'buckets': {
+                stream: {minute: stats.to_state() for minute, stats in buckets.items()}
+                for stream, buckets in self.buckets.items()
+            }
+        }
+        
+        _write_json_atomic(self.state_file, state)
+    
+    def _read_from(self, path, offset, checkpoint=None):
+        """offset부터 완결된 라인을 하나씩 내보내고 읽은 끝의 체크포인트를 반환
+        
+        파일 전체를 메모리에 올리지 않는 제너레이터이며, 반환값(체크포인트)은
+        yield from으로 받습니다. 앞부분 해시는 열린 파일에서 계산하므로
+        (checkpoint에서 이어 읽고 길이가 같으면 재사용) 읽은 직후 세그먼트가
+        압축/삭제되어도 안전합니다. 읽은 끝이 0(빈 파일)이면 None을 반환합니다.
+        """
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rb') as f:
+            file_stat = os.fstat(f.fileno())
+            f.seek(offset)
+            end = offset
+            for raw_line in f:
+                # 마지막 개행 이후의 미완성 라인은 다음 실행에서 읽음
+                if not raw_line.endswith(b'\n'):
+                    break
+                end += len(raw_line)
+                yield raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+            
+            head_length = min(end, 4096)
+            if not head_length:
+                return None
+            if checkpoint is not None and checkpoint['head_length'] == head_length:
+                head = checkpoint['head']
+            else:
+                f.seek(0)
+                head = hashlib.sha1(f.read(head_length)).hexdigest()
         
         return {
-            'total_activities': len(activities),
-            'unique_users': unique_users,
-            'unique_sessions': unique_sessions,
-            'top_actions': dict(action_counts.most_common(10))
+            'inode': file_stat.st_ino,
+            'offset': end,
+            'mtime_ns': file_stat.st_mtime_ns,
+            'head_length': head_length,
+            'head': head
         }
     
+    def _read_new_lines(self, filename):
+        """마지막 체크포인트 이후의 새 라인을 파일(세그먼트)별로 읽어 내보내는 제너레이터
+        
+        첫 실행이나 여러 번 로테이션된 뒤에도 세그먼트를 하나씩 스트리밍하므로
+        메모리에는 현재 라인만 둡니다. 체크포인트는 끝까지 소비했을 때 갱신되며,
+        항상 마지막으로 읽은 비어 있지 않은 파일과 그 끝 offset을 가리킵니다.
+        현재 파일이 비어 있으면 직전 세그먼트(또는 이전 체크포인트)를 유지하므로,
+        압축이 끝나 지워진 세그먼트의 inode를 새 파일이 물려받아도 빈 파일을
+        같은 파일로 착각하지 않습니다.
+        """
+        path = self.log_dir / filename
+        if not path.exists():
+            return
+        
+        file_stat = path.stat()
+        checkpoint = self.checkpoints.get(filename)
+        resume = None  # 현재 파일을 이어 읽을 체크포인트
+        
+        if checkpoint and checkpoint['inode'] == file_stat.st_ino and file_stat.st_size >= checkpoint['offset'] \
+                and _is_checkpointed_file(path, checkpoint):
+            resume = checkpoint
+        else:
+            segments = _rotated_segments(self.log_dir, filename)
+            
+            if checkpoint is None:
+                # 첫 실행: 보관 기간 안의 로테이션 세그먼트부터 집계
+                retention_cutoff = (datetime.now() - timedelta(hours=self.retention_hours)).timestamp()
+                new_segments = [seg for seg in segments if seg.stat().st_mtime >= retention_cutoff]
+            else:
+                # 로테이션됨: 이전 파일의 남은 부분과 그 이후 세그먼트 전체를 먼저 읽음
+                index, new_segments = _segments_after(segments, checkpoint)
+                if index is not None:
+                    checkpoint = yield from self._read_from(segments[index], checkpoint['offset'], checkpoint)
+            
+            for segment in new_segments:
+                checkpoint = (yield from self._read_from(segment, 0)) or checkpoint
+        
+        checkpoint = (yield from self._read_from(path, resume['offset'] if resume else 0, resume)) or checkpoint
+        
+        if checkpoint is not None:
+            self.checkpoints[filename] = checkpoint
+    
+    def update(self):
+        """새 로그 라인을 분 단위 버킷에 반영하고 (바뀐 것이 있으면) 상태 저장"""
+        with self._lock:
+            self._update()
+    
+    def _update(self):
+        checkpoints_before = json.dumps(self.checkpoints, sort_keys=True)
+        changed = False
+        
+        for stream, stats_class in self.STREAMS.items():
+            buckets = self.buckets[stream]
+            
+            for name in _stream_files(self.log_dir, stats_class.filename):
+                # 파일마다 따로 끊어야 여러 줄 레코드가 파일 경계를 넘지 않음.
+                # 라인은 읽는 대로 파싱해 버킷에 넣음 (스트림 전체를 모으지 않음)
+                for line in _iter_records(stats_class, self._read_new_lines(name)):
+                    changed = True
+                    try:
+                        record = stats_class.parse(line)
+                        if record is None:
+                            continue
+                        minute = record[0].strftime(MINUTE_FORMAT)
+                        if minute not in buckets:
+                            buckets[minute] = stats_class()
+                        buckets[minute].add(*record)
+                    except Exception:
+                        continue
+        
+        # 삭제된 파일(종료된 워커의 프로세스별 파일 등) 중 로테이션 세그먼트도
+        # 남지 않은 파일의 체크포인트 정리
+        for name in [n for n in self.checkpoints if not (self.log_dir / n).exists()]:
+            if not _rotated_segments(self.log_dir, name):
+                del self.checkpoints[name]
+        
+        # 오래된 분 버킷은 시간 버킷으로 합치고, 보관 기간이 지난 버킷은 정리
+        now = datetime.now()
+        minute_cutoff = (now - timedelta(hours=self.minute_retention_hours)).strftime(MINUTE_FORMAT)
+        retention_cutoff = (now - timedelta(hours=self.retention_hours)).strftime(MINUTE_FORMAT)
+        for stream, buckets in self.buckets.items():
+            for key in [k for k in buckets if k < minute_cutoff]:
+                hour = key[:HOUR_KEY_LENGTH]
+                if key == hour and key >= retention_cutoff:
+                    continue  # 보관 기간 안의 시간 버킷
+                bucket = buckets.pop(key)
+                changed = True
+                if key >= retention_cutoff:
+                    if hour not in buckets:
+                        buckets[hour] = self.STREAMS[stream]()
+                    buckets[hour].merge(bucket)
+        
+        if changed or json.dumps(self.checkpoints, sort_keys=True) != checkpoints_before:
+            self._save_state()
+    
+    def _fold(self, stream, hours):
+        """기간 내 버킷을 하나의 집계로 병합 (시간 버킷은 시간 전체가 기간 안일 때만)"""
+        stats = self.STREAMS[stream]()
+        cutoff_minute = (datetime.now() - timedelta(hours=hours)).strftime(MINUTE_FORMAT)
+        for minute in sorted(self.buckets[stream]):
+            if minute >= cutoff_minute:
+                stats.merge(self.buckets[stream][minute])
+        return stats.to_dict()
+    
     def generate_report(self, hours=24):
-        """종합 보고서 생성"""
-        return {
+        """증분 종합 보고서 생성 (minute_retention_hours 이내는 분 단위 정밀도)"""
+        with self._lock:
+            self._update()
+            return {
+                'analysis_period': f"Last {hours} hours",
+                'timestamp': datetime.now().isoformat(),
+                'errors': self._fold('errors', hours),
+                'performance': self._fold('performance', hours),
+                'user_activity': self._fold('user_activity', hours)
+            }
+
+
+class ParallelLogAnalyzer(LogAnalyzer):
+    """프로세스 풀 기반 병렬 로그 분석 도구
+    
+    큰 로그 파일은 라인 경계에 맞춘 바이트 구간으로 나누고, 모든 파일의
+    구간을 하나의 프로세스 풀에서 분석한 뒤 집계를 병합합니다.
+    """
+    
+    STREAMS = IncrementalLogAnalyzer.STREAMS
+    
+    def __init__(self, log_dir="/var/log/streamlit-app", workers=None, chunk_size=64 * 1024 * 1024):
+        super().__init__(log_dir)
+        self.workers = workers
+        self.chunk_size = chunk_size
+    
+    def _tasks(self, stats_class, cutoff_time):
+        """스트림의 세그먼트들을 (stats_class, 경로, 시작, 끝) 작업으로 분할
+        
+        압축 세그먼트는 임의 위치 접근이 안 되므로 파일 하나가 작업 하나입니다.
+        """
+        tasks = []
+        for log_file in self._segments(stats_class.filename, cutoff_time):
+            if log_file.suffix == '.gz':
+                tasks.append((stats_class, str(log_file), 0, None))
+                continue
+            for start, end in _chunk_ranges(log_file, self.chunk_size, stats_class.multiline):
+                tasks.append((stats_class, str(log_file), start, end))
+        return tasks
+    
+    def _run(self, streams, hours):
+        """여러 스트림의 청크를 한 풀에서 분석하고 스트림별로 병합"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        results = {stream: self.STREAMS[stream]() for stream in streams}
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = []
+            for stream in streams:
+                for task in self._tasks(self.STREAMS[stream], cutoff_time):
+                    futures.append((stream, executor.submit(_analyze_chunk, *task, cutoff_time)))
+            
+            for stream, future in futures:
+                results[stream].merge(future.result())
+        
+        return results
+    
+    def _analyze_file(self, stats_class, hours):
+        """단일 파일을 청크 단위로 병렬 분석"""
+        stream = next(name for name, cls in self.STREAMS.items() if cls is stats_class)
+        return self._run([stream], hours)[stream]
+    
+    def generate_report(self, hours=24):
+        """세 분석기를 하나의 프로세스 풀에서 동시에 실행"""
+        messages = {
+            'errors': {"message": "Error log file not found"},
+            'performance': {"message": "Performance log file not found"},
+            'user_activity': {"message": "Access log file not found"}
+        }
+        streams = [
+            stream for stream, stats_class in self.STREAMS.items()
+            if self._has_stream(stats_class.filename)
+        ]
+        results = self._run(streams, hours)
+        
+        report = {
             'analysis_period': f"Last {hours} hours",
+            'timestamp': datetime.now().isoformat()
+        }
+        for stream in self.STREAMS:
+            report[stream] = results[stream].to_dict() if stream in results else messages[stream]
+        return report
+
+
+def _chunk_ranges(path, chunk_size, multiline=False):
+    """파일을 라인(여러 줄 레코드면 레코드) 경계에 맞춘 (시작, 끝) 바이트 구간으로 분할"""
+    size = path.stat().st_size
+    ranges = []
+    start = 0
+    
+    with open(path, 'rb') as f:
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                # 구간 끝을 다음 개행 직후로 이동
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+                # 트레이스백 중간에서 자르지 않도록 다음 레코드 시작까지 이동
+                while multiline:
+                    line = f.readline()
+                    if not line or RECORD_START.match(line):
+                        break
+                    end = f.tell()
+            ranges.append((start, end))
+            start = end
+    
+    return ranges
+
+
+def _analyze_chunk(stats_class, path, start, end, cutoff_time):
+    """워커 프로세스: 파일의 바이트 구간 하나(end가 None이면 파일 전체)를 집계"""
+    stats = stats_class()
+    
+    if end is None:
+        with _open_log(path) as f:
+            lines = f.read().splitlines()
+    else:
+        with open(path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        lines = data.decode('utf-8', errors='replace').splitlines()
+    
+    for line in _iter_records(stats_class, lines):
+        try:
+            record = stats.parse(line)
+            if record and record[0] >= cutoff_time:
+                stats.add(*record)
+        except Exception:
+            continue
+    
+    return stats
+
+
+class LogTailer:
+    """로그 실시간 추적 도구
+    
+    error/performance/access 로그를 로테이션을 따라가며 tail하고, 시간
+    슬롯 단위로 에러 수와 지연시간 스케치를 메모리에 유지합니다. 폴링
+    사이에 여러 번 로테이션되면 열어 둔 파일 이후의 세그먼트도 모두 읽습니다.
+    snapshot()은 슬롯만 병합하므로 파일을 다시 읽지 않습니다.
+    """
+    
+    STREAMS = IncrementalLogAnalyzer.STREAMS
+    
+    def __init__(self, log_dir="/var/log/streamlit-app", window_seconds=300, slot_seconds=10, poll_interval=1.0):
+        self.log_dir = Path(log_dir)
+        self.window_seconds = window_seconds
+        self.slot_seconds = slot_seconds
+        self.poll_interval = poll_interval
+        
+        # slot 시작 시각 -> {'errors', 'requests', 'latency'}
+        self.slots = {}
+        self._files = {}
+        self._started = False
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def _open(self, name, from_end):
+        """로그 파일을 열고 (파일, inode, 미완성 라인 버퍼) 저장"""
+        try:
+            f = open(self.log_dir / name, 'rb')
+        except FileNotFoundError:
+            self._files.pop(name, None)
+            return
+        
+        if from_end:
+            f.seek(0, os.SEEK_END)
+        self._files[name] = [f, os.fstat(f.fileno()).st_ino, b'']
+    
+    def _read_lines(self, name):
+        """열린 파일에서 새로 추가된 완결 라인 읽기"""
+        f, inode, pending = self._files[name]
+        data = pending + f.read()
+        end = data.rfind(b'\n') + 1
+        self._files[name][2] = data[end:]
+        return data[:end].decode('utf-8', errors='replace').splitlines()
+    
+    @staticmethod
+    def _handle_checkpoint(f):
+        """열어 둔 (로테이션된) 파일을 세그먼트 중에서 찾기 위한 체크포인트"""
+        file_stat = os.fstat(f.fileno())
+        head_length = min(file_stat.st_size, 4096)
+        return {
+            'mtime_ns': file_stat.st_mtime_ns,
+            'head_length': head_length,
+            'head': hashlib.sha1(os.pread(f.fileno(), head_length, 0)).hexdigest()
+        }
+    
+    def _rotated_since(self, name, f, current_inode):
+        """열어 둔 파일 f 이후에 로테이션된 세그먼트 (새로 연 현재 파일은 제외)"""
+        segments = _rotated_segments(self.log_dir, name)
+        _, newer = _segments_after(segments, self._handle_checkpoint(f))
+        for index, segment in enumerate(newer):
+            # 목록을 만드는 사이 현재 파일까지 로테이션됐으면 그 앞까지만 (현재 파일은 핸들로 읽음)
+            try:
+                if segment.stat().st_ino == current_inode:
+                    return newer[:index]
+            except FileNotFoundError:
+                continue
+        return newer
+    
+    @staticmethod
+    def _segment_lines(path):
+        """로테이션된 세그먼트 전체를 한 줄씩 읽기"""
+        try:
+            with _open_log(path) as f:
+                for line in f:
+                    yield line.rstrip('\n')
+        except FileNotFoundError:
+            # 압축이 끝나 .pending이 지워진 경우 등
+            return
+    
+    def poll(self):
+        """모든 스트림(프로세스별 파일 포함)의 새 라인을 슬롯에 반영"""
+        for stream, stats_class in self.STREAMS.items():
+            names = _stream_files(self.log_dir, stats_class.filename)
+            # 경로가 사라진 파일(종료된 워커의 파일 정리 등)의 핸들도 마지막으로 읽고 닫음
+            logger_name = _logger_name(stats_class.filename)
+            names += [name for name in self._files if name not in names and _logger_name(name) == logger_name]
+            
+            for name in names:
+                if name not in self._files:
+                    # 처음에는 파일 끝부터, 새로 생긴 파일(새 워커 포함)은 처음부터 읽음
+                    self._open(name, from_end=not self._started)
+                    if name not in self._files:
+                        continue
+                
+                lines = self._read_lines(name)
+                
+                # 로테이션 확인: 경로의 inode가 바뀌었거나 경로가 삭제되면 첫 read 이후
+                # 이전 파일에 쓰인 라인까지 읽고 닫음 (삭제된 파일의 fd를 들고 있지 않음)
+                try:
+                    inode = (self.log_dir / name).stat().st_ino
+                except FileNotFoundError:
+                    inode = None
+                if inode != self._files[name][1]:
+                    lines.extend(self._read_lines(name))
+                    self._ingest(stream, lines)
+                    lines = []
+                    
+                    f = self._files.pop(name)[0]
+                    # 새 파일을 먼저 열어 두고, 그 사이의 세그먼트(여러 번 로테이션된 경우)를 읽음.
+                    # 로테이션 중 잠시 경로가 없던 경우는 다음 poll에서 새 파일을 처음부터 읽음
+                    if inode is not None:
+                        self._open(name, from_end=False)
+                    current_inode = self._files[name][1] if name in self._files else None
+                    try:
+                        for segment in self._rotated_since(name, f, current_inode):
+                            self._ingest(stream, self._segment_lines(segment))
+                    finally:
+                        f.close()
+                    if name in self._files:
+                        lines = self._read_lines(name)
+                
+                self._ingest(stream, lines)
+        
+        self._started = True
+        self._expire()
+    
+    def _ingest(self, stream, lines):
+        """파싱한 레코드를 시간 슬롯에 누적"""
+        stats_class = self.STREAMS[stream]
+        with self._lock:
+            for line in _iter_records(stats_class, lines):
+                try:
+                    record = stats_class.parse(line)
+                except Exception:
+                    continue
+                if record is None:
+                    continue
+                
+                timestamp, data = record
+                slot_start = int(timestamp.timestamp()) // self.slot_seconds * self.slot_seconds
+                slot = self.slots.get(slot_start)
+                if slot is None:
+                    slot = self.slots[slot_start] = {
+                        'errors': 0,
+                        'requests': 0,
+                        'latency': defaultdict(LatencySketch)
+                    }
+                
+                if stream == 'errors':
+                    slot['errors'] += 1
+                elif stream == 'user_activity':
+                    slot['requests'] += data.get('sampled_count', 1)
+                elif data.get('type') == 'summary':
+                    slot['latency'][data.get('operation', 'unknown')].merge(
+                        LatencySketch.from_state(data['histogram']))
+                else:
+                    slot['latency'][data.get('operation', 'unknown')].add(
+                        data.get('duration_ms', 0), data.get('sampled_count', 1))
+    
+    def _expire(self):
+        """윈도우를 벗어난 슬롯 제거"""
+        window_start = time.time() - self.window_seconds
+        with self._lock:
+            for slot_start in [s for s in self.slots if s + self.slot_seconds <= window_start]:
+                del self.slots[slot_start]
+    
+    def snapshot(self):
+        """현재 윈도우의 에러율과 지연시간 분위수"""
+        window_start = time.time() - self.window_seconds
+        errors = 0
+        requests = 0
+        latency = defaultdict(LatencySketch)
+        
+        with self._lock:
+            for slot_start, slot in self.slots.items():
+                if slot_start + self.slot_seconds <= window_start:
+                    continue
+                errors += slot['errors']
+                requests += slot['requests']
+                for op, sketch in slot['latency'].items():
+                    latency[op].merge(sketch)
+        
+        return {
+            'window_seconds': self.window_seconds,
             'timestamp': datetime.now().isoformat(),
-            'errors': self.analyze_errors(hours),
-            'performance': self.analyze_performance(hours),
-            'user_activity': self.analyze_user_activity(hours)
+            'errors': errors,
+            'errors_per_minute': round(errors * 60 / self.window_seconds, 2),
+            'requests': requests,
+            'error_rate': round(errors / requests, 4) if requests else None,
+            'latency': {
+                op: {
+                    'count': sketch.count,
+                    'p50_ms': sketch.quantile(0.5),
+                    'p95_ms': sketch.quantile(0.95),
+                    'p99_ms': sketch.quantile(0.99)
+                }
+                for op, sketch in latency.items()
+            }
         }
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Error tailing logs: {e}")
+            self._stop_event.wait(self.poll_interval)
+    
+    def start(self):
+        """백그라운드 스레드에서 추적 시작 (기존 내용은 건너뜀)"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="log-tailer", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """추적 중지 및 파일 닫기"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for f, _, _ in self._files.values():
+            f.close()
+        self._files.clear()
 
 
 class LogManager:
@@ -151,22 +1517,37 @@ class LogManager:
     
     def __init__(self, log_dir="/var/log/streamlit-app"):
         self.log_dir = Path(log_dir)
+        self.usage_cache_file = self.log_dir / STATE_DIR / "usage_cache.json"
+        self._usage = None
+        # 앱에서는 cache_resource로 여러 세션이 한 인스턴스를 공유하므로 사용량 상태 갱신을 직렬화
+        self._usage_lock = threading.Lock()
     
-    def cleanup_old_logs(self, days=30):
-        """오래된 로그 파일 정리"""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        cleaned_files = []
+    def cleanup_old_logs(self, days=30, workers=8):
+        """오래된 로그 파일 정리 (스레드 풀에서 병렬 삭제)"""
+        cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
         
-        for log_file in self.log_dir.glob("*.log.*"):  # 로테이션된 파일들
+        # scandir는 디렉토리 항목과 stat을 한 번에 가져옴
+        expired = []
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, "*.log.*"):  # 로테이션된 파일들
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_timestamp:
+                        expired.append(entry.path)
+                except OSError as e:
+                    print(f"Error cleaning {entry.path}: {e}")
+        
+        def remove(path):
             try:
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if file_mtime < cutoff_date:
-                    log_file.unlink()
-                    cleaned_files.append(str(log_file))
+                os.unlink(path)
+                return path
             except Exception as e:
-                print(f"Error cleaning {log_file}: {e}")
+                print(f"Error cleaning {path}: {e}")
+                return None
         
-        return cleaned_files
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [path for path in executor.map(remove, expired) if path is not None]
     
     def get_log_sizes(self):
         """로그 파일 크기 정보"""
@@ -180,26 +1561,357 @@ class LogManager:
         
         return sizes
     
-    def backup_logs(self, backup_dir="/backup/streamlit-logs"):
-        """로그 백업"""
-        import shutil
+    def get_usage_report(self, max_age_seconds=10, history_hours=24):
+        """로그 디렉토리 사용량 보고서 (로테이션/압축 세그먼트 포함)
+        
+        파일별 (크기, mtime)을 .state/usage_cache.json에 캐시하고, 디렉토리 mtime이
+        그대로면 목록을 다시 읽지 않고 알려진 파일만 stat합니다. 갱신할 때마다
+        로거별 합계를 기록해 증가율(bytes/hour)과 디스크 고갈 예상 시간을
+        계산합니다.
+        """
+        with self._usage_lock:
+            usage = self._load_usage()
+            now = time.time()
+            
+            if now - usage['refreshed_at'] >= max_age_seconds:
+                self._refresh_usage(usage)
+                usage['refreshed_at'] = now
+                
+                totals = self._logger_totals(usage['files'])
+                usage['history'].append([now, totals])
+                history_cutoff = now - history_hours * 3600
+                usage['history'] = [sample for sample in usage['history'] if sample[0] >= history_cutoff]
+                self._save_usage(usage)
+            
+            return self._build_usage_report(usage)
+    
+    def _load_usage(self):
+        """메모리 또는 캐시 파일에서 사용량 상태 로드"""
+        if self._usage is None:
+            self._usage = {'dir_mtime_ns': None, 'refreshed_at': 0, 'files': {}, 'history': []}
+            if self.usage_cache_file.exists():
+                try:
+                    with open(self.usage_cache_file, 'r', encoding='utf-8') as f:
+                        self._usage.update(json.load(f))
+                except Exception as e:
+                    print(f"Error loading usage cache {self.usage_cache_file}: {e}")
+        return self._usage
+    
+    def _save_usage(self, usage):
+        _write_json_atomic(self.usage_cache_file, usage)
+    
+    def _refresh_usage(self, usage):
+        """stat 변경분만 반영해 파일별 (크기, mtime) 갱신"""
+        dir_mtime_ns = self.log_dir.stat().st_mtime_ns
+        
+        if dir_mtime_ns != usage['dir_mtime_ns']:
+            # 파일이 생기거나 지워졌을 때만 디렉토리 목록을 읽음
+            files = {}
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if fnmatch.fnmatch(entry.name, "*.log*") and entry.is_file():
+                        file_stat = entry.stat()
+                        files[entry.name] = [file_stat.st_size, file_stat.st_mtime_ns]
+            usage['files'] = files
+            usage['dir_mtime_ns'] = dir_mtime_ns
+            return
+        
+        for name, cached in list(usage['files'].items()):
+            try:
+                file_stat = os.stat(self.log_dir / name)
+                cached[0], cached[1] = file_stat.st_size, file_stat.st_mtime_ns
+            except FileNotFoundError:
+                del usage['files'][name]
+    
+    @staticmethod
+    def _logger_totals(files):
+        """로거별 (현재 파일, 로테이션 세그먼트) 바이트 합계 (프로세스별 파일은 같은 로거로 합산)"""
+        totals = {}
+        for name, (size, _) in files.items():
+            suffix = name.partition('.log')[2]
+            sizes = totals.setdefault(_logger_name(name), [0, 0])
+            sizes[1 if suffix else 0] += size
+        return totals
+    
+    def _build_usage_report(self, usage):
+        """캐시된 상태로 보고서 생성"""
+        history = usage['history']
+        first_time, first_totals = history[0] if history else (0, {})
+        last_time, last_totals = history[-1] if history else (0, {})
+        elapsed_hours = (last_time - first_time) / 3600
+        
+        loggers = {}
+        segment_counts = Counter(_logger_name(name) for name in usage['files'])
+        for logger_name, (live, rotated) in sorted(last_totals.items()):
+            growth = None
+            if elapsed_hours > 0:
+                previous = sum(first_totals.get(logger_name, [0, 0]))
+                growth = round((live + rotated - previous) / elapsed_hours)
+            loggers[logger_name] = {
+                'files': segment_counts[logger_name],
+                'live_mb': round(live / (1024 * 1024), 2),
+                'rotated_mb': round(rotated / (1024 * 1024), 2),
+                'total_mb': round((live + rotated) / (1024 * 1024), 2),
+                'growth_bytes_per_hour': growth
+            }
+        
+        total_bytes = sum(live + rotated for live, rotated in last_totals.values())
+        growth_total = None
+        if elapsed_hours > 0:
+            growth_total = round((total_bytes - sum(map(sum, first_totals.values()))) / elapsed_hours)
+        
+        disk = shutil.disk_usage(self.log_dir)
+        hours_until_full = None
+        if growth_total and growth_total > 0:
+            hours_until_full = round(disk.free / growth_total, 1)
+        
+        return {
+            'total_mb': round(total_bytes / (1024 * 1024), 2),
+            'loggers': loggers,
+            'growth_bytes_per_hour': growth_total,
+            'disk_free_gb': round(disk.free / (1024 ** 3), 2),
+            'hours_until_full': hours_until_full,
+            'measured_hours': round(elapsed_hours, 2),
+            'refreshed_at': datetime.fromtimestamp(usage['refreshed_at']).isoformat()
+        }
+    
+    def compact_rotated_logs(self):
+        """로테이션이 끝난 access/performance 세그먼트를 날짜별 Parquet으로 변환
+        
+        세그먼트는 내용 앞부분의 해시로 식별하므로 로테이션으로 이름이
+        바뀌거나 .gz로 압축되어도 다시 변환하지 않습니다.
+        """
+        parquet_root = self.log_dir / PARQUET_DIR
+        parquet_root.mkdir(exist_ok=True)
+        manifest_file = parquet_root / "_manifest.json"
+        
+        manifest = {}
+        if manifest_file.exists():
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        self._upgrade_parquet(parquet_root, manifest)
+        
+        compacted_files = []
+        for stream, stats_class in (('access', AccessStats), ('performance', PerformanceStats)):
+            segments = [
+                segment for name in _stream_files(self.log_dir, stats_class.filename)
+                for segment in _rotated_segments(self.log_dir, name)
+            ]
+            for segment in segments:
+                try:
+                    # 로테이션 이름 변경과 압축 후에도 같은 값이 되도록 내용 앞부분으로 식별
+                    with _open_log(segment) as f:
+                        head = f.read(64 * 1024)
+                    segment_id = hashlib.sha1(head.encode('utf-8')).hexdigest()[:16]
+                    if segment_id in manifest:
+                        continue
+                    
+                    df = self._segment_to_frame(segment, stream, stats_class)
+                    for date, group in df.groupby(df['timestamp'].dt.strftime('%Y-%m-%d')):
+                        partition = parquet_root / stream / f"date={date}"
+                        partition.mkdir(parents=True, exist_ok=True)
+                        group.to_parquet(partition / f"{segment_id}.parquet", index=False)
+                    
+                    manifest[segment_id] = {'stream': stream, 'segment': segment.name, 'rows': len(df),
+                                            'schema': PARQUET_SCHEMA_VERSION}
+                    compacted_files.append(str(segment))
+                except Exception as e:
+                    print(f"Error compacting {segment}: {e}")
+        
+        _write_json_atomic(manifest_file, manifest)
+        
+        return compacted_files
+    
+    def _segment_to_frame(self, segment, stream, stats_class):
+        """세그먼트 하나를 타입이 지정된 DataFrame으로 변환"""
+        import pandas as pd
+        
+        columns = PARQUET_SCHEMAS[stream]
+        weight_columns = PARQUET_WEIGHT_COLUMNS[stream]
+        value_columns = columns[1:-1 - len(weight_columns)]
+        rows = []
+        
+        with _open_log(segment) as f:
+            for line in f:
+                try:
+                    record = stats_class.parse(line)
+                except Exception:
+                    continue
+                if record is None:
+                    continue
+                
+                timestamp, data = record
+                data.pop('timestamp', None)
+                values = [data.pop(column, None) for column in value_columns]
+                duration = values[value_columns.index('duration_ms')] if stream == 'performance' else None
+                row = [timestamp] + values + _weight_values(stream, data, duration)
+                row.append(json.dumps(data, ensure_ascii=False) if data else None)
+                rows.append(row)
+        
+        return self._typed_frame(pd.DataFrame(rows, columns=columns), stream)
+    
+    @staticmethod
+    def _typed_frame(df, stream):
+        """Parquet 스키마 타입 지정"""
+        import pandas as pd
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df['count'] = pd.to_numeric(df['count'], errors='coerce').fillna(1).astype('int64')
+        if stream == 'access':
+            return df.astype({'user_id': 'string', 'session_id': 'string', 'action': 'category',
+                              'page': 'string', 'extra': 'string'})
+        for column in ('duration_ms', 'sum_ms', 'min_ms', 'max_ms'):
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+        return df.astype({'operation': 'category', 'status': 'category', 'extra': 'string'})
+    
+    def _upgrade_parquet(self, parquet_root, manifest):
+        """가중치 컬럼이 없던 이전 스키마의 Parquet 파일에 컬럼 추가 (원본 세그먼트 없이 extra에서 복원)
+        
+        한 데이터셋 안에 스키마가 다른 파일이 섞이면 query가 새 컬럼을 읽지
+        못하므로 변환 전에 한 번 업그레이드합니다.
+        """
+        import pandas as pd
+        
+        for segment_id, entry in manifest.items():
+            if entry.get('schema', 1) >= PARQUET_SCHEMA_VERSION:
+                continue
+            stream = entry['stream']
+            try:
+                for path in (parquet_root / stream).glob(f"date=*/{segment_id}.parquet"):
+                    df = pd.read_parquet(path)
+                    extras = [json.loads(extra) if isinstance(extra, str) else {} for extra in df['extra']]
+                    durations = df['duration_ms'].tolist() if stream == 'performance' else [None] * len(df)
+                    weights = [_weight_values(stream, extra, duration) for extra, duration in zip(extras, durations)]
+                    df[PARQUET_WEIGHT_COLUMNS[stream]] = pd.DataFrame(weights, index=df.index)
+                    df = self._typed_frame(df[PARQUET_SCHEMAS[stream]], stream)
+                    
+                    # '.'으로 시작하는 이름은 데이터셋 읽기에서 제외됨
+                    tmp_file = path.with_name(f".{path.name}.tmp")
+                    df.to_parquet(tmp_file, index=False)
+                    os.replace(tmp_file, path)
+                entry['schema'] = PARQUET_SCHEMA_VERSION
+            except Exception as e:
+                print(f"Error upgrading parquet files of {segment_id}: {e}")
+    
+    def backup_logs(self, backup_dir="/backup/streamlit-logs", compression="gzip", workers=4):
+        """로그 백업 (병렬 스트림 압축 + 변경 없는 파일 재사용)
+        
+        backup_dir의 manifest.json에 파일별 크기/mtime/sha256과 마지막 백업
+        위치를 기록합니다. 크기와 mtime이 같거나 해시가 같으면 다시 압축하지
+        않고 이전 백업 파일을 하드링크(안 되면 복사)하므로, 각 backup_<시각>
+        디렉토리만으로 모든 로그를 복원할 수 있습니다. compression은 'gzip'
+        또는 'zstd'(zstandard 패키지 필요, 없으면 gzip 사용)입니다.
+        """
+        if compression not in ('gzip', 'zstd'):
+            raise ValueError(f"Unsupported backup compression: {compression}")
+        if compression == 'zstd':
+            try:
+                import zstandard  # 설치 여부만 한 번 확인 (파일마다 실패하지 않도록)
+            except ImportError:
+                print("zstandard is not installed, backing up with gzip instead")
+                compression = 'gzip'
         
         backup_path = Path(backup_dir)
         backup_path.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_subdir = backup_path / f"backup_{timestamp}"
-        backup_subdir.mkdir()
+        # 같은 초에 다시 백업하면 번호를 붙임 (스냅샷마다 별도 디렉토리)
+        sequence = 0
+        while True:
+            try:
+                backup_subdir.mkdir()
+                break
+            except FileExistsError:
+                sequence += 1
+                backup_subdir = backup_path / f"backup_{timestamp}_{sequence}"
         
-        backed_up_files = []
-        for log_file in self.log_dir.glob("*.log"):
+        manifest_file = backup_path / "manifest.json"
+        manifest = {}
+        if manifest_file.exists():
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        
+        def backup(log_file):
             try:
-                shutil.copy2(log_file, backup_subdir)
-                backed_up_files.append(str(log_file))
+                entry, copied = self._backup_file(log_file, backup_path, backup_subdir,
+                                                  manifest.get(log_file.name), compression)
+                return log_file, entry, copied
             except Exception as e:
                 print(f"Error backing up {log_file}: {e}")
+                return log_file, None, False
+        
+        backed_up_files = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for log_file, entry, copied in executor.map(backup, list(self.log_dir.glob("*.log"))):
+                if entry is None:
+                    continue
+                manifest[log_file.name] = entry
+                if copied:
+                    backed_up_files.append(str(log_file))
+        
+        _write_json_atomic(manifest_file, manifest, indent=2)
         
         return str(backup_subdir), backed_up_files
+    
+    def _backup_file(self, log_file, backup_path, backup_subdir, previous, compression):
+        """파일 하나를 백업하고 (manifest 항목, 새로 압축했는지) 반환"""
+        file_stat = log_file.stat()
+        entry = {'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns}
+        
+        unchanged = False
+        if previous and previous['size'] == file_stat.st_size:
+            if previous['mtime_ns'] == file_stat.st_mtime_ns:
+                unchanged = True
+            else:
+                # mtime만 바뀐 경우 내용 해시로 확인
+                unchanged = _file_sha256(log_file) == previous['sha256']
+        
+        previous_backup = backup_path / previous['backup_file'] if unchanged else None
+        if previous_backup is not None and previous_backup.exists():
+            target = backup_subdir / previous_backup.name
+            try:
+                os.link(previous_backup, target)
+            except OSError:
+                # 하드링크를 지원하지 않는 파일시스템
+                shutil.copy2(previous_backup, target)
+            entry.update(sha256=previous['sha256'], backup_file=str(target.relative_to(backup_path)))
+            return entry, False
+        
+        suffix = '.zst' if compression == 'zstd' else '.gz'
+        target = backup_subdir / (log_file.name + suffix)
+        entry['sha256'] = _compress_file(log_file, target, compression)
+        entry['backup_file'] = str(target.relative_to(backup_path))
+        return entry, True
+
+
+def _file_sha256(path, block_size=1024 * 1024):
+    """파일 내용의 sha256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _compress_file(source, target, compression="gzip", block_size=1024 * 1024):
+    """파일을 블록 단위로 스트림 압축하고 원본 sha256 반환"""
+    digest = hashlib.sha256()
+    
+    if compression == 'zstd':
+        import zstandard
+        with open(source, 'rb') as fin, open(target, 'wb') as raw:
+            with zstandard.ZstdCompressor(level=3).stream_writer(raw) as fout:
+                while block := fin.read(block_size):
+                    digest.update(block)
+                    fout.write(block)
+    else:
+        with open(source, 'rb') as fin, gzip.open(target, 'wb', compresslevel=6) as fout:
+            while block := fin.read(block_size):
+                digest.update(block)
+                fout.write(block)
+    
+    return digest.hexdigest()
 
 
 # === 실행 스크립트 ===
@@ -212,12 +1924,40 @@ def main():
     parser.add_argument('--analyze', action='store_true', help='Analyze logs')
     parser.add_argument('--cleanup', type=int, default=30, help='Cleanup logs older than N days')
     parser.add_argument('--backup', action='store_true', help='Backup current logs')
+    parser.add_argument('--compact', action='store_true', help='Convert rotated access/performance logs to Parquet')
+    parser.add_argument('--backup-dir', default='/backup/streamlit-logs', help='Backup directory path')
+    parser.add_argument('--compression', choices=['gzip', 'zstd'], default='gzip', help='Backup compression')
     parser.add_argument('--hours', type=int, default=24, help='Analysis period in hours')
     parser.add_argument('--log-dir', default='/var/log/streamlit-app', help='Log directory path')
+    parser.add_argument('--incremental', action='store_true', help='Analyze only new lines since the last checkpoint')
+    parser.add_argument('--parallel', action='store_true', help='Analyze log files in a process pool')
+    parser.add_argument('--vectorized', action='store_true', help='Analyze logs with pandas groupby aggregation')
+    parser.add_argument('--tail', action='store_true', help='Follow logs and print rolling window metrics')
+    parser.add_argument('--window', type=int, default=300, help='Rolling window in seconds for --tail')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes for --parallel')
     
     args = parser.parse_args()
     
-    analyzer = LogAnalyzer(args.log_dir)
+    if args.tail:
+        print(f"=== Tailing logs in {args.log_dir} (Ctrl+C to stop) ===")
+        tailer = LogTailer(args.log_dir, window_seconds=args.window)
+        tailer.start()
+        try:
+            while True:
+                time.sleep(5)
+                print(json.dumps(tailer.snapshot(), indent=2, ensure_ascii=False))
+        except KeyboardInterrupt:
+            tailer.stop()
+        return
+    
+    if args.incremental:
+        analyzer = IncrementalLogAnalyzer(args.log_dir)
+    elif args.parallel:
+        analyzer = ParallelLogAnalyzer(args.log_dir, workers=args.workers)
+    elif args.vectorized:
+        analyzer = VectorizedLogAnalyzer(args.log_dir)
+    else:
+        analyzer = LogAnalyzer(args.log_dir)
     manager = LogManager(args.log_dir)
     
     if args.analyze:
@@ -232,17 +1972,25 @@ def main():
         for file in cleaned:
             print(f"  - {file}")
     
+    if args.compact:
+        print("=== Compacting rotated logs to Parquet ===")
+        compacted = manager.compact_rotated_logs()
+        print(f"Compacted {len(compacted)} segments")
+    
     if args.backup:
         print("=== Backing up logs ===")
-        backup_dir, backed_up = manager.backup_logs()
+        backup_dir, backed_up = manager.backup_logs(args.backup_dir, compression=args.compression)
         print(f"Backup created: {backup_dir}")
         print(f"Backed up {len(backed_up)} files")
     
-    # 로그 파일 크기 정보
-    print("=== Log File Sizes ===")
-    sizes = manager.get_log_sizes()
-    for filename, size_mb in sizes.items():
-        print(f"{filename}: {size_mb} MB")
+    # 로그 디렉토리 사용량 정보
+    print("=== Log Directory Usage ===")
+    usage = manager.get_usage_report()
+    for logger_name, info in usage['loggers'].items():
+        print(f"{logger_name}: {info['total_mb']} MB ({info['files']} files, "
+              f"{info['growth_bytes_per_hour']} bytes/hour)")
+    print(f"Total: {usage['total_mb']} MB | Disk free: {usage['disk_free_gb']} GB | "
+          f"Hours until full: {usage['hours_until_full']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+# logging_benchmarks.py
+# 로깅/로그 분석 성능 측정 스크립트
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+def _timeit(func, repeat=3):
+    """가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# === 로그 분석 백엔드 비교 ===
+
+def _summary_record(operation, timestamp, rng, calls=100):
+    """log_execution_time(aggregate=True)가 기록하는 구간 요약 레코드"""
+    from logging_config import OperationHistogram
+
+    histogram = OperationHistogram()
+    for _ in range(calls):
+        histogram.add(int(rng.expovariate(1 / 50) * 1e6))
+    summary = histogram.summary()
+    return {
+        'operation': operation,
+        'type': 'summary',
+        'duration_ms': summary.pop('avg_ms'),
+        'timestamp': timestamp,
+        'status': 'success',
+        **summary,
+        'interval_seconds': 60,
+        'histogram': histogram.to_state()
+    }
+
+
+def _write_synthetic_logs(log_dir, lines):
+    """access/performance 로그를 StreamlitLogger 형식으로 생성"""
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    operations = [f"operation_{i}" for i in range(20)]
+    actions = [f"action_{i}" for i in range(50)]
+    rng = random.Random(0)
+
+    with open(log_dir / "performance.log", 'w', encoding='utf-8') as f:
+        for index in range(lines):
+            perf_info = {
+                'operation': rng.choice(operations),
+                'duration_ms': round(rng.expovariate(1 / 50), 2),
+                'timestamp': timestamp,
+                'status': 'success'
+            }
+            # 기본 설정처럼 샘플링 레코드와 구간 요약 레코드도 섞음
+            if index % 10 == 0:
+                perf_info['sampled_count'] = 10
+            f.write(f"{timestamp} | PERF | {json.dumps(perf_info)}\n")
+            if index % 1000 == 0:
+                f.write(f"{timestamp} | PERF | {json.dumps(_summary_record(rng.choice(operations), timestamp, rng))}\n")
+
+    with open(log_dir / "access.log", 'w', encoding='utf-8') as f:
+        for _ in range(lines):
+            access_info = {
+                'user_id': f"user_{rng.randrange(1000)}",
+                'session_id': f"session_{rng.randrange(5000)}",
+                'action': rng.choice(actions),
+                'page': 'main'
+            }
+            f.write(f"{timestamp} | ACCESS | {json.dumps(access_info)}\n")
+
+
+def benchmark_analyzer_backends(lines=1_000_000):
+    """LogAnalyzer 루프 경로와 VectorizedLogAnalyzer 비교"""
+    from log_analyzer import LogAnalyzer, VectorizedLogAnalyzer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        _write_synthetic_logs(log_dir, lines)
+
+        print(f"=== Analyzer backends ({lines:,} lines per file) ===")
+        for name, analyzer in (('loop', LogAnalyzer(log_dir)), ('vectorized', VectorizedLogAnalyzer(log_dir))):
+            perf_time = _timeit(lambda: analyzer.analyze_performance(), repeat=1)
+            access_time = _timeit(lambda: analyzer.analyze_user_activity(), repeat=1)
+            print(f"{name:>12}: performance {perf_time:.2f}s | user_activity {access_time:.2f}s")
+
+
+# === StreamlitLogger 호출 비용 ===
+
+def benchmark_disabled_levels(iterations=200_000):
+    """비활성 레벨(debug) 호출 비용: 지연 포맷팅 vs 즉시 포맷팅"""
+    from logging_config import StreamlitLogger
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = StreamlitLogger(log_dir=tmp, app_name="bench", debug_enabled=False)
+        debug_logger = logger.loggers['debug']
+        payload = {'rows': 1000, 'columns': ['a', 'b', 'c'], 'user_id': 'anonymous'}
+
+        def noop(message, **kwargs):
+            pass
+
+        def eager():
+            # 이전 구현: 레벨과 관계없이 f-string과 k=v 포맷팅을 먼저 수행
+            debug_logger.debug(f"processing {logger._format_extra_info(**payload)}")
+
+        def baseline():
+            for _ in range(iterations):
+                noop("processing", **payload)
+
+        def lazy_disabled():
+            for _ in range(iterations):
+                logger.debug("processing", **payload)
+
+        def eager_disabled():
+            for _ in range(iterations):
+                eager()
+
+        print(f"=== Disabled debug() cost ({iterations:,} calls) ===")
+        results = {name: _timeit(func) for name, func in
+                   (('empty call', baseline), ('lazy', lazy_disabled), ('eager', eager_disabled))}
+        base = results['empty call']
+        for name, elapsed in results.items():
+            print(f"{name:>12}: {elapsed / iterations * 1e9:8.1f} ns/call "
+                  f"(+{(elapsed - base) / iterations * 1e9:.1f} ns over empty call)")
+
+
+def benchmark_buffered_writes(iterations=100_000):
+    """access_log 쓰기: 레코드별 write vs 버퍼링 일괄 write"""
+    from logging_config import StreamlitLogger
+
+    print(f"=== access_log writes ({iterations:,} calls) ===")
+    for name, buffered_streams in (('unbuffered', ()), ('buffered', ('access',))):
+        with tempfile.TemporaryDirectory() as tmp:
+            logger = StreamlitLogger(log_dir=tmp, app_name=f"bench_{name}", buffered_streams=buffered_streams)
+            handler = logger.loggers['access'].handlers[0]
+
+            def run():
+                for i in range(iterations):
+                    logger.access_log(f"user_{i % 100}", f"session_{i % 500}", 'page_view', page='main')
+                handler.flush()
+
+            elapsed = _timeit(run, repeat=1)
+            writes = getattr(handler, 'writes', iterations)
+            print(f"{name:>12}: {elapsed:.2f}s | {iterations / elapsed:,.0f} records/s | {writes:,} writes")
+            handler.close()
+
+
+def benchmark_config_lookup(iterations=200_000):
+    """설정 조회: 점 표기법 get() vs 컴파일된 settings 속성 접근"""
+    import contextlib
+    import io
+    from logging_config_with_yaml import ConfigManager
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        load_time = _timeit(lambda: ConfigManager("logging_config.yaml"), repeat=5)
+        config_manager = ConfigManager("logging_config.yaml")
+
+    def dotted():
+        for _ in range(iterations):
+            config_manager.get('monitoring.performance_threshold_ms', 5000)
+
+    def attribute():
+        settings = config_manager.settings
+        for _ in range(iterations):
+            settings.monitoring.performance_threshold_ms
+
+    print(f"=== Config lookups ({iterations:,} calls) ===")
+    print(f"{'load':>12}: {load_time * 1e3:.2f} ms (YAML 파싱 + 검증/컴파일)")
+    for name, func in (('get()', dotted), ('settings', attribute)):
+        print(f"{name:>12}: {_timeit(func) / iterations * 1e9:8.1f} ns/call")
+
+
+def benchmark_masking(iterations=200_000):
+    """민감 정보 마스킹이 레코드당 추가하는 비용 (목표: 일반적인 경우 1µs 미만)"""
+    import yaml
+    from logging_config_with_yaml import SensitiveDataMasker
+
+    with open("logging_config.yaml", encoding='utf-8') as f:
+        sensitive_fields = yaml.safe_load(f)['security']['sensitive_fields']
+    masker = SensitiveDataMasker(sensitive_fields)
+
+    records = {
+        'flat (common)': {'user_id': 'user_1', 'session_id': 'session_1', 'action': 'page_view', 'page': 'main'},
+        'nested': {'user_id': 'user_1', 'action': 'upload', 'meta': {'rows': 1000, 'columns': ['a', 'b']}},
+        'sensitive': {'user_id': 'user_1', 'action': 'login', 'password': 'hunter2', 'auth': {'api_key': 'k'}},
+    }
+
+    def identity(record):
+        return record
+
+    print(f"=== Sensitive-field masking ({iterations:,} records) ===")
+    for name, record in records.items():
+        masker.mask(record)  # 키 판정 캐시 예열
+
+        def baseline():
+            for _ in range(iterations):
+                identity(record)
+
+        def masked():
+            for _ in range(iterations):
+                masker.mask(record)
+
+        overhead = (_timeit(masked) - _timeit(baseline)) / iterations * 1e9
+        print(f"{name:>14}: +{overhead:7.1f} ns/record")
+
+
+def benchmark_import_time(repeat=5):
+    """새 인터프리터에서 모듈 import 시간과 함께 불러오는 무거운 모듈"""
+    heavy = ('streamlit', 'psutil', 'pandas')
+    probe = (
+        "import sys, time; start = time.perf_counter(); import {module}; "
+        "elapsed = time.perf_counter() - start; "
+        f"print(elapsed, ','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+
+    print(f"=== Import time (best of {repeat}, fresh interpreter) ===")
+    for module in ('logging_config', 'log_analyzer'):
+        best, loaded = float('inf'), ''
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, '-c', probe.format(module=module)],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            best = min(best, float(output[0]))
+            loaded = output[1] if len(output) > 1 else '-'
+        print(f"{module:>15}: {best * 1e3:7.1f} ms | heavy modules loaded: {loaded}")
+
+
+BENCHMARKS = {
+    'analyzer': benchmark_analyzer_backends,
+    'disabled_levels': benchmark_disabled_levels,
+    'buffered_writes': benchmark_buffered_writes,
+    'config_lookup': benchmark_config_lookup,
+    'masking': benchmark_masking,
+    'import_time': benchmark_import_time,
+}
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='Logging benchmarks')
+    parser.add_argument('names', nargs='*', help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument('--lines', type=int, default=1_000_000, help='Log lines per file for the analyzer benchmark')
+
+    args = parser.parse_args()
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    for name in args.names or BENCHMARKS:
+        if name == 'analyzer':
+            BENCHMARKS[name](args.lines)
+        else:
+            BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
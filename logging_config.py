@@ -3,27 +3,804 @@ import logging
 import logging.handlers
 import os
 import json
+import gzip
+import math
+import queue
+import shutil
+import threading
+import atexit
+import contextvars
+import inspect
+import random
+import sys
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
-import streamlit as st
+from collections import deque
 import time
 import traceback
-import psutil
+import weakref
+# streamlit/psutil은 사용하는 함수 안에서 import: 로거만 쓰는 스크립트와
+# log_analyzer CLI가 import할 때 불러오지 않도록 함
+
+try:
+    import orjson  # 선택 의존성: 있으면 JSON 직렬화에 사용
+except ImportError:
+    orjson = None
+
+
+class SegmentCompressor:
+    """로테이션된 로그 세그먼트를 백그라운드 스레드에서 gzip 압축"""
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def submit(self, source, dest, before=None):
+        """source를 dest(.gz)로 압축하도록 예약 (before는 압축 직전 이 스레드에서 호출)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-compressor", daemon=True)
+                self._thread.start()
+                atexit.register(self.wait)
+        self._queue.put((source, dest, before))
+    
+    def wait(self):
+        """예약된 압축이 모두 끝날 때까지 대기 (종료 시 전용, 로깅 스레드에서 호출 금지)"""
+        self._queue.join()
+    
+    def _run(self):
+        while True:
+            source, dest, before = self._queue.get()
+            try:
+                if before is not None:
+                    before()
+                tmp_dest = dest + '.tmp'
+                with open(source, 'rb') as fin, gzip.open(tmp_dest, 'wb', compresslevel=6) as fout:
+                    shutil.copyfileobj(fin, fout, 1024 * 1024)
+                # 정리/분석이 마지막 기록 시각을 쓰도록 mtime 유지
+                shutil.copystat(source, tmp_dest)
+                os.replace(tmp_dest, dest)
+                os.remove(source)
+            except Exception as e:
+                print(f"Error compressing {source}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+# 모든 로거가 공유하는 압축 스레드
+segment_compressor = SegmentCompressor()
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """로테이션된 세그먼트를 .gz로 압축하는 RotatingFileHandler
+    
+    로깅 호출 스레드에서는 현재 파일을 고유한 이름(app.log.<ns>.pending)으로
+    rename만 하고, 백업 번호 이동(app.log.N.gz -> N+1)과 압축은
+    segment_compressor 스레드가 제출 순서대로 처리하므로 로테이션이 이전
+    압축을 기다리지 않습니다. 백업 파일 이름은 app.log.1.gz, app.log.2.gz ...
+    입니다.
+    """
+    
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = f"{self.baseFilename}.{time.time_ns()}.pending"
+            os.replace(self.baseFilename, pending)
+            segment_compressor.submit(pending, f"{self.baseFilename}.1.gz", before=self._shift_backups)
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _shift_backups(self):
+        """압축 스레드: app.log.N.gz -> N+1 (backupCount 번째는 덮어써서 삭제)"""
+        for index in range(self.backupCount - 1, 0, -1):
+            source = f"{self.baseFilename}.{index}.gz"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{index + 1}.gz")
+
+
+class PeriodicTasks:
+    """여러 객체의 주기 작업을 실행하는 프로세스 공용 백그라운드 스레드
+    
+    작업(바인드 메서드)은 약한 참조로만 들고 있으므로 버려진 객체(로거를
+    다시 만든 경우 등)의 작업은 스레드를 남기지 않고 사라지며, 남은 작업이
+    없으면 스레드도 종료됩니다. at_exit=True인 작업은 인터프리터 종료 시
+    한 번 더 실행됩니다 (객체마다 atexit 훅을 남기지 않음).
+    """
+    
+    def __init__(self, name):
+        self.name = name
+        self._tasks = {}  # (id(객체), 함수) -> [WeakMethod, 주기, 다음 실행 시각 (monotonic), at_exit]
+        self._thread = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        atexit.register(self._run_at_exit)
+    
+    @staticmethod
+    def _key(task):
+        return id(task.__self__), task.__func__
+    
+    def schedule(self, task, interval, delay=None, at_exit=False):
+        """task를 interval초마다 실행 (첫 실행은 delay초 뒤, 기본은 interval초 뒤)"""
+        first_run = time.monotonic() + (interval if delay is None else delay)
+        with self._lock:
+            self._tasks[self._key(task)] = [weakref.WeakMethod(task), interval, first_run, at_exit]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        # 더 이른 작업이 들어왔을 수 있으므로 대기 시간 다시 계산
+        self._wakeup.set()
+    
+    def cancel(self, task):
+        with self._lock:
+            self._tasks.pop(self._key(task), None)
+    
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            timeout = self._run_due()
+            if timeout is None:
+                return
+            self._wakeup.wait(timeout)
+    
+    def _run_due(self):
+        """주기가 된 작업을 실행하고 다음 실행까지 남은 초 반환 (작업이 없으면 None)
+        
+        대기하는 동안 작업 객체 참조를 들고 있지 않도록 별도 메서드에서 처리합니다.
+        """
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for key, entry in list(self._tasks.items()):
+                task = entry[0]()
+                if task is None:
+                    del self._tasks[key]
+                elif entry[2] <= now:
+                    entry[2] = now + entry[1]
+                    due.append(task)
+            if not self._tasks:
+                self._thread = None
+                return None
+            timeout = min(entry[2] for entry in self._tasks.values()) - now
+        for task in due:
+            try:
+                task()
+            except Exception as e:
+                print(f"Error running periodic task {task}: {e}")
+        return max(timeout, 0)
+    
+    def _run_at_exit(self):
+        with self._lock:
+            tasks = [entry[0]() for entry in self._tasks.values() if entry[3]]
+        for task in tasks:
+            if task is None:
+                continue
+            try:
+                task()
+            except Exception as e:
+                print(f"Error running periodic task {task}: {e}")
+
+
+# 버퍼 플러시, 작업 요약, 시스템 모니터가 공유하는 주기 작업 스레드 (프로세스당 1개)
+periodic_tasks = PeriodicTasks("log-periodic-tasks")
+
+
+class BufferedWriteMixin:
+    """포맷된 레코드를 메모리에 모았다가 한 번의 write로 기록하는 핸들러 믹스인
+    
+    버퍼가 buffer_bytes를 넘거나, flush_interval초가 지나거나, flush_level
+    (기본 ERROR) 이상의 레코드가 들어오면 플러시합니다. 로테이션 크기
+    검사는 레코드마다가 아니라 플러시할 때 버퍼 전체 기준으로 합니다.
+    """
+    
+    def __init__(self, *args, buffer_bytes=64*1024, flush_interval=1.0, flush_level=logging.ERROR, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.writes = 0  # 실제 파일 write 횟수
+        self._buffer = []
+        self._buffered = 0
+        if flush_interval:
+            periodic_tasks.schedule(self.flush, flush_interval)
+    
+    def emit(self, record):
+        try:
+            text = self.format(record) + self.terminator
+            self._buffer.append(text)
+            self._buffered += len(text)
+            if record.levelno >= self.flush_level or self._buffered >= self.buffer_bytes:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+            data = ''.join(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+            
+            if self.stream is None:
+                self.stream = self._open()
+            # RotatingFileHandler.shouldRollover와 같은 기준 (문자 수)
+            if self.maxBytes > 0 and self.stream.tell() and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+            self.stream.flush()
+            self.writes += 1
+        finally:
+            self.release()
+    
+    def close(self):
+        periodic_tasks.cancel(self.flush)
+        super().close()
+
+
+class BufferedRotatingFileHandler(BufferedWriteMixin, logging.handlers.RotatingFileHandler):
+    """버퍼링 RotatingFileHandler"""
+
+
+class BufferedCompressingRotatingFileHandler(BufferedWriteMixin, CompressingRotatingFileHandler):
+    """버퍼링 + 로테이션 세그먼트 압축 핸들러"""
+
+
+def process_log_filename(filename, pid=None):
+    """프로세스별 로그 파일 이름 (app.log -> app.<pid>.log)
+    
+    여러 Streamlit 서버 프로세스가 같은 log_dir을 쓸 때 각 프로세스가 자기
+    파일만 쓰고 로테이션하므로 RotatingFileHandler의 rename 경쟁이 없습니다.
+    log_analyzer는 app.log와 app.<pid>.log를 모두 읽어 병합합니다.
+    """
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{pid or os.getpid()}{ext}"
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """크기 제한 큐에 레코드를 넣는 QueueHandler
+    
+    overflow_policy='block'이면 큐가 찰 때 대기하고, 'drop_debug'이면
+    DEBUG 레코드만 버리고(dropped 카운트) 나머지는 대기합니다. 닫힌 뒤에는
+    리스너가 큐를 비우지 않으므로 정책과 관계없이 대기하지 않고 버립니다.
+    """
+    
+    def __init__(self, queue, overflow_policy='block', structured=False):
+        super().__init__(queue)
+        self.overflow_policy = overflow_policy
+        self.structured = structured
+        self.dropped = 0
+        self._closed = False
+    
+    def prepare(self, record):
+        # 같은 프로세스의 큐이므로 포맷팅(예외 포함)은 리스너 스레드에 맡기고
+        # 메시지만 큐에 넣는 시점 값으로 고정해 호출 이후 변경의 영향을 막음
+        msg = record.msg
+        if isinstance(msg, (LazyMessage, LazyJson)):
+            # 비활성 레벨은 여기까지 오지 않으므로 지연 포맷팅 이점은 유지됨.
+            # JSON lines는 필드 구조가 필요하므로 JSON 값 사본으로 고정
+            record.msg = msg.snapshot() if self.structured else str(msg)
+        elif record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record):
+        if self._closed or (self.overflow_policy == 'drop_debug' and record.levelno <= logging.DEBUG):
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            self.queue.put(record)
+    
+    def close(self):
+        self._closed = True
+        super().close()
+
+
+class RoutingQueueListener(logging.handlers.QueueListener):
+    """하나의 큐를 로거 이름별 파일 핸들러로 분배하는 QueueListener"""
+    
+    def __init__(self, queue, routes):
+        super().__init__(queue, respect_handler_level=True)
+        self.routes = routes  # 로거 이름 -> 핸들러 목록
+    
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있어도 종료 신호는 반드시 들어가야 함
+        self.queue.put(self._sentinel)
+    
+    def handle(self, record):
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def format_extra_info(fields):
+    """추가 정보를 ' | k=v' 형태로 포맷팅"""
+    if not fields:
+        return ""
+    return "| " + " | ".join([f"{k}={v}" for k, v in fields.items()])
+
+
+class LazyMessage:
+    """기록될 때만 'message | k=v' 문자열을 만드는 로그 메시지
+    
+    logging은 레코드를 포맷할 때 str(msg)를 호출하므로, 비활성 레벨에서는
+    문자열을 만들지 않습니다. kwargs 값은 참조로 보관되므로 비동기 모드에서는
+    BoundedQueueHandler.prepare가 큐에 넣기 전에 호출 스레드에서 고정합니다.
+    """
+    
+    __slots__ = ('message', 'fields', 'exception')
+    
+    def __init__(self, message, fields, exception=None):
+        self.message = message
+        self.fields = fields
+        self.exception = exception
+    
+    def __str__(self):
+        text = f"{self.message} {format_extra_info(self.fields)}"
+        if self.exception is not None:
+            text += f" | Exception: {str(self.exception)}"
+        return text
+    
+    def snapshot(self):
+        """현재 값으로 고정한 사본 (fields는 JSON 값, 예외는 문자열)"""
+        return LazyMessage(
+            self.message,
+            json_snapshot(self.fields) if self.fields else self.fields,
+            str(self.exception) if self.exception is not None else None
+        )
+
+
+class LazyJson:
+    """기록될 때만 JSON으로 직렬화되는 로그 메시지"""
+    
+    __slots__ = ('data',)
+    
+    def __init__(self, data):
+        self.data = data
+    
+    def __str__(self):
+        return json.dumps(self.data, ensure_ascii=False)
+    
+    def snapshot(self):
+        """현재 값으로 고정한 사본 (JSON 값)"""
+        return LazyJson(json_snapshot(self.data))
+
+
+def dumps_json(data):
+    """JSON 한 줄 직렬화 (orjson이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def json_snapshot(data):
+    """JSON 왕복으로 만든 깊은 사본 (직렬화할 수 없는 값은 str)"""
+    return json.loads(dumps_json(data))
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """모든 스트림을 한 줄 JSON 레코드로 기록하는 포맷터
+    
+    기본 키는 ts, level, logger, stream, func, line 이며 access/performance
+    페이로드(LazyJson)는 최상위 키로 합쳐지고, 일반 메시지(LazyMessage)는
+    message/fields/exception 으로 기록됩니다. 예외는 exc_type/traceback.
+    """
+    
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+    
+    def format(self, record):
+        msecs = int(record.msecs)
+        entry = {
+            'ts': f"{time.strftime('%Y-%m-%d %H:%M:%S', self.converter(record.created))}.{msecs:03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'stream': self.stream,
+            'func': record.funcName,
+            'line': record.lineno
+        }
+        
+        msg = record.msg
+        if isinstance(msg, LazyJson):
+            entry.update((key, value) for key, value in msg.data.items() if key not in entry)
+        elif isinstance(msg, LazyMessage):
+            entry['message'] = msg.message
+            if msg.fields:
+                entry['fields'] = msg.fields
+            if msg.exception is not None:
+                entry['exception'] = str(msg.exception)
+        else:
+            entry['message'] = record.getMessage()
+        
+        if record.exc_info:
+            entry['exc_type'] = record.exc_info[0].__name__ if record.exc_info[0] else None
+            entry['traceback'] = self.formatException(record.exc_info)
+        
+        return dumps_json(entry)
+
+
+class OperationHistogram:
+    """작업별 지연시간 히스토그램
+    
+    log_analyzer.LatencySketch와 같은 로그 스케일 버킷(ms, 상대 오차 1%)을
+    사용하므로 요약 레코드의 histogram을 분석기에서 그대로 병합할 수 있습니다.
+    """
+    
+    __slots__ = ('bins', 'zero_count', 'count', 'sum_ns', 'min_ns', 'max_ns')
+    
+    RELATIVE_ACCURACY = 0.01
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    LOG_GAMMA = math.log(GAMMA)
+    
+    def __init__(self):
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+    
+    def add(self, duration_ns):
+        duration_ms = duration_ns / 1e6
+        if duration_ms <= 0:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(duration_ms) / self.LOG_GAMMA)
+            self.bins[index] = self.bins.get(index, 0) + 1
+        self.count += 1
+        self.sum_ns += duration_ns
+        self.min_ns = duration_ns if self.min_ns is None else min(self.min_ns, duration_ns)
+        self.max_ns = max(self.max_ns, duration_ns)
+    
+    def merge(self, other):
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum_ns += other.sum_ns
+        if other.min_ns is not None:
+            self.min_ns = other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+    
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return round(2 * self.GAMMA ** index / (self.GAMMA + 1), 2)
+        return round(2 * self.GAMMA ** max(self.bins) / (self.GAMMA + 1), 2)
+    
+    def summary(self):
+        """count/sum/min/max/p50/p99 (ms)"""
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ns / 1e6, 3),
+            'avg_ms': round(self.sum_ns / self.count / 1e6, 3) if self.count else 0,
+            'min_ms': round((self.min_ns or 0) / 1e6, 3),
+            'max_ms': round(self.max_ns / 1e6, 3),
+            'p50_ms': self.quantile(0.5),
+            'p99_ms': self.quantile(0.99)
+        }
+    
+    def to_state(self):
+        """LatencySketch.from_state 호환 형식"""
+        return {
+            'relative_accuracy': self.RELATIVE_ACCURACY,
+            'bins': list(self.bins.items()),
+            'zero_count': self.zero_count
+        }
+
+
+class OperationMetrics:
+    """작업별 실행 시간 인메모리 집계
+    
+    record()는 구간 히스토그램만 갱신하고, flush_interval초마다 공용
+    주기 작업 스레드가 작업당 요약 레코드 하나로 emit한 뒤 누적
+    히스토그램에 병합합니다. 누적값은 snapshot()으로 조회합니다.
+    """
+    
+    def __init__(self, emit, flush_interval=60):
+        self.emit = emit
+        self.flush_interval = flush_interval
+        self._interval = {}
+        self._totals = {}
+        self._interval_started = time.time()
+        self._lock = threading.Lock()
+        self._scheduled = False
+    
+    def record(self, operation, duration_ns):
+        with self._lock:
+            histogram = self._interval.get(operation)
+            if histogram is None:
+                histogram = self._interval[operation] = OperationHistogram()
+            histogram.add(duration_ns)
+        
+        if not self._scheduled and self.flush_interval:
+            self._start()
+    
+    def _start(self):
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        periodic_tasks.schedule(self.flush, self.flush_interval, at_exit=True)
+    
+    def flush(self):
+        """현재 구간의 작업별 요약을 emit하고 구간 초기화"""
+        with self._lock:
+            interval, self._interval = self._interval, {}
+            started, self._interval_started = self._interval_started, time.time()
+            for operation, histogram in interval.items():
+                self._totals.setdefault(operation, OperationHistogram()).merge(histogram)
+        
+        interval_seconds = round(time.time() - started, 1)
+        for operation, histogram in interval.items():
+            try:
+                self.emit(operation, histogram, interval_seconds)
+            except Exception as e:
+                print(f"작업 요약 기록 실패: {e}")
+    
+    def snapshot(self):
+        """시작 이후 누적 작업별 요약"""
+        with self._lock:
+            totals = {operation: OperationHistogram().merge(histogram) for operation, histogram in self._totals.items()}
+            for operation, histogram in self._interval.items():
+                totals.setdefault(operation, OperationHistogram()).merge(histogram)
+        return {operation: histogram.summary() for operation, histogram in totals.items()}
+    
+    def stop(self):
+        """주기 요약을 멈추고 남은 구간을 기록 (이후 record()는 집계만 함)"""
+        with self._lock:
+            self._scheduled = True
+        periodic_tasks.cancel(self.flush)
+        self.flush()
+
+
+class Span:
+    """추적 구간 하나 (시간은 perf_counter_ns 기준)"""
+    
+    __slots__ = ('name', 'span_id', 'parent_id', 'trace_id', 'session_id',
+                 'start_ns', 'end_ns', 'child_ns', 'status', 'thread_id')
+    
+    def __init__(self, name, span_id, parent_id, trace_id, session_id):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.trace_id = trace_id
+        self.session_id = session_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+        self.child_ns = 0
+        self.status = 'success'
+        self.thread_id = threading.get_ident()
+    
+    @property
+    def total_ns(self):
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+    
+    @property
+    def self_ns(self):
+        # 동시에 실행된 자식(asyncio.gather 등)의 합이 전체보다 클 수 있음
+        return max(self.total_ns - self.child_ns, 0)
+    
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'trace_id': self.trace_id,
+            'session_id': self.session_id,
+            'status': self.status,
+            'total_ms': round(self.total_ns / 1e6, 3),
+            'self_ms': round(self.self_ns / 1e6, 3)
+        }
+
+
+class Tracer:
+    """contextvars 기반 계층 span 추적기
+    
+    span()을 중첩해서 열면 현재 span이 부모가 되어 같은 trace_id를
+    공유합니다. contextvars를 사용하므로 스레드와 asyncio 태스크마다
+    부모가 올바르게 유지됩니다. 끝난 span은 최근 max_spans개만 보관하며
+    Chrome trace JSON(chrome://tracing, Perfetto)으로 내보낼 수 있습니다.
+    """
+    
+    def __init__(self, max_spans=10000):
+        self.spans = deque(maxlen=max_spans)
+        self._current = contextvars.ContextVar('streamlit_logger_span', default=None)
+        self._lock = threading.Lock()
+    
+    def current(self):
+        """현재 실행 중인 span (없으면 None)"""
+        return self._current.get()
+    
+    @contextmanager
+    def span(self, name, session_id=None, activate=True):
+        """name 구간을 현재 span의 자식으로 추적
+        
+        activate=False면 이 span을 현재 span으로 설정하지 않습니다.
+        제너레이터는 호출자와 컨텍스트를 공유하므로 yield 사이에 span이
+        소비자 쪽으로 새지 않도록 이 옵션을 사용합니다.
+        """
+        parent = self._current.get()
+        span_id = f"{random.getrandbits(64):016x}"
+        if parent is None:
+            span = Span(name, span_id, None, span_id, session_id)
+        else:
+            span = Span(name, span_id, parent.span_id, parent.trace_id, session_id or parent.session_id)
+        
+        token = self._current.set(span) if activate else None
+        try:
+            yield span
+        except BaseException as e:
+            if not isinstance(e, GeneratorExit):
+                span.status = 'error'
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            if token is not None:
+                self._current.reset(token)
+            if parent is not None:
+                parent.child_ns += span.end_ns - span.start_ns
+            with self._lock:
+                self.spans.append(span)
+    
+    def _select(self, trace_id=None, session_id=None):
+        with self._lock:
+            spans = list(self.spans)
+        return [
+            span for span in spans
+            if (trace_id is None or span.trace_id == trace_id)
+            and (session_id is None or span.session_id == session_id)
+        ]
+    
+    def recent_traces(self, limit=20, session_id=None):
+        """최근 루트 span 요약 (최신 순)"""
+        roots = [span for span in self._select(session_id=session_id) if span.parent_id is None]
+        return [span.to_dict() for span in reversed(roots[-limit:])]
+    
+    def get_trace(self, trace_id):
+        """trace_id의 span 트리 (children은 시작 순)"""
+        nodes = {}
+        roots = []
+        for span in sorted(self._select(trace_id=trace_id), key=lambda s: s.start_ns):
+            nodes[span.span_id] = node = {**span.to_dict(), 'children': []}
+            parent = nodes.get(span.parent_id)
+            (parent['children'] if parent is not None else roots).append(node)
+        return roots
+    
+    def export_chrome_trace(self, path=None, trace_id=None, session_id=None):
+        """Chrome trace 이벤트 형식으로 내보내기 (path가 있으면 파일로 저장)"""
+        pid = os.getpid()
+        events = [
+            {
+                'name': span.name,
+                'cat': 'span',
+                'ph': 'X',
+                'ts': span.start_ns / 1000,
+                'dur': span.total_ns / 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': {
+                    'span_id': span.span_id,
+                    'parent_id': span.parent_id,
+                    'trace_id': span.trace_id,
+                    'session_id': span.session_id,
+                    'status': span.status,
+                    'self_ms': round(span.self_ns / 1e6, 3)
+                }
+            }
+            for span in self._select(trace_id, session_id)
+        ]
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, ensure_ascii=False, default=str)
+        return trace
 
 
 class StreamlitLogger:
     """Streamlit 애플리케이션용 통합 로깅 시스템"""
     
-    def __init__(self, log_dir="/var/log/streamlit-app", app_name="streamlit-app"):
+    def __init__(self, log_dir="/var/log/streamlit-app", app_name="streamlit-app", compress_backups=False,
+                 async_mode=False, queue_size=10000, overflow_policy='block', debug_enabled=True,
+                 structured=False, buffered_streams=(), buffer_bytes=64*1024, flush_interval=1.0,
+                 metrics_flush_interval=60, tracing=True, max_spans=10000, per_process_files=False):
         self.log_dir = log_dir
         self.app_name = app_name
+        self.compress_backups = compress_backups  # 로테이션된 파일을 .gz로 압축
+        self.async_mode = async_mode  # 파일 쓰기를 백그라운드 스레드에서 수행
+        self.overflow_policy = overflow_policy  # 'block' 또는 'drop_debug'
+        self.debug_enabled = debug_enabled  # False면 debug.log 비활성 (운영 환경)
+        self.structured = structured  # True면 모든 스트림을 JSON lines로 기록
+        # 여러 서버 프로세스가 log_dir을 공유할 때 프로세스별 파일(app.<pid>.log)에 기록
+        self.per_process_files = per_process_files
+        # 버퍼링 쓰기 스트림 (크기/주기/ERROR 레벨에서 플러시, 기본은 없음: 필요한 스트림만 지정)
+        self.buffered_streams = set(buffered_streams)
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self._buffered_handlers = []
+        
+        # log_execution_time 작업별 집계 (metrics_flush_interval초마다 요약 기록)
+        self.metrics = OperationMetrics(self._emit_operation_summary, metrics_flush_interval)
+        # 이 로거에 붙은 SystemMonitor (shutdown 시 함께 중지)
+        self.monitors = weakref.WeakSet()
+        
+        # 데코레이터 호출의 계층 span 추적 (None이면 비활성)
+        self.tracer = Tracer(max_spans) if tracing else None
         self.loggers = {}
         
+        # 비동기 모드: 로거별 QueueHandler -> 공용 큐 -> 리스너 스레드 1개
+        self._queue = queue.Queue(maxsize=queue_size) if async_mode else None
+        self._queue_handlers = []
+        self._routes = {}
+        self._listener = None
+        
         # 로그 디렉토리 생성
         os.makedirs(log_dir, exist_ok=True)
         
         # 각종 로거 초기화
         self._setup_loggers()
+        
+        if async_mode:
+            self._listener = RoutingQueueListener(self._queue, self._routes)
+            self._listener.start()
+            atexit.register(self.shutdown)
+    
+    def shutdown(self):
+        """주기 작업을 멈추고 큐에 남은 레코드를 모두 기록한 뒤 리스너 중지
+        
+        비동기 모드에서는 큐 핸들러를 떼어내므로 이후 레코드는 파일에
+        기록되지 않습니다 (호출 스레드가 막히지도 않음).
+        """
+        for monitor in list(self.monitors):
+            monitor.stop()
+        self.metrics.stop()
+        self.flush_buffers()
+        atexit.unregister(self.shutdown)
+        if self._listener is not None:
+            # 리스너가 멈춘 뒤 큐에 넣으면 'block' 정책에서 영원히 대기하므로 큐 핸들러를 먼저 떼어냄
+            for logger in self.loggers.values():
+                for handler in list(logger.handlers):
+                    if handler in self._queue_handlers:
+                        logger.removeHandler(handler)
+                        handler.close()
+            self._listener.stop()
+            self._listener = None
+            for handlers in self._routes.values():
+                for handler in handlers:
+                    handler.close()
+    
+    def flush_buffers(self):
+        """버퍼링 스트림에 모인 레코드를 즉시 기록"""
+        for handler in self._buffered_handlers:
+            handler.flush()
+    
+    def get_queue_stats(self):
+        """비동기 모드 큐 상태"""
+        if self._queue is None:
+            return {'async_mode': False}
+        return {
+            'async_mode': True,
+            'queued': self._queue.qsize(),
+            'dropped': sum(handler.dropped for handler in self._queue_handlers)
+        }
     
     def _setup_loggers(self):
         """모든 로거를 설정합니다"""
@@ -56,7 +833,7 @@ class StreamlitLogger:
         self.loggers['debug'] = self._create_logger(
             name='debug',
             filename='debug.log',
-            level=logging.DEBUG,
+            level=logging.DEBUG if self.debug_enabled else logging.INFO,
             format_type='debug'
         )
         
@@ -77,25 +854,52 @@ class StreamlitLogger:
         logger.handlers.clear()
         
         # 로테이팅 파일 핸들러
+        if self.per_process_files:
+            filename = process_log_filename(filename)
         file_path = os.path.join(self.log_dir, filename)
-        handler = logging.handlers.RotatingFileHandler(
+        handler_kwargs = {}
+        if name in self.buffered_streams:
+            handler_class = (
+                BufferedCompressingRotatingFileHandler if self.compress_backups
+                else BufferedRotatingFileHandler
+            )
+            handler_kwargs = {'buffer_bytes': self.buffer_bytes, 'flush_interval': self.flush_interval}
+        else:
+            handler_class = (
+                CompressingRotatingFileHandler if self.compress_backups
+                else logging.handlers.RotatingFileHandler
+            )
+        handler = handler_class(
             file_path,
             maxBytes=100*1024*1024,  # 100MB
             backupCount=30,  # 30개 파일 보관
-            encoding='utf-8'
+            encoding='utf-8',
+            **handler_kwargs
         )
+        if handler_kwargs:
+            self._buffered_handlers.append(handler)
         
         # 포맷터 설정
         formatter = self._get_formatter(format_type)
         handler.setFormatter(formatter)
         
-        logger.addHandler(handler)
+        if self.async_mode:
+            # 파일 핸들러는 리스너 스레드에서만 사용
+            self._routes[logger.name] = [handler]
+            queue_handler = BoundedQueueHandler(self._queue, self.overflow_policy, self.structured)
+            self._queue_handlers.append(queue_handler)
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(handler)
         logger.propagate = False  # 상위 로거로 전파 방지
         
         return logger
     
     def _get_formatter(self, format_type):
         """포맷 타입별 포맷터를 반환합니다"""
+        if self.structured:
+            return JsonLinesFormatter(format_type)
+        
         formats = {
             'detailed': '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
             'access': '%(asctime)s | ACCESS | %(message)s',
@@ -113,32 +917,42 @@ class StreamlitLogger:
     
     def info(self, message, **kwargs):
         """일반 정보 로그"""
-        extra_info = self._format_extra_info(**kwargs)
-        self.loggers['app'].info(f"{message} {extra_info}")
+        logger = self.loggers['app']
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(LazyMessage(message, kwargs))
     
     def warning(self, message, **kwargs):
         """경고 로그"""
-        extra_info = self._format_extra_info(**kwargs)
-        self.loggers['app'].warning(f"{message} {extra_info}")
+        logger = self.loggers['app']
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(LazyMessage(message, kwargs))
     
     def error(self, message, exception=None, **kwargs):
         """에러 로그"""
-        extra_info = self._format_extra_info(**kwargs)
-        error_msg = f"{message} {extra_info}"
+        logger = self.loggers['error']
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         
         if exception:
-            error_msg += f" | Exception: {str(exception)}"
-            self.loggers['error'].error(error_msg, exc_info=True)
+            logger.error(LazyMessage(message, kwargs, exception), exc_info=True)
         else:
-            self.loggers['error'].error(error_msg)
+            logger.error(LazyMessage(message, kwargs))
+        
+        # 에러 직전의 접근 기록이 버퍼에 남지 않도록 함께 기록
+        self.flush_buffers()
     
     def debug(self, message, **kwargs):
         """디버그 로그"""
-        extra_info = self._format_extra_info(**kwargs)
-        self.loggers['debug'].debug(f"{message} {extra_info}")
+        logger = self.loggers['debug']
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(LazyMessage(message, kwargs))
     
     def access_log(self, user_id, session_id, action, page=None, **kwargs):
         """사용자 접근 로그"""
+        logger = self.loggers['access']
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         access_info = {
             'user_id': user_id,
             'session_id': session_id,
@@ -146,86 +960,196 @@ class StreamlitLogger:
             'page': page,
             **kwargs
         }
-        self.loggers['access'].info(json.dumps(access_info, ensure_ascii=False))
+        logger.info(LazyJson(access_info))
     
     def performance_log(self, operation, duration, **kwargs):
         """성능 로그"""
+        logger = self.loggers['performance']
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         perf_info = {
             'operation': operation,
             'duration_ms': round(duration * 1000, 2),
             'timestamp': datetime.now().isoformat(),
             **kwargs
         }
-        self.loggers['performance'].info(json.dumps(perf_info, ensure_ascii=False))
+        logger.info(LazyJson(perf_info))
+    
+    def record_operation(self, operation, duration_ns):
+        """작업 실행 시간을 인메모리 히스토그램에 집계 (호출마다 기록하지 않음)"""
+        self.metrics.record(operation, duration_ns)
+    
+    def get_operation_metrics(self):
+        """작업별 누적 count/sum/min/max/p50/p99 (ms)"""
+        return self.metrics.snapshot()
+    
+    def flush_metrics(self):
+        """현재 구간의 작업별 요약 레코드를 즉시 기록"""
+        self.metrics.flush()
+    
+    def _emit_operation_summary(self, operation, histogram, interval_seconds):
+        """구간 히스토그램을 performance.log 요약 레코드로 기록"""
+        logger = self.loggers['performance']
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        summary = histogram.summary()
+        perf_info = {
+            'operation': operation,
+            'type': 'summary',
+            'duration_ms': summary.pop('avg_ms'),
+            'timestamp': datetime.now().isoformat(),
+            'status': 'success',
+            **summary,
+            'interval_seconds': interval_seconds,
+            'histogram': histogram.to_state()
+        }
+        logger.info(LazyJson(perf_info))
     
     def _format_extra_info(self, **kwargs):
         """추가 정보를 포맷팅합니다"""
-        if not kwargs:
-            return ""
-        return "| " + " | ".join([f"{k}={v}" for k, v in kwargs.items()])
+        return format_extra_info(kwargs)
+
+
+def _streamlit_session_state():
+    """실행 중인 Streamlit 스크립트의 session_state (Streamlit 실행 중이 아니면 None)
+    
+    streamlit을 import한 적 없는 프로세스(일반 스크립트, CLI)에서는 import하지
+    않고, ScriptRunContext가 없는 스레드에서는 session_state에 접근하지 않으므로
+    "missing ScriptRunContext" 경고도 남기지 않습니다.
+    """
+    if 'streamlit' not in sys.modules:
+        return None
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    import streamlit as st
+    return st.session_state
+
+
+def _wrap_execution(func, context):
+    """함수의 실제 실행 구간을 context(args, kwargs)로 감싸는 래퍼 생성
+    
+    코루틴 함수는 await가 끝날 때까지, 제너레이터/비동기 제너레이터는
+    소비가 끝나거나 닫힐 때까지를 실행 구간으로 봅니다. context가 예외를
+    삼키면 래퍼는 None을 반환(제너레이터는 종료)합니다. 비동기 제너레이터의
+    asend/athrow/aclose는 원래 제너레이터로 그대로 전달합니다.
+    """
+    if inspect.isasyncgenfunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with context(args, kwargs):
+                agen = func(*args, **kwargs)
+                try:
+                    # async 제너레이터에는 yield from이 없으므로 같은 위임을 직접 구현
+                    item = await agen.asend(None)
+                    while True:
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            raise
+                        except BaseException as e:
+                            item = await agen.athrow(e)
+                        else:
+                            item = await agen.asend(sent)
+                except StopAsyncIteration:
+                    pass
+                finally:
+                    await agen.aclose()
+    elif inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with context(args, kwargs):
+                return await func(*args, **kwargs)
+    elif inspect.isgeneratorfunction(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with context(args, kwargs):
+                return (yield from func(*args, **kwargs))
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with context(args, kwargs):
+                return func(*args, **kwargs)
+    return wrapper
 
 
 class LoggingDecorators:
-    """로깅 데코레이터 모음"""
+    """로깅 데코레이터 모음 (일반/async 함수, 제너레이터, async 제너레이터 지원)"""
     
     def __init__(self, logger: StreamlitLogger):
         self.logger = logger
     
-    def log_execution_time(self, operation_name=None):
-        """함수 실행 시간을 로깅하는 데코레이터"""
+    def log_execution_time(self, operation_name=None, aggregate=True):
+        """함수 실행 시간을 로깅하는 데코레이터
+        
+        aggregate=True면 성공한 호출은 작업별 히스토그램에만 집계되고
+        주기적인 요약 레코드로 기록됩니다. 실패한 호출과 aggregate=False는
+        호출마다 기록합니다. 끝까지 소비되지 않고 닫힌 제너레이터는 닫힐
+        때까지의 시간을 성공으로 기록합니다.
+        """
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                start_time = time.time()
-                operation = operation_name or func.__name__
-                
+            operation = operation_name or func.__name__
+            
+            @contextmanager
+            def timed(args, kwargs):
+                start_ns = time.perf_counter_ns()
                 try:
-                    result = func(*args, **kwargs)
-                    duration = time.time() - start_time
-                    self.logger.performance_log(
-                        operation=operation,
-                        duration=duration,
-                        status='success'
-                    )
-                    return result
+                    yield
                 except Exception as e:
-                    duration = time.time() - start_time
-                    self.logger.performance_log(
-                        operation=operation,
-                        duration=duration,
-                        status='error',
-                        error=str(e)
-                    )
+                    self._record_execution(operation, time.perf_counter_ns() - start_ns, aggregate, e)
                     raise
-            return wrapper
+                except GeneratorExit:
+                    self._record_execution(operation, time.perf_counter_ns() - start_ns, aggregate)
+                    raise
+                self._record_execution(operation, time.perf_counter_ns() - start_ns, aggregate)
+            
+            tracer = self.logger.tracer
+            if tracer is None:
+                return _wrap_execution(func, timed)
+            
+            streaming = inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+            
+            @contextmanager
+            def traced(args, kwargs):
+                # 루트 span에만 세션 ID를 조회하고 자식은 부모 것을 물려받음
+                # (Streamlit 실행 밖에서는 streamlit을 import하지 않고 None)
+                session_id = None
+                if tracer.current() is None:
+                    session_state = _streamlit_session_state()
+                    if session_state is not None:
+                        session_id = getattr(session_state, 'session_id', 'unknown')
+                with tracer.span(operation, session_id, activate=not streaming), timed(args, kwargs):
+                    yield
+            
+            return _wrap_execution(func, traced)
         return decorator
     
     def log_user_action(self, action_name=None):
-        """사용자 액션을 로깅하는 데코레이터"""
+        """사용자 액션을 로깅하는 데코레이터 (실제 실행이 시작될 때 기록)"""
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                action = action_name or func.__name__
-                user_id = self._get_user_id()
-                session_id = self._get_session_id()
-                
+            action = action_name or func.__name__
+            
+            @contextmanager
+            def logged(args, kwargs):
                 self.logger.access_log(
-                    user_id=user_id,
-                    session_id=session_id,
+                    user_id=self._get_user_id(),
+                    session_id=self._get_session_id(),
                     action=action
                 )
-                
-                return func(*args, **kwargs)
-            return wrapper
+                yield
+            
+            return _wrap_execution(func, logged)
         return decorator
     
     def log_errors(self, reraise=True):
         """에러를 자동으로 로깅하는 데코레이터"""
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
+            @contextmanager
+            def guarded(args, kwargs):
                 try:
-                    return func(*args, **kwargs)
+                    yield
                 except Exception as e:
                     self.logger.error(
                         f"Error in {func.__name__}",
@@ -236,64 +1160,155 @@ class LoggingDecorators:
                     )
                     if reraise:
                         raise
-                    return None
-            return wrapper
+            
+            return _wrap_execution(func, guarded)
         return decorator
     
+    def _record_execution(self, operation, duration_ns, aggregate, error=None):
+        """실행 시간 기록: 성공은 히스토그램 집계, 실패는 개별 레코드"""
+        if error is None and aggregate:
+            self.logger.record_operation(operation, duration_ns)
+            return
+        
+        # 개별 레코드에는 span을 연결해 트리와 대조할 수 있게 함
+        span = self.logger.tracer.current() if self.logger.tracer else None
+        trace_info = {} if span is None else {
+            'trace_id': span.trace_id, 'span_id': span.span_id, 'parent_id': span.parent_id
+        }
+        if error is None:
+            self.logger.performance_log(operation=operation, duration=duration_ns / 1e9,
+                                        status='success', **trace_info)
+        else:
+            self.logger.performance_log(operation=operation, duration=duration_ns / 1e9,
+                                        status='error', error=str(error), **trace_info)
+    
     def _get_user_id(self):
-        """현재 사용자 ID 추출 (세션 상태에서)"""
-        return getattr(st.session_state, 'user_id', 'anonymous')
+        """현재 사용자 ID 추출 (세션 상태에서, Streamlit 실행 밖이면 'anonymous')"""
+        session_state = _streamlit_session_state()
+        return 'anonymous' if session_state is None else getattr(session_state, 'user_id', 'anonymous')
     
     def _get_session_id(self):
-        """현재 세션 ID 추출"""
-        return getattr(st.session_state, 'session_id', 'unknown')
+        """현재 세션 ID 추출 (Streamlit 실행 밖이면 'unknown')"""
+        session_state = _streamlit_session_state()
+        return 'unknown' if session_state is None else getattr(session_state, 'session_id', 'unknown')
 
 
 class SystemMonitor:
-    """시스템 리소스 모니터링"""
+    """시스템 리소스 모니터링
     
-    def __init__(self, logger: StreamlitLogger):
+    interval_seconds를 주면 공용 주기 작업 스레드가 주기적으로 샘플을
+    수집해 링 버퍼에 보관하고 performance 로그에 기록합니다. UI는
+    get_latest()/get_history()로 즉시 읽습니다. CPU 사용률은 직전 샘플
+    이후 평균(psutil.cpu_percent(interval=None))이라 호출 스레드를 막지
+    않습니다.
+    샘플링은 모니터 객체가 살아 있는 동안만 계속됩니다.
+    """
+    
+    def __init__(self, logger: StreamlitLogger, interval_seconds=None, history_size=120):
         self.logger = logger
+        self.interval_seconds = interval_seconds
+        self.samples = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        logger.monitors.add(self)
+        
+        # 첫 cpu_percent(interval=None) 호출은 기준점만 잡고 0.0을 반환
+        import psutil
+        psutil.cpu_percent(interval=None)
+        
+        if interval_seconds:
+            self.start()
+    
+    def start(self):
+        """백그라운드 샘플링 시작 (CPU 기준점 이후 최소 1초가 지나야 의미 있는 값이 나옴)"""
+        if not self.interval_seconds:
+            return
+        periodic_tasks.schedule(self.log_system_stats, self.interval_seconds,
+                                delay=min(1, self.interval_seconds))
+    
+    def stop(self):
+        """백그라운드 샘플링 중지"""
+        periodic_tasks.cancel(self.log_system_stats)
+    
+    def _collect(self):
+        """현재 시스템 샘플 (블로킹 없음)"""
+        import psutil
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_percent': memory.percent,
+            'memory_available_gb': round(memory.available / (1024**3), 2),
+            'disk_percent': disk.percent,
+            'disk_free_gb': round(disk.free / (1024**3), 2)
+        }
     
     def log_system_stats(self):
-        """시스템 통계를 로깅합니다"""
+        """시스템 통계를 수집해 링 버퍼에 넣고 로깅합니다"""
         try:
-            # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # 메모리 사용률
-            memory = psutil.virtual_memory()
-            
-            # 디스크 사용률
-            disk = psutil.disk_usage('/')
-            
-            system_stats = {
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_available_gb': round(memory.available / (1024**3), 2),
-                'disk_percent': disk.percent,
-                'disk_free_gb': round(disk.free / (1024**3), 2)
-            }
+            sample = self._collect()
+            with self._lock:
+                self.samples.append(sample)
             
+            stats = {key: value for key, value in sample.items() if key != 'timestamp'}
             self.logger.performance_log(
                 operation='system_monitor',
                 duration=0,
-                **system_stats
+                **stats
             )
-            
+            return sample
         except Exception as e:
             self.logger.error("Failed to collect system stats", exception=e)
+            return None
+    
+    def get_latest(self):
+        """가장 최근 샘플 (아직 없으면 즉시 한 번 수집)"""
+        with self._lock:
+            if self.samples:
+                return self.samples[-1]
+        return self.log_system_stats()
+    
+    def get_history(self):
+        """링 버퍼의 샘플 (오래된 것부터)"""
+        with self._lock:
+            return list(self.samples)
 
 
-# === 사용 예시 ===
+# === 기본 로거 (지연 생성) ===
 
-# 전역 로거 인스턴스 생성
-logger = StreamlitLogger()
-decorators = LoggingDecorators(logger)
-monitor = SystemMonitor(logger)
+_default_logging = None
+_default_logging_lock = threading.Lock()
+_DEFAULT_NAMES = ('logger', 'decorators', 'monitor')
+
+
+def get_default_logging():
+    """기본 (logger, decorators, monitor)를 처음 요청할 때 생성해 반환
+    
+    모듈 import만으로는 로그 디렉토리를 만들거나 핸들러를 열지 않습니다.
+    """
+    global _default_logging
+    if _default_logging is None:
+        with _default_logging_lock:
+            if _default_logging is None:
+                logger = StreamlitLogger()
+                _default_logging = (logger, LoggingDecorators(logger), SystemMonitor(logger))
+    return _default_logging
+
+
+def __getattr__(name):
+    # from logging_config import logger, decorators, monitor 하위 호환
+    if name in _DEFAULT_NAMES:
+        return get_default_logging()[_DEFAULT_NAMES.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# === 사용 예시 ===
 
 def setup_logging():
     """로깅 시스템 초기화"""
+    import streamlit as st
+    logger = get_default_logging()[0]
+    
     # 세션 ID 생성 (한 번만)
     if 'session_id' not in st.session_state:
         st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
@@ -310,22 +1325,25 @@ def setup_logging():
         page="main"
     )
 
-@decorators.log_execution_time("data_processing")
-@decorators.log_user_action("process_data")
-@decorators.log_errors()
-def process_data(data):
-    """데이터 처리 함수 예시"""
-    logger.info("Starting data processing", data_size=len(data))
-    
-    # 복잡한 처리 로직
-    time.sleep(1)  # 시뮬레이션
-    
-    result = len(data) * 2
-    logger.info("Data processing completed", result=result)
-    return result
-
 def main():
     """메인 애플리케이션"""
+    import streamlit as st
+    logger, decorators, monitor = get_default_logging()
+    
+    @decorators.log_execution_time("data_processing")
+    @decorators.log_user_action("process_data")
+    @decorators.log_errors()
+    def process_data(data):
+        """데이터 처리 함수 예시"""
+        logger.info("Starting data processing", data_size=len(data))
+        
+        # 복잡한 처리 로직
+        time.sleep(1)  # 시뮬레이션
+        
+        result = len(data) * 2
+        logger.info("Data processing completed", result=result)
+        return result
+    
     st.title("Streamlit with Professional Logging")
     
     # 로깅 시스템 초기화
@@ -6,19 +6,418 @@ import json
 import yaml
 from datetime import datetime
 from functools import wraps
-import streamlit as st
 import time
 import traceback
+import threading
+import weakref
+import random
+import gc
+import codecs
+import re
 import psutil
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+# libyaml이 있으면 C 로더 사용 (파싱이 수 배 빠름)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# === 설정 스키마 (검증 후 컴파일되는 불변 설정) ===
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+KIND_NAMES = {bool: '불리언', int: '정수', float: '숫자', str: '문자열'}
+
+
+class ConfigError(ValueError):
+    """설정 스키마 검증 실패 (problems: '경로: 내용' 목록)"""
+    
+    def __init__(self, problems):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+@dataclass(frozen=True)
+class RotationSettings:
+    max_bytes: int
+    backup_count: int
+
+
+@dataclass(frozen=True)
+class SystemMonitoringSettings:
+    enabled: bool
+    interval_seconds: float
+
+
+@dataclass(frozen=True)
+class EnvironmentSettings:
+    name: str
+    log_level: str
+    console_output: bool
+    file_rotation: RotationSettings
+    system_monitoring: SystemMonitoringSettings
+
+
+@dataclass(frozen=True)
+class LoggerSettings:
+    filename: str
+    level: int
+    format: str
+
+
+@dataclass(frozen=True)
+class MonitoringSettings:
+    system_stats: bool
+    performance_threshold_ms: float
+    error_threshold_count: int
+    error_window_seconds: float
+    alert_cooldown_seconds: float
+    process_stats: bool
+    process_uss: bool
+    process_rss_interval_seconds: float
+    session_ttl_seconds: float
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    per_second: float
+    burst: float
+
+
+@dataclass(frozen=True)
+class SamplingSettings:
+    default_rate: float
+    rates: Mapping[str, float]
+    rate_limit: Optional[RateLimit]
+    rate_limits: Mapping[str, RateLimit]
+
+
+@dataclass(frozen=True)
+class SecuritySettings:
+    mask_sensitive_data: bool
+    sensitive_fields: tuple
+
+
+@dataclass(frozen=True)
+class HotReloadSettings:
+    enabled: bool
+    interval_seconds: float
+
+
+@dataclass(frozen=True)
+class Settings:
+    """컴파일된 로깅 설정 (현재 환경 기준, 변경 불가)"""
+    log_dir: str
+    app_name: str
+    encoding: str
+    per_process_files: bool
+    environment: EnvironmentSettings
+    loggers: Mapping[str, LoggerSettings]
+    formats: Mapping[str, str]
+    monitoring: MonitoringSettings
+    sampling: Mapping[str, SamplingSettings]
+    security: SecuritySettings
+    hot_reload: HotReloadSettings
+
+
+def compile_settings(config, environment):
+    """YAML 설정 dict를 검증해 Settings로 변환 (문제가 있으면 ConfigError)
+    
+    없는 값은 기본값을 쓰고, 타입/범위가 틀린 값은 모두 모아서 한 번에
+    보고합니다.
+    """
+    problems = []
+    
+    def section(mapping, key, path):
+        value = mapping.get(key)
+        if value is None:
+            return {}
+        if not isinstance(value, dict):
+            problems.append(f"{path}: 매핑이어야 합니다")
+            return {}
+        return value
+    
+    def value(mapping, key, path, kind, default, minimum=None, maximum=None):
+        raw = mapping.get(key)
+        if raw is None:
+            return default
+        
+        if kind is float and isinstance(raw, (int, float)) and not isinstance(raw, bool):
+            raw = float(raw)
+        elif (kind is int and isinstance(raw, bool)) or not isinstance(raw, kind):
+            problems.append(f"{path}: {KIND_NAMES[kind]} 값이어야 합니다 (현재 {raw!r})")
+            return default
+        
+        if minimum is not None and raw < minimum:
+            problems.append(f"{path}: {minimum} 이상이어야 합니다 (현재 {raw!r})")
+            return default
+        if maximum is not None and raw > maximum:
+            problems.append(f"{path}: {maximum} 이하여야 합니다 (현재 {raw!r})")
+            return default
+        return raw
+    
+    def level(mapping, key, path, default):
+        name = value(mapping, key, path, str, default)
+        if name.upper() not in LOG_LEVELS:
+            problems.append(f"{path}: {', '.join(LOG_LEVELS)} 중 하나여야 합니다 (현재 {name!r})")
+            return default
+        return name.upper()
+    
+    if not isinstance(config, dict):
+        raise ConfigError(["<root>: 매핑이어야 합니다"])
+    
+    # 기본 설정
+    default = section(config, 'default', 'default')
+    encoding = value(default, 'encoding', 'default.encoding', str, 'utf-8')
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        problems.append(f"default.encoding: 알 수 없는 인코딩 {encoding!r}")
+        encoding = 'utf-8'
+    
+    # 현재 환경
+    env_path = f'environments.{environment}'
+    env = section(section(config, 'environments', 'environments'), environment, env_path)
+    rotation = section(env, 'file_rotation', f'{env_path}.file_rotation')
+    system_monitoring = section(env, 'system_monitoring', f'{env_path}.system_monitoring')
+    environment_settings = EnvironmentSettings(
+        name=environment,
+        log_level=level(env, 'log_level', f'{env_path}.log_level', 'INFO'),
+        console_output=value(env, 'console_output', f'{env_path}.console_output', bool, False),
+        file_rotation=RotationSettings(
+            max_bytes=value(rotation, 'max_bytes', f'{env_path}.file_rotation.max_bytes', int, 100_000_000, minimum=0),
+            backup_count=value(rotation, 'backup_count', f'{env_path}.file_rotation.backup_count', int, 30, minimum=0)
+        ),
+        system_monitoring=SystemMonitoringSettings(
+            enabled=value(system_monitoring, 'enabled', f'{env_path}.system_monitoring.enabled', bool, False),
+            interval_seconds=value(system_monitoring, 'interval_seconds',
+                                   f'{env_path}.system_monitoring.interval_seconds', float, 300.0, minimum=0.1)
+        )
+    )
+    
+    # 포맷 (logging.Formatter로 문법 검증)
+    formats = {}
+    for name, format_string in section(config, 'formats', 'formats').items():
+        if not isinstance(format_string, str):
+            problems.append(f"formats.{name}: 문자열이어야 합니다")
+            continue
+        try:
+            logging.Formatter(format_string)
+        except ValueError as e:
+            problems.append(f"formats.{name}: {e}")
+            continue
+        formats[name] = format_string
+    
+    # 로거
+    loggers = {}
+    for name, logger_config in section(config, 'loggers', 'loggers').items():
+        path = f'loggers.{name}'
+        if not isinstance(logger_config, dict):
+            problems.append(f"{path}: 매핑이어야 합니다")
+            continue
+        format_type = value(logger_config, 'format', f'{path}.format', str, 'detailed')
+        if formats and format_type not in formats:
+            problems.append(f"{path}.format: formats에 없는 포맷 {format_type!r}")
+        loggers[name] = LoggerSettings(
+            filename=value(logger_config, 'filename', f'{path}.filename', str, f'{name}.log'),
+            level=getattr(logging, level(logger_config, 'level', f'{path}.level', 'INFO')),
+            format=format_type
+        )
+    
+    # 모니터링
+    monitoring = section(config, 'monitoring', 'monitoring')
+    monitoring_settings = MonitoringSettings(
+        system_stats=value(monitoring, 'system_stats', 'monitoring.system_stats', bool, True),
+        performance_threshold_ms=value(monitoring, 'performance_threshold_ms',
+                                       'monitoring.performance_threshold_ms', float, 5000.0, minimum=0),
+        error_threshold_count=value(monitoring, 'error_threshold_count',
+                                    'monitoring.error_threshold_count', int, 10, minimum=1),
+        error_window_seconds=value(monitoring, 'error_window_seconds',
+                                   'monitoring.error_window_seconds', float, 600.0, minimum=0),
+        alert_cooldown_seconds=value(monitoring, 'alert_cooldown_seconds',
+                                     'monitoring.alert_cooldown_seconds', float, 60.0, minimum=0),
+        process_stats=value(monitoring, 'process_stats', 'monitoring.process_stats', bool, True),
+        process_uss=value(monitoring, 'process_uss', 'monitoring.process_uss', bool, True),
+        process_rss_interval_seconds=value(monitoring, 'process_rss_interval_seconds',
+                                           'monitoring.process_rss_interval_seconds', float, 1.0, minimum=0),
+        session_ttl_seconds=value(monitoring, 'session_ttl_seconds',
+                                  'monitoring.session_ttl_seconds', float, 1800.0, minimum=0)
+    )
+    
+    # 샘플링
+    def rate_limit(mapping, path):
+        if mapping.get('per_second') is None:
+            return None
+        per_second = value(mapping, 'per_second', f'{path}.per_second', float, 0.0, minimum=0)
+        return RateLimit(
+            per_second=per_second,
+            burst=value(mapping, 'burst', f'{path}.burst', float, max(per_second, 1.0), minimum=1)
+        )
+    
+    sampling_section = section(config, 'sampling', 'sampling')
+    sampling = {}
+    for stream in ('access', 'performance'):
+        path = f'sampling.{stream}'
+        rule = section(sampling_section, stream, path)
+        rates = section(rule, 'rates', f'{path}.rates')
+        rate_limits = section(rule, 'rate_limits', f'{path}.rate_limits')
+        sampling[stream] = SamplingSettings(
+            default_rate=value(rule, 'default_rate', f'{path}.default_rate', float, 1.0, minimum=0, maximum=1),
+            rates=MappingProxyType({
+                key: value(rates, key, f'{path}.rates.{key}', float, 1.0, minimum=0, maximum=1)
+                for key in rates
+            }),
+            rate_limit=rate_limit(section(rule, 'rate_limit', f'{path}.rate_limit'), f'{path}.rate_limit'),
+            rate_limits=MappingProxyType({
+                key: limit for key in rate_limits
+                if (limit := rate_limit(section(rate_limits, key, f'{path}.rate_limits.{key}'),
+                                        f'{path}.rate_limits.{key}')) is not None
+            })
+        )
+    
+    # 보안
+    security = section(config, 'security', 'security')
+    sensitive_fields = security.get('sensitive_fields') or []
+    if not isinstance(sensitive_fields, list) or not all(isinstance(field, str) for field in sensitive_fields):
+        problems.append("security.sensitive_fields: 문자열 목록이어야 합니다")
+        sensitive_fields = []
+    
+    hot_reload = section(config, 'hot_reload', 'hot_reload')
+    
+    if problems:
+        raise ConfigError(problems)
+    
+    return Settings(
+        log_dir=value(default, 'log_dir', 'default.log_dir', str, './logs'),
+        app_name=value(default, 'app_name', 'default.app_name', str, 'streamlit-app'),
+        encoding=encoding,
+        per_process_files=value(default, 'per_process_files', 'default.per_process_files', bool, False),
+        environment=environment_settings,
+        loggers=MappingProxyType(loggers),
+        formats=MappingProxyType(formats),
+        monitoring=monitoring_settings,
+        sampling=MappingProxyType(sampling),
+        security=SecuritySettings(
+            mask_sensitive_data=value(security, 'mask_sensitive_data', 'security.mask_sensitive_data', bool, False),
+            sensitive_fields=tuple(sensitive_fields)
+        ),
+        hot_reload=HotReloadSettings(
+            enabled=value(hot_reload, 'enabled', 'hot_reload.enabled', bool, False),
+            interval_seconds=value(hot_reload, 'interval_seconds', 'hot_reload.interval_seconds',
+                                   float, 2.0, minimum=0.1)
+        )
+    )
+
+
+_MISSING = object()
+
+
+class PeriodicTasks:
+    """여러 객체의 주기 작업을 실행하는 프로세스 공용 백그라운드 스레드
+    
+    작업(바인드 메서드)은 약한 참조로만 들고 있으므로 버려진 객체(로거를
+    다시 만든 경우 등)의 작업은 스레드를 남기지 않고 사라지며, 남은 작업이
+    없으면 스레드도 종료됩니다.
+    """
+    
+    def __init__(self, name):
+        self.name = name
+        self._tasks = {}  # (id(객체), 함수) -> [WeakMethod, 주기, 다음 실행 시각 (monotonic)]
+        self._thread = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+    
+    @staticmethod
+    def _key(task):
+        return id(task.__self__), task.__func__
+    
+    def schedule(self, task, interval, delay=None):
+        """task를 interval초마다 실행 (첫 실행은 delay초 뒤, 기본은 interval초 뒤)"""
+        first_run = time.monotonic() + (interval if delay is None else delay)
+        with self._lock:
+            self._tasks[self._key(task)] = [weakref.WeakMethod(task), interval, first_run]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        # 더 이른 작업이 들어왔을 수 있으므로 대기 시간 다시 계산
+        self._wakeup.set()
+    
+    def cancel(self, task):
+        with self._lock:
+            self._tasks.pop(self._key(task), None)
+    
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            timeout = self._run_due()
+            if timeout is None:
+                return
+            self._wakeup.wait(timeout)
+    
+    def _run_due(self):
+        """주기가 된 작업을 실행하고 다음 실행까지 남은 초 반환 (작업이 없으면 None)
+        
+        대기하는 동안 작업 객체 참조를 들고 있지 않도록 별도 메서드에서 처리합니다.
+        """
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for key, entry in list(self._tasks.items()):
+                task = entry[0]()
+                if task is None:
+                    del self._tasks[key]
+                elif entry[2] <= now:
+                    entry[2] = now + entry[1]
+                    due.append(task)
+            if not self._tasks:
+                self._thread = None
+                return None
+            timeout = min(entry[2] for entry in self._tasks.values()) - now
+        for task in due:
+            try:
+                task()
+            except Exception as e:
+                print(f"❌ 주기 작업 실패 ({task}): {e}")
+        return max(timeout, 0)
+
+
+# 설정 파일 감시와 시스템 모니터가 공유하는 주기 작업 스레드 (프로세스당 1개)
+periodic_tasks = PeriodicTasks("log-periodic-tasks")
 
 
 class ConfigManager:
-    """YAML 설정 파일 관리자"""
+    """YAML 설정 파일 관리자 (파일 변경 감시 및 재로드 지원)
+    
+    로드 시 한 번 검증/컴파일한 settings(불변 Settings)를 제공하므로
+    핫패스에서는 점 표기법 조회 대신 속성 접근을 사용합니다.
+    """
     
     def __init__(self, config_file="logging_config.yaml"):
         self.config_file = config_file
+        self.environment = self.get_environment()
+        self._file_signature = self._stat_signature()
+        self._get_cache = {}
         self.config = self._load_config()
+        
+        try:
+            self.settings = compile_settings(self.config, self.environment)
+        except ConfigError as e:
+            self._print_problems("❌ 설정 검증 실패, 기본 설정 사용", e)
+            self.config = self._get_default_config()
+            self.settings = compile_settings(self.config, self.environment)
+        
+        self._watch_callback = None
+        self._reload_lock = threading.Lock()
+    
+    def _stat_signature(self):
+        """변경 감지용 (mtime_ns, size), 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.config_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
     
     def _load_config(self):
         """YAML 설정 파일 로드"""
@@ -26,7 +425,7 @@ class ConfigManager:
             config_path = Path(self.config_file)
             if config_path.exists():
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=YAML_LOADER)
                 print(f"✅ 설정 파일 로드 성공: {self.config_file}")
                 return config
             else:
@@ -36,13 +435,71 @@ class ConfigManager:
             print(f"❌ 설정 파일 로드 실패: {e}, 기본 설정 사용")
             return self._get_default_config()
     
+    @staticmethod
+    def _print_problems(title, error):
+        print(title)
+        for problem in error.problems:
+            print(f"   - {problem}")
+    
+    def reload(self):
+        """설정 파일을 다시 읽어 교체하고 이전 Settings를 반환
+        
+        파일이 바뀌지 않았거나 파싱/검증에 실패하면 현재 설정을 유지하고
+        None을 반환합니다 (잘못 저장된 파일로 기본 설정이 되지 않도록).
+        """
+        with self._reload_lock:
+            signature = self._stat_signature()
+            if signature is None or signature == self._file_signature:
+                return None
+            
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=YAML_LOADER)
+                settings = compile_settings(config, self.environment)
+            except ConfigError as e:
+                self._print_problems("❌ 설정 검증 실패, 현재 설정 유지", e)
+                self._file_signature = signature
+                return None
+            except Exception as e:
+                print(f"❌ 설정 파일 재로드 실패: {e}, 현재 설정 유지")
+                self._file_signature = signature
+                return None
+            
+            old_settings = self.settings
+            self.config, self.settings = config, settings
+            self._get_cache = {}
+            self._file_signature = signature
+            print(f"🔄 설정 파일 재로드: {self.config_file}")
+            return old_settings
+    
+    def watch(self, callback, interval_seconds=2.0):
+        """설정 파일을 주기적으로 확인해 바뀌면 callback(old_settings) 호출 (공용 주기 작업 스레드)"""
+        if self._watch_callback is not None:
+            return
+        self._watch_callback = callback
+        periodic_tasks.schedule(self._check_for_changes, interval_seconds)
+    
+    def _check_for_changes(self):
+        try:
+            old_settings = self.reload()
+            if old_settings is not None and self._watch_callback is not None:
+                self._watch_callback(old_settings)
+        except Exception as e:
+            print(f"❌ 설정 변경 적용 실패: {e}")
+    
+    def stop_watching(self):
+        """설정 파일 감시 중지"""
+        periodic_tasks.cancel(self._check_for_changes)
+        self._watch_callback = None
+    
     def _get_default_config(self):
         """기본 설정 반환"""
         return {
             'default': {
                 'log_dir': './logs',
                 'app_name': 'streamlit-app',
-                'encoding': 'utf-8'
+                'encoding': 'utf-8',
+                'per_process_files': False
             },
             'environments': {
                 'development': {
@@ -51,6 +508,10 @@ class ConfigManager:
                     'file_rotation': {
                         'max_bytes': 50_000_000,
                         'backup_count': 10
+                    },
+                    'system_monitoring': {
+                        'enabled': True,
+                        'interval_seconds': 60
                     }
                 }
             },
@@ -59,28 +520,57 @@ class ConfigManager:
                 'access': {'filename': 'access.log', 'level': 'INFO', 'format': 'access'},
                 'error': {'filename': 'error.log', 'level': 'ERROR', 'format': 'error'},
                 'debug': {'filename': 'debug.log', 'level': 'DEBUG', 'format': 'debug'},
-                'performance': {'filename': 'performance.log', 'level': 'INFO', 'format': 'performance'}
+                'performance': {'filename': 'performance.log', 'level': 'INFO', 'format': 'performance'},
+                'alert': {'filename': 'alert.log', 'level': 'WARNING', 'format': 'alert'}
             },
             'formats': {
                 'detailed': '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
                 'access': '%(asctime)s | ACCESS | %(message)s',
                 'error': '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
                 'debug': '%(asctime)s | DEBUG | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
-                'performance': '%(asctime)s | PERF | %(message)s'
+                'performance': '%(asctime)s | PERF | %(message)s',
+                'alert': '%(asctime)s | ALERT | %(message)s'
+            },
+            'monitoring': {
+                'performance_threshold_ms': 5000,
+                'error_threshold_count': 10,
+                'error_window_seconds': 600,
+                'alert_cooldown_seconds': 60,
+                'process_stats': True,
+                'process_uss': True,
+                'process_rss_interval_seconds': 1.0,
+                'session_ttl_seconds': 1800
+            },
+            'sampling': {
+                'access': {'default_rate': 1.0},
+                'performance': {'default_rate': 1.0}
+            },
+            'security': {
+                'mask_sensitive_data': True,
+                'sensitive_fields': ['password', 'token', 'api_key', 'secret']
+            },
+            'hot_reload': {
+                'enabled': True,
+                'interval_seconds': 2
             }
         }
     
     def get(self, key_path, default=None):
-        """점 표기법으로 설정값 가져오기 (예: 'default.log_dir')"""
-        keys = key_path.split('.')
-        value = self.config
+        """점 표기법으로 원본 설정값 가져오기 (예: 'default.log_dir')
         
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        하위 호환용입니다. 자주 호출되는 경로에서는 settings를 사용하세요.
+        조회 결과는 재로드 전까지 캐시됩니다.
+        """
+        value = self._get_cache.get(key_path, _MISSING)
+        if value is _MISSING:
+            value = self.config
+            try:
+                for key in key_path.split('.'):
+                    value = value[key]
+            except (KeyError, TypeError):
+                value = None
+            self._get_cache[key_path] = value
+        return default if value is None else value
     
     def get_environment(self):
         """현재 환경 감지 (개발/운영)"""
@@ -89,25 +579,474 @@ class ConfigManager:
         return env if env in ['development', 'production'] else 'development'
 
 
+class AlertEvaluator:
+    """monitoring 설정 기반 임계값 알림 평가기
+    
+    StreamlitLogger의 performance_log/error 호출에서 직접 호출되며,
+    에러 윈도우는 최근 error_threshold_count개의 시각만 보관하므로
+    이벤트당 비용이 일정합니다.
+    """
+    
+    def __init__(self, config_manager, alert_logger):
+        self.alert_logger = alert_logger
+        self.callbacks = []
+        self._error_times = deque()
+        self._error_alert_active = False
+        self._last_fired = {}
+        self._lock = threading.Lock()
+        self.configure(config_manager)
+    
+    def configure(self, config_manager):
+        """monitoring 임계값 적용 (재로드 시 최근 에러 시각은 유지)"""
+        monitoring = config_manager.settings.monitoring
+        with self._lock:
+            self.performance_threshold_ms = monitoring.performance_threshold_ms
+            self.error_threshold_count = monitoring.error_threshold_count
+            self.error_window_seconds = monitoring.error_window_seconds
+            self.cooldown_seconds = monitoring.alert_cooldown_seconds
+            self._error_times = deque(self._error_times, maxlen=self.error_threshold_count)
+    
+    def add_callback(self, callback):
+        """알림 콜백 등록 - callback(alert_dict)"""
+        self.callbacks.append(callback)
+    
+    def record_performance(self, operation, duration_ms):
+        """성능 이벤트 평가: 임계값 초과 시 알림 (작업별 쿨다운)"""
+        if duration_ms <= self.performance_threshold_ms:
+            return
+        
+        now = time.monotonic()
+        key = ('slow_operation', operation)
+        with self._lock:
+            if now - self._last_fired.get(key, -self.cooldown_seconds) < self.cooldown_seconds:
+                return
+            self._last_fired[key] = now
+        
+        self._fire(
+            'slow_operation',
+            operation=operation,
+            duration_ms=duration_ms,
+            threshold_ms=self.performance_threshold_ms
+        )
+    
+    def record_error(self, message):
+        """에러 이벤트 평가: 윈도우 내 에러 수가 임계값에 도달하면 알림"""
+        now = time.monotonic()
+        with self._lock:
+            self._error_times.append(now)
+            window_full = (
+                len(self._error_times) == self.error_threshold_count
+                and now - self._error_times[0] <= self.error_window_seconds
+            )
+            
+            # 임계값 아래로 내려가면 다시 알림 가능 상태로 전환
+            if not window_full:
+                self._error_alert_active = False
+                return
+            if self._error_alert_active:
+                return
+            self._error_alert_active = True
+        
+        self._fire(
+            'error_rate',
+            error_count=self.error_threshold_count,
+            window_seconds=self.error_window_seconds,
+            last_error=message
+        )
+    
+    def _fire(self, alert_type, **details):
+        """알림 로그 기록 및 콜백 호출"""
+        alert = {
+            'alert': alert_type,
+            'timestamp': datetime.now().isoformat(),
+            **details
+        }
+        self.alert_logger.warning(json.dumps(alert, ensure_ascii=False, default=str))
+        
+        for callback in self.callbacks:
+            try:
+                callback(alert)
+            except Exception as e:
+                self.alert_logger.error(f"Alert callback failed: {e}")
+
+
+class LogSampler:
+    """sampling 설정 기반 샘플링 + 토큰 버킷 속도 제한기
+    
+    access는 액션별, performance는 작업별로 샘플링 비율(rates)과 토큰
+    버킷(rate_limits)을 적용합니다. 버려진 이벤트도 카운터에 정확히
+    집계되며, 다음에 기록되는 레코드의 sampled_count에 합산되므로 로그
+    분석기의 건수 합계도 유지됩니다. 단 그 레코드는 다른 시간 구간에
+    기록될 수 있고, 버려진 이벤트의 사용자/세션은 남지 않으므로 고유
+    사용자/세션 수는 근사값(과소 집계)이 됩니다.
+    """
+    
+    STREAMS = ('access', 'performance')
+    
+    def __init__(self, config_manager):
+        # (stream, key) -> 카운터 / 마지막 기록 이후 건너뛴 수 / [토큰, 갱신 시각]
+        self.counters = {}
+        self._pending = {}
+        self._buckets = {}
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self.configure(config_manager)
+    
+    def configure(self, config_manager):
+        """sampling 규칙 적용 (재로드 시 카운터는 유지, 토큰 버킷은 새 한도로 재시작)"""
+        with self._lock:
+            self.rules = config_manager.settings.sampling
+            self._buckets = {}
+    
+    def _take_token(self, stream, key, now):
+        """키별 토큰 버킷에서 토큰 1개 사용 (제한 없으면 항상 True)"""
+        rule = self.rules[stream]
+        limit = rule.rate_limits.get(key, rule.rate_limit)
+        if limit is None:
+            return True
+        
+        per_second, burst = limit.per_second, limit.burst
+        bucket = self._buckets.get((stream, key))
+        if bucket is None:
+            bucket = self._buckets[(stream, key)] = [burst, now]
+        else:
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * per_second)
+            bucket[1] = now
+        
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+        return False
+    
+    def sample(self, stream, key, duration_ms=None, force=False):
+        """이벤트를 집계하고 기록 여부 결정
+        
+        기록할 경우 이 레코드가 대표하는 이벤트 수(sampled_count)를, 버릴
+        경우 0을 반환합니다. force=True(에러 등)는 항상 기록합니다.
+        """
+        counter_key = (stream, key)
+        with self._lock:
+            counter = self.counters.get(counter_key)
+            if counter is None:
+                counter = self.counters[counter_key] = {
+                    'seen': 0, 'logged': 0, 'sampled_out': 0, 'rate_limited': 0, 'duration_ms_sum': 0.0
+                }
+            counter['seen'] += 1
+            if duration_ms is not None:
+                counter['duration_ms_sum'] += duration_ms
+            pending = self._pending.get(counter_key, 0) + 1
+            
+            if not force:
+                rule = self.rules.get(stream)
+                rate = rule.rates.get(key, rule.default_rate) if rule else 1.0
+                if rate < 1.0 and self._random.random() >= rate:
+                    counter['sampled_out'] += 1
+                    self._pending[counter_key] = pending
+                    return 0
+                if rule and not self._take_token(stream, key, time.monotonic()):
+                    counter['rate_limited'] += 1
+                    self._pending[counter_key] = pending
+                    return 0
+            
+            counter['logged'] += 1
+            self._pending[counter_key] = 0
+            return pending
+    
+    def get_counters(self):
+        """스트림/키별 정확한 집계 (샘플링/속도 제한으로 버린 이벤트 포함)"""
+        with self._lock:
+            result = {stream: {} for stream in self.STREAMS}
+            for (stream, key), counter in self.counters.items():
+                entry = dict(counter)
+                if stream == 'performance' and counter['seen']:
+                    entry['avg_ms'] = round(counter['duration_ms_sum'] / counter['seen'], 2)
+                else:
+                    entry.pop('duration_ms_sum')
+                result.setdefault(stream, {})[key] = entry
+            return result
+
+
+class ProcessProfiler:
+    """Streamlit 서버 프로세스 자원 프로파일러
+    
+    RSS/USS, 스레드, 열린 FD, I/O 바이트, GC 횟수와 일시정지 시간을
+    샘플링합니다. 데코레이터가 넘겨주는 작업별 RSS 변화량을 누적해 어떤
+    작업이 메모리를 늘리는지 보여주고, 최근 활동한 세션 수로 세션당
+    메모리를 추정합니다. USS는 smaps를 읽어야 하므로 process_uss로 끌 수
+    있습니다. 작업별 RSS 변화량은 호출마다가 아니라 작업당
+    process_rss_interval_seconds에 한 번만 측정합니다 (0이면 매 호출).
+    """
+    
+    # GC 세대별 [횟수, 누적 일시정지 ns, 최대 일시정지 ns]
+    # gc.callbacks는 프로세스 전역이므로 로거가 다시 만들어져도(cache_resource 초기화 등)
+    # 콜백은 프로세스당 한 번만 등록하고 집계도 프로세스 단위로 공유
+    _gc_pauses = {generation: [0, 0, 0] for generation in range(3)}
+    _gc_started_ns = None
+    _gc_lock = threading.Lock()
+    
+    def __init__(self, config_manager):
+        self.include_uss = config_manager.settings.monitoring.process_uss
+        self.session_ttl_seconds = config_manager.settings.monitoring.session_ttl_seconds
+        self.rss_interval_seconds = config_manager.settings.monitoring.process_rss_interval_seconds
+        self.process = psutil.Process()
+        self.baseline_rss = self.process.memory_info().rss
+        
+        self._sessions = {}  # session_id -> 마지막 활동 (monotonic)
+        self._operations = {}  # operation -> [measured_calls, growth_bytes, max_growth_bytes]
+        self._next_measure = {}  # operation -> 다음 RSS 측정 가능 시각 (monotonic)
+        self._lock = threading.Lock()
+        
+        with self._gc_lock:
+            if self._gc_callback not in gc.callbacks:
+                gc.callbacks.append(self._gc_callback)
+        
+        self.process.cpu_percent(interval=None)
+    
+    @classmethod
+    def _gc_callback(cls, phase, info):
+        if phase == 'start':
+            cls._gc_started_ns = time.perf_counter_ns()
+        elif cls._gc_started_ns is not None:
+            pause_ns = time.perf_counter_ns() - cls._gc_started_ns
+            cls._gc_started_ns = None
+            stats = cls._gc_pauses[info['generation']]
+            stats[0] += 1
+            stats[1] += pause_ns
+            stats[2] = max(stats[2], pause_ns)
+    
+    def rss(self):
+        """현재 RSS 바이트 (/proc/self/statm 한 번 읽기)"""
+        return self.process.memory_info().rss
+    
+    def start_measure(self, operation):
+        """이번 호출의 RSS 변화량을 측정할 차례면 시작 RSS, 아니면 None"""
+        if self.rss_interval_seconds:
+            now = time.monotonic()
+            if now < self._next_measure.get(operation, 0):
+                return None
+            self._next_measure[operation] = now + self.rss_interval_seconds
+        return self.rss()
+    
+    def note_session(self, session_id):
+        """세션 활동 기록 (세션당 메모리 추정용)"""
+        self._sessions[session_id] = time.monotonic()
+    
+    def record_operation(self, operation, rss_delta):
+        """측정한 작업 한 번의 RSS 변화량 누적"""
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                self._operations[operation] = [1, rss_delta, rss_delta]
+            else:
+                stats[0] += 1
+                stats[1] += rss_delta
+                stats[2] = max(stats[2], rss_delta)
+    
+    def active_sessions(self):
+        """session_ttl_seconds 이내에 활동한 세션 수"""
+        cutoff = time.monotonic() - self.session_ttl_seconds
+        for session_id in [sid for sid, seen in list(self._sessions.items()) if seen < cutoff]:
+            self._sessions.pop(session_id, None)
+        return len(self._sessions)
+    
+    def top_operations(self, limit=5):
+        """누적 RSS 증가량이 큰 작업"""
+        with self._lock:
+            operations = sorted(self._operations.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [
+            {
+                'operation': operation,
+                'measured_calls': calls,
+                'rss_growth_mb': round(growth / (1024**2), 2),
+                'max_rss_growth_mb': round(max_growth / (1024**2), 2)
+            }
+            for operation, (calls, growth, max_growth) in operations
+        ]
+    
+    def sample(self):
+        """프로세스 자원 샘플"""
+        with self.process.oneshot():
+            memory = self.process.memory_info()
+            stats = {
+                'pid': self.process.pid,
+                'cpu_percent': self.process.cpu_percent(interval=None),
+                'rss_mb': round(memory.rss / (1024**2), 2),
+                'threads': self.process.num_threads()
+            }
+            if hasattr(self.process, 'num_fds'):
+                stats['open_fds'] = self.process.num_fds()
+            if hasattr(self.process, 'io_counters'):
+                try:
+                    io_counters = self.process.io_counters()
+                    stats['io_read_mb'] = round(io_counters.read_bytes / (1024**2), 2)
+                    stats['io_write_mb'] = round(io_counters.write_bytes / (1024**2), 2)
+                except (psutil.AccessDenied, NotImplementedError):
+                    pass
+        
+        if self.include_uss:
+            try:
+                stats['uss_mb'] = round(self.process.memory_full_info().uss / (1024**2), 2)
+            except (psutil.AccessDenied, AttributeError):
+                pass
+        
+        stats['gc'] = {
+            f"gen{generation}": {
+                'collections': collections,
+                'pause_ms_total': round(total_ns / 1e6, 2),
+                'pause_ms_max': round(max_ns / 1e6, 2)
+            }
+            for generation, (collections, total_ns, max_ns) in self._gc_pauses.items()
+        }
+        
+        active_sessions = self.active_sessions()
+        stats['active_sessions'] = active_sessions
+        if active_sessions:
+            growth = max(memory.rss - self.baseline_rss, 0)
+            stats['memory_per_session_mb'] = round(growth / active_sessions / (1024**2), 2)
+        stats['top_memory_operations'] = self.top_operations()
+        return stats
+
+
+class SensitiveDataMasker:
+    """security.sensitive_fields 기반 민감 정보 마스킹
+    
+    키 이름을 소문자로 바꾸고 '_'/'-'를 뺀 뒤 필드 목록을 합친 정규식
+    하나로 검사하므로 'api_key', 'apiKey', 'X-Api-Key'가 모두 걸리고,
+    'user_password'처럼 필드 이름을 포함한 키도 가립니다. 키별 판정은
+    캐시되며, 이미 안전하다고 판정된 키만 있고 중첩 dict/list가 없는
+    일반적인 레코드는 집합 검사 한 번과 값 타입 확인만으로 통과합니다.
+    가릴 것이 없으면 사본을 만들지 않고 원본을 그대로 돌려줍니다.
+    예외 메시지/트레이스백 같은 문자열은 mask_text가 key=value,
+    'key': 'value' 형태의 값을 같은 키 판정으로 가립니다.
+    """
+    
+    MASK = '***'
+    MAX_CACHED_KEYS = 4096
+    CONTAINER_TYPES = frozenset((dict, list, tuple))
+    # key=value, key: value, 'key': 'value', "key"="value" (값은 따옴표 문자열 또는 구분자 전까지)
+    TEXT_VALUE_PATTERN = re.compile(
+        r"""(?P<key>[\w-]+)(?P<sep>['"]?\s*[:=]\s*)(?P<value>'[^']*'|"[^"]*"|[^\s,;&)}\]]+)"""
+    )
+    
+    def __init__(self, sensitive_fields):
+        fields = sorted({self._normalize(field) for field in sensitive_fields if field})
+        self._pattern = re.compile('|'.join(map(re.escape, fields))) if fields else None
+        self._decisions = {}
+        self._safe_keys = set()
+    
+    @staticmethod
+    def _normalize(key):
+        return str(key).lower().replace('_', '').replace('-', '')
+    
+    def is_sensitive(self, key):
+        """키가 민감 필드인지 판정 (결과 캐시)"""
+        sensitive = self._decisions.get(key)
+        if sensitive is None:
+            sensitive = self._pattern is not None and self._pattern.search(self._normalize(key)) is not None
+            if len(self._decisions) >= self.MAX_CACHED_KEYS:
+                self._decisions.clear()
+                self._safe_keys.clear()
+            self._decisions[key] = sensitive
+            if not sensitive:
+                self._safe_keys.add(key)
+        return sensitive
+    
+    def mask(self, data):
+        """dict의 민감 키 값을 가린 사본 반환 (중첩 dict/list 포함, 변경 없으면 원본)"""
+        if self._safe_keys.issuperset(data):
+            containers = self.CONTAINER_TYPES
+            for value in data.values():
+                if type(value) in containers:
+                    break
+            else:
+                return data
+        
+        masked = None
+        decisions = self._decisions
+        for key, value in data.items():
+            sensitive = decisions.get(key)
+            if sensitive is None:
+                sensitive = self.is_sensitive(key)
+            
+            if sensitive:
+                new_value = self.MASK
+            elif type(value) is dict:
+                new_value = self.mask(value)
+            elif type(value) is list or type(value) is tuple:
+                new_value = self._mask_sequence(value)
+            else:
+                continue
+            
+            if new_value is not value:
+                if masked is None:
+                    masked = dict(data)
+                masked[key] = new_value
+        return data if masked is None else masked
+    
+    def mask_text(self, text):
+        """문자열 안의 민감 키 값을 가린 문자열 반환 (필드 이름이 없으면 원본)"""
+        if self._pattern is None or self._pattern.search(self._normalize(text)) is None:
+            return text
+        
+        parts = []
+        position = 0
+        while (match := self.TEXT_VALUE_PATTERN.search(text, position)) is not None:
+            if self.is_sensitive(match.group('key')):
+                value = match.group('value')
+                quote = value[0] if value[0] in '\'"' else ''
+                parts.append(text[position:match.start('value')] + f"{quote}{self.MASK}{quote}")
+                position = match.end()
+            else:
+                # 가리지 않는 키의 값 안에 다른 key=value가 있을 수 있으므로
+                # (예: "failed: password=...") 값 위치부터 다시 검사
+                parts.append(text[position:match.end('sep')])
+                position = match.end('sep')
+        parts.append(text[position:])
+        return ''.join(parts)
+    
+    def _mask_sequence(self, values):
+        masked = None
+        for index, value in enumerate(values):
+            if type(value) is dict:
+                new_value = self.mask(value)
+            elif type(value) is list or type(value) is tuple:
+                new_value = self._mask_sequence(value)
+            else:
+                continue
+            
+            if new_value is not value:
+                if masked is None:
+                    masked = list(values)
+                masked[index] = new_value
+        return values if masked is None else masked
+
+
 class StreamlitLogger:
     """Streamlit 애플리케이션용 통합 로깅 시스템 - YAML 설정 사용"""
     
     def __init__(self, config_file="logging_config.yaml"):
         self.config_manager = ConfigManager(config_file)
-        self.environment = self.config_manager.get_environment()
+        settings = self.config_manager.settings
+        self.environment = settings.environment.name
         
         # 설정값 로드
-        self.log_dir = self.config_manager.get('default.log_dir', './logs')
-        self.app_name = self.config_manager.get('default.app_name', 'streamlit-app')
-        self.encoding = self.config_manager.get('default.encoding', 'utf-8')
+        self.log_dir = settings.log_dir
+        self.app_name = settings.app_name
+        self.encoding = settings.encoding
+        # 여러 서버 프로세스가 log_dir을 공유하면 프로세스별 파일(app.<pid>.log) 사용
+        self.per_process_files = settings.per_process_files
         
         # 환경별 설정
-        env_config = self.config_manager.get(f'environments.{self.environment}', {})
-        self.max_bytes = env_config.get('file_rotation', {}).get('max_bytes', 100_000_000)
-        self.backup_count = env_config.get('file_rotation', {}).get('backup_count', 30)
-        self.console_output = env_config.get('console_output', False)
+        self.max_bytes = settings.environment.file_rotation.max_bytes
+        self.backup_count = settings.environment.file_rotation.backup_count
+        self.console_output = settings.environment.console_output
         
         self.loggers = {}
+        # 재로드 시 살아 있는 핸들러를 조정하기 위한 로거별 핸들러
+        self._file_handlers = {}
+        self._console_handlers = {}
+        # 핸들러를 만들 때 쓴 설정의 포맷 문자열 (재로드 시 비교용)
+        self._handler_formats = {}
         
         # 로그 디렉토리 생성
         os.makedirs(self.log_dir, exist_ok=True)
@@ -117,6 +1056,45 @@ class StreamlitLogger:
         
         # 각종 로거 초기화
         self._setup_loggers()
+        
+        # 임계값 알림 평가기 (alert 로거가 없으면 app 로거 사용)
+        self.alerts = AlertEvaluator(
+            self.config_manager,
+            self.loggers.get('alert', self.loggers.get('app'))
+        )
+        
+        # access/performance 샘플링 및 속도 제한
+        self.sampler = LogSampler(self.config_manager)
+        
+        # 민감 정보 마스킹 (security.mask_sensitive_data)
+        self._security = settings.security
+        self.masker = self._create_masker(settings)
+        
+        # 서버 프로세스 자원 프로파일링 (monitoring.process_stats)
+        self.profiler = (
+            ProcessProfiler(self.config_manager)
+            if settings.monitoring.process_stats else None
+        )
+        
+        # 이 로거에 붙은 SystemMonitor (shutdown 시 함께 중지)
+        self.monitors = weakref.WeakSet()
+        
+        # 설정 파일 변경 시 살아 있는 핸들러에 바로 반영
+        if settings.hot_reload.enabled:
+            self.config_manager.watch(self.apply_config, settings.hot_reload.interval_seconds)
+    
+    def shutdown(self):
+        """설정 파일 감시와 시스템 모니터 샘플링 중지 (로거를 다시 만들기 전에 호출)"""
+        self.config_manager.stop_watching()
+        for monitor in list(self.monitors):
+            monitor.stop()
+    
+    @staticmethod
+    def _create_masker(settings):
+        security = settings.security
+        if not security.mask_sensitive_data or not security.sensitive_fields:
+            return None
+        return SensitiveDataMasker(security.sensitive_fields)
     
     def _print_config_info(self):
         """현재 설정 정보 출력"""
@@ -131,14 +1109,12 @@ class StreamlitLogger:
     def _setup_loggers(self):
         """YAML 설정을 기반으로 모든 로거를 설정합니다"""
         
-        logger_configs = self.config_manager.get('loggers', {})
-        
-        for logger_name, logger_config in logger_configs.items():
+        for logger_name, logger_settings in self.config_manager.settings.loggers.items():
             self.loggers[logger_name] = self._create_logger(
                 name=logger_name,
-                filename=logger_config.get('filename', f'{logger_name}.log'),
-                level=getattr(logging, logger_config.get('level', 'INFO')),
-                format_type=logger_config.get('format', 'detailed')
+                filename=logger_settings.filename,
+                level=logger_settings.level,
+                format_type=logger_settings.format
             )
         
         print(f"✅ {len(self.loggers)}개 로거 초기화 완료: {list(self.loggers.keys())}")
@@ -152,37 +1128,148 @@ class StreamlitLogger:
         logger.handlers.clear()
         
         # 로테이팅 파일 핸들러
-        file_path = os.path.join(self.log_dir, filename)
-        handler = logging.handlers.RotatingFileHandler(
-            file_path,
-            maxBytes=self.max_bytes,
-            backupCount=self.backup_count,
-            encoding=self.encoding
-        )
+        handler = self._create_file_handler(filename)
         
         # 포맷터 설정
         formatter = self._get_formatter(format_type)
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        self._file_handlers[name] = handler
+        self._handler_formats[name] = self._format_string(format_type)
         
         # 콘솔 출력 (개발 환경에서만)
         if self.console_output and self.environment == 'development':
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
+            self._console_handlers[name] = console_handler
         
         logger.propagate = False  # 상위 로거로 전파 방지
         
         return logger
     
+    def _file_path(self, filename):
+        """로거 파일 경로 (per_process_files면 app.log -> app.<pid>.log)"""
+        if self.per_process_files:
+            stem, ext = os.path.splitext(filename)
+            filename = f"{stem}.{os.getpid()}{ext}"
+        return os.path.join(self.log_dir, filename)
+    
+    def _create_file_handler(self, filename):
+        """로테이팅 파일 핸들러 생성"""
+        return logging.handlers.RotatingFileHandler(
+            self._file_path(filename),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding=self.encoding
+        )
+    
+    def apply_config(self, old_settings=None):
+        """재로드된 설정을 살아 있는 로거/핸들러에 반영하고 변경 내역 반환
+        
+        바뀐 레벨/포맷/로테이션 값만 기존 핸들러에 적용하고, 파일을 다시
+        여는 것은 filename이 바뀐 로거뿐입니다. 새 핸들러를 먼저 붙인 뒤
+        이전 핸들러를 떼므로 적용 중에도 레코드가 빠지지 않습니다.
+        log_dir/app_name/encoding/per_process_files 변경은 재시작이 필요합니다.
+        """
+        settings = self.config_manager.settings
+        changes = []
+        
+        # 로테이션 / 콘솔 출력 (환경별 설정)
+        max_bytes = settings.environment.file_rotation.max_bytes
+        backup_count = settings.environment.file_rotation.backup_count
+        if (max_bytes, backup_count) != (self.max_bytes, self.backup_count):
+            self.max_bytes, self.backup_count = max_bytes, backup_count
+            for handler in self._file_handlers.values():
+                handler.acquire()
+                try:
+                    handler.maxBytes = max_bytes
+                    handler.backupCount = backup_count
+                finally:
+                    handler.release()
+            changes.append(f"rotation: max_bytes={max_bytes}, backup_count={backup_count}")
+        
+        console_output = settings.environment.console_output
+        if console_output != self.console_output:
+            self.console_output = console_output
+            changes.append(f"console_output: {console_output}")
+        
+        # 로거별 레벨 / 포맷 / 파일
+        for name, logger_settings in settings.loggers.items():
+            filename, level = logger_settings.filename, logger_settings.level
+            
+            logger = self.loggers.get(name)
+            if logger is None:
+                self.loggers[name] = self._create_logger(name, filename, level, logger_settings.format)
+                changes.append(f"{name}: 새 로거 ({filename})")
+                continue
+            
+            if logger.level != level:
+                logger.setLevel(level)
+                changes.append(f"{name}: level={logging.getLevelName(level)}")
+            
+            handler = self._file_handlers[name]
+            format_string = self._format_string(logger_settings.format)
+            if format_string != self._handler_formats.get(name):
+                # 다른 스레드의 emit이 포맷하는 도중에 바뀌지 않도록 핸들러 락 안에서 교체
+                formatter = self._get_formatter(logger_settings.format)
+                for target in filter(None, (handler, self._console_handlers.get(name))):
+                    target.acquire()
+                    try:
+                        target.setFormatter(formatter)
+                    finally:
+                        target.release()
+                self._handler_formats[name] = format_string
+                changes.append(f"{name}: format 변경")
+            
+            if os.path.abspath(handler.baseFilename) != os.path.abspath(self._file_path(filename)):
+                new_handler = self._create_file_handler(filename)
+                new_handler.setFormatter(handler.formatter)
+                logger.addHandler(new_handler)
+                logger.removeHandler(handler)
+                handler.close()
+                self._file_handlers[name] = new_handler
+                changes.append(f"{name}: filename={filename}")
+            
+            wants_console = self.console_output and self.environment == 'development'
+            console_handler = self._console_handlers.get(name)
+            if wants_console and console_handler is None:
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(self._file_handlers[name].formatter)
+                logger.addHandler(console_handler)
+                self._console_handlers[name] = console_handler
+            elif not wants_console and console_handler is not None:
+                logger.removeHandler(console_handler)
+                del self._console_handlers[name]
+        
+        # 알림 임계값 / 샘플링 규칙
+        self.alerts.configure(self.config_manager)
+        self.sampler.configure(self.config_manager)
+        
+        if settings.security != self._security:
+            self._security = settings.security
+            self.masker = self._create_masker(settings)
+            changes.append(f"security: mask_sensitive_data={self.masker is not None}")
+        
+        if old_settings is not None:
+            for option in ('log_dir', 'app_name', 'encoding', 'per_process_files'):
+                if getattr(old_settings, option) != getattr(settings, option):
+                    changes.append(f"default.{option}: 재시작 후 적용")
+        
+        if changes:
+            self.loggers['app'].info(f"설정 변경 적용 | {' | '.join(changes)}")
+        return changes
+    
+    def _format_string(self, format_type):
+        """포맷 타입의 설정 포맷 문자열"""
+        formats = self.config_manager.settings.formats
+        return formats.get(format_type, formats.get('detailed', 
+            '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'))
+    
     def _get_formatter(self, format_type):
         """포맷 타입별 포맷터를 반환합니다"""
-        formats = self.config_manager.get('formats', {})
-        format_string = formats.get(format_type, formats.get('detailed', 
-            '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'))
-        
         return logging.Formatter(
-            format_string,
+            self._format_string(format_type),
             datefmt='%Y-%m-%d %H:%M:%S'
         )
     
@@ -203,11 +1290,20 @@ class StreamlitLogger:
         extra_info = self._format_extra_info(**kwargs)
         error_msg = f"{message} {extra_info}"
         
-        if exception:
+        if exception and self.masker is not None:
+            # 예외 메시지와 트레이스백에도 비밀번호/토큰 값이 들어갈 수 있으므로 가린 뒤 기록
+            error_msg += f" | Exception: {str(exception)}"
+            if exception.__traceback__ is not None:
+                error_msg += "\n" + ''.join(traceback.format_exception(
+                    type(exception), exception, exception.__traceback__)).rstrip('\n')
+            self.loggers['error'].error(self.masker.mask_text(error_msg))
+        elif exception:
             error_msg += f" | Exception: {str(exception)}"
             self.loggers['error'].error(error_msg, exc_info=True)
         else:
             self.loggers['error'].error(error_msg)
+        
+        self.alerts.record_error(message)
     
     def debug(self, message, **kwargs):
         """디버그 로그"""
@@ -215,7 +1311,14 @@ class StreamlitLogger:
         self.loggers['debug'].debug(f"{message} {extra_info}")
     
     def access_log(self, user_id, session_id, action, page=None, **kwargs):
-        """사용자 접근 로그"""
+        """사용자 접근 로그 (sampling.access 설정 적용)"""
+        if self.profiler is not None:
+            self.profiler.note_session(session_id)
+        
+        sampled_count = self.sampler.sample('access', action)
+        if not sampled_count:
+            return
+        
         access_info = {
             'user_id': user_id,
             'session_id': session_id,
@@ -223,23 +1326,43 @@ class StreamlitLogger:
             'page': page,
             **kwargs
         }
+        if self.masker is not None:
+            access_info = self.masker.mask(access_info)
+        if sampled_count > 1:
+            access_info['sampled_count'] = sampled_count
         self.loggers['access'].info(json.dumps(access_info, ensure_ascii=False))
     
     def performance_log(self, operation, duration, **kwargs):
-        """성능 로그"""
+        """성능 로그 (sampling.performance 설정 적용, 실패한 작업은 항상 기록)"""
+        duration_ms = round(duration * 1000, 2)
+        # 알림 평가는 샘플링과 무관하게 모든 호출에 대해 수행
+        self.alerts.record_performance(operation, duration_ms)
+        
+        sampled_count = self.sampler.sample(
+            'performance', operation, duration_ms, force=kwargs.get('status') == 'error'
+        )
+        if not sampled_count:
+            return
+        
         perf_info = {
             'operation': operation,
-            'duration_ms': round(duration * 1000, 2),
+            'duration_ms': duration_ms,
             'timestamp': datetime.now().isoformat(),
             'environment': self.environment,
             **kwargs
         }
+        if self.masker is not None:
+            perf_info = self.masker.mask(perf_info)
+        if sampled_count > 1:
+            perf_info['sampled_count'] = sampled_count
         self.loggers['performance'].info(json.dumps(perf_info, ensure_ascii=False))
     
     def _format_extra_info(self, **kwargs):
         """추가 정보를 포맷팅합니다"""
         if not kwargs:
             return ""
+        if self.masker is not None:
+            kwargs = self.masker.mask(kwargs)
         return "| " + " | ".join([f"{k}={v}" for k, v in kwargs.items()])
     
     def get_config_info(self):
@@ -251,8 +1374,13 @@ class StreamlitLogger:
             'max_bytes_mb': self.max_bytes // (1024*1024),
             'backup_count': self.backup_count,
             'console_output': self.console_output,
+            'per_process_files': self.per_process_files,
             'loggers': list(self.loggers.keys())
         }
+    
+    def get_sampling_stats(self):
+        """샘플링/속도 제한과 무관한 정확한 access/performance 집계"""
+        return self.sampler.get_counters()
 
 
 class LoggingDecorators:
@@ -261,11 +1389,6 @@ class LoggingDecorators:
     def __init__(self, logger: StreamlitLogger):
         self.logger = logger
         self.config_manager = logger.config_manager
-        
-        # 성능 임계값 설정에서 가져오기
-        self.performance_threshold_ms = self.config_manager.get(
-            'monitoring.performance_threshold_ms', 5000
-        )
     
     def log_execution_time(self, operation_name=None):
         """함수 실행 시간을 로깅하는 데코레이터"""
@@ -274,23 +1397,19 @@ class LoggingDecorators:
             def wrapper(*args, **kwargs):
                 start_time = time.time()
                 operation = operation_name or func.__name__
+                profiler = self.logger.profiler
+                rss_before = profiler.start_measure(operation) if profiler is not None else None
                 
                 try:
                     result = func(*args, **kwargs)
                     duration = time.time() - start_time
                     
-                    # 성능 임계값 체크
-                    if duration * 1000 > self.performance_threshold_ms:
-                        self.logger.warning(
-                            f"Slow operation detected: {operation}",
-                            duration_ms=round(duration * 1000, 2),
-                            threshold_ms=self.performance_threshold_ms
-                        )
-                    
+                    # 성능 임계값 체크는 performance_log의 AlertEvaluator가 담당
                     self.logger.performance_log(
                         operation=operation,
                         duration=duration,
-                        status='success'
+                        status='success',
+                        **self._memory_delta(operation, rss_before)
                     )
                     return result
                 except Exception as e:
@@ -299,12 +1418,21 @@ class LoggingDecorators:
                         operation=operation,
                         duration=duration,
                         status='error',
-                        error=str(e)
+                        error=str(e),
+                        **self._memory_delta(operation, rss_before)
                     )
                     raise
             return wrapper
         return decorator
     
+    def _memory_delta(self, operation, rss_before):
+        """측정한 호출의 작업 전후 RSS 변화량을 프로파일러에 누적하고 로그 필드로 반환"""
+        if rss_before is None:
+            return {}
+        rss_delta = self.logger.profiler.rss() - rss_before
+        self.logger.profiler.record_operation(operation, rss_delta)
+        return {'rss_delta_mb': round(rss_delta / (1024**2), 3)}
+    
     def log_user_action(self, action_name=None):
         """사용자 액션을 로깅하는 데코레이터"""
         def decorator(func):
@@ -332,12 +1460,20 @@ class LoggingDecorators:
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    masker = self.logger.masker
+                    if masker is not None:
+                        # 위치 인자는 키가 없어 민감 여부를 알 수 없으므로 타입만 기록
+                        args_info = str([type(arg).__name__ for arg in args])[:200]
+                        kwargs_info = masker.mask_text(str(masker.mask(kwargs)))[:200]
+                    else:
+                        args_info = str(args)[:200]  # 너무 길면 자름
+                        kwargs_info = str(kwargs)[:200]
                     self.logger.error(
                         f"Error in {func.__name__}",
                         exception=e,
                         function=func.__name__,
-                        args=str(args)[:200],  # 너무 길면 자름
-                        kwargs=str(kwargs)[:200]
+                        args=args_info,
+                        kwargs=kwargs_info
                     )
                     if reraise:
                         raise
@@ -347,53 +1483,110 @@ class LoggingDecorators:
     
     def _get_user_id(self):
         """현재 사용자 ID 추출 (세션 상태에서)"""
+        import streamlit as st
         return getattr(st.session_state, 'user_id', 'anonymous')
     
     def _get_session_id(self):
         """현재 세션 ID 추출"""
+        import streamlit as st
         return getattr(st.session_state, 'session_id', 'unknown')
 
 
 class SystemMonitor:
-    """시스템 리소스 모니터링 - 설정 기반"""
+    """시스템 리소스 모니터링 - 설정 기반
     
-    def __init__(self, logger: StreamlitLogger):
+    environments.<env>.system_monitoring.enabled이면 interval_seconds마다
+    공용 주기 작업 스레드가 샘플을 수집해 링 버퍼에 보관하고 performance
+    로그에 기록합니다. UI는 get_latest()/get_history()로 즉시 읽습니다.
+    CPU 사용률은 직전 샘플 이후 평균(psutil.cpu_percent(interval=None))
+    이므로 호출 스레드를 막지 않습니다.
+    샘플링은 모니터 객체가 살아 있는 동안만 계속됩니다.
+    """
+    
+    def __init__(self, logger: StreamlitLogger, history_size=120):
         self.logger = logger
         self.config_manager = logger.config_manager
-        self.monitoring_enabled = self.config_manager.get('monitoring.system_stats', True)
+        settings = self.config_manager.settings
+        self.monitoring_enabled = settings.monitoring.system_stats
+        
+        system_monitoring = settings.environment.system_monitoring
+        self.sampling_enabled = self.monitoring_enabled and system_monitoring.enabled
+        self.interval_seconds = system_monitoring.interval_seconds
+        
+        self.samples = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        logger.monitors.add(self)
+        
+        # 첫 cpu_percent(interval=None) 호출은 기준점만 잡고 0.0을 반환
+        psutil.cpu_percent(interval=None)
+        
+        if self.sampling_enabled:
+            self.start()
+    
+    def start(self):
+        """백그라운드 샘플링 시작 (CPU 기준점 이후 최소 1초가 지나야 의미 있는 값이 나옴)"""
+        periodic_tasks.schedule(self.log_system_stats, self.interval_seconds,
+                                delay=min(1, self.interval_seconds))
+    
+    def stop(self):
+        """백그라운드 샘플링 중지"""
+        periodic_tasks.cancel(self.log_system_stats)
+    
+    def _collect(self):
+        """현재 시스템 샘플 (블로킹 없음)"""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        sample = {
+            'timestamp': datetime.now().isoformat(),
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_percent': memory.percent,
+            'memory_available_gb': round(memory.available / (1024**3), 2),
+            'disk_percent': disk.percent,
+            'disk_free_gb': round(disk.free / (1024**3), 2)
+        }
+        if self.logger.profiler is not None:
+            sample['process'] = self.logger.profiler.sample()
+        return sample
     
     def log_system_stats(self):
-        """시스템 통계를 로깅합니다"""
+        """시스템 통계를 수집해 링 버퍼에 넣고 로깅합니다"""
         if not self.monitoring_enabled:
             self.logger.debug("시스템 모니터링이 비활성화됨")
-            return
+            return None
         
         try:
-            # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # 메모리 사용률
-            memory = psutil.virtual_memory()
-            
-            # 디스크 사용률
-            disk = psutil.disk_usage('/')
-            
-            system_stats = {
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_available_gb': round(memory.available / (1024**3), 2),
-                'disk_percent': disk.percent,
-                'disk_free_gb': round(disk.free / (1024**3), 2)
-            }
+            sample = self._collect()
+            with self._lock:
+                self.samples.append(sample)
             
+            stats = {key: value for key, value in sample.items() if key not in ('timestamp', 'process')}
             self.logger.performance_log(
                 operation='system_monitor',
                 duration=0,
-                **system_stats
+                **stats
             )
-            
+            if 'process' in sample:
+                self.logger.performance_log(
+                    operation='process_monitor',
+                    duration=0,
+                    **sample['process']
+                )
+            return sample
         except Exception as e:
             self.logger.error("Failed to collect system stats", exception=e)
+            return None
+    
+    def get_latest(self):
+        """가장 최근 샘플 (아직 없으면 즉시 한 번 수집)"""
+        with self._lock:
+            if self.samples:
+                return self.samples[-1]
+        return self.log_system_stats()
+    
+    def get_history(self):
+        """링 버퍼의 샘플 (오래된 것부터)"""
+        with self._lock:
+            return list(self.samples)
 
 
 # === 설정 기반 초기화 ===
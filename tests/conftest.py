@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+# 저장소 루트의 단일 파일 모듈(log_analyzer, logging_config 등)을 import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
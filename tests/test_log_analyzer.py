@@ -0,0 +1,229 @@
+# tests/test_log_analyzer.py
+import gzip
+import importlib.util
+import json
+import logging
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from log_analyzer import (PARQUET_DIR, _fingerprint_error, IncrementalLogAnalyzer, LogAnalyzer, LogManager, LogTailer,
+                          VectorizedLogAnalyzer)
+from logging_config import LoggingDecorators, OperationHistogram, StreamlitLogger, segment_compressor
+
+
+def make_logger(log_dir, max_bytes=2000, **kwargs):
+    """로테이션이 자주 일어나도록 access 핸들러의 maxBytes를 줄인 로거"""
+    logger = StreamlitLogger(log_dir=str(log_dir), app_name=f"test_{log_dir.name}", **kwargs)
+    for handler in logger.loggers['access'].handlers:
+        if isinstance(handler, logging.handlers.RotatingFileHandler):
+            handler.maxBytes = max_bytes
+    return logger
+
+
+# === 증분 분석: 로테이션 ===
+
+def test_incremental_counts_every_record_across_compressed_rotations(tmp_path):
+    """압축된 세그먼트의 inode가 새 파일에 재사용되어도 로테이션된 레코드를 빠뜨리지 않음"""
+    logger = make_logger(tmp_path, compress_backups=True)
+    analyzer = IncrementalLogAnalyzer(tmp_path)
+    # 아직 빈 access.log에서 체크포인트를 잡은 뒤 폴링 사이에 여러 번 로테이션
+    analyzer.update()
+    
+    for i in range(100):
+        logger.access_log(user_id=f"user{i % 7}", session_id=f"s{i}", action="click", page="main")
+        if i % 45 == 44:
+            segment_compressor.wait()
+            analyzer.update()
+    segment_compressor.wait()
+    
+    assert list(tmp_path.glob("access.log.*.gz"))
+    incremental = analyzer.generate_report()['user_activity']
+    full_scan = LogAnalyzer(tmp_path).analyze_user_activity()
+    assert full_scan['total_activities'] == 100
+    assert incremental['total_activities'] == 100
+    assert incremental['unique_sessions'] == full_scan['unique_sessions']
+
+
+def test_incremental_state_survives_reload_without_double_counting(tmp_path):
+    """상태 파일에서 다시 로드한 분석기는 이미 센 로테이션 세그먼트를 다시 세지 않음"""
+    logger = make_logger(tmp_path, compress_backups=True)
+    for i in range(60):
+        logger.access_log(user_id="u", session_id=f"s{i}", action="view")
+    segment_compressor.wait()
+    IncrementalLogAnalyzer(tmp_path).update()
+    
+    for i in range(60, 90):
+        logger.access_log(user_id="u", session_id=f"s{i}", action="view")
+    segment_compressor.wait()
+    
+    report = IncrementalLogAnalyzer(tmp_path).generate_report()['user_activity']
+    assert report['total_activities'] == 90
+
+
+# === 요약/샘플링 레코드 가중 집계 ===
+
+def write_performance_records(path, timestamp):
+    """일반/샘플링(sampled_count)/구간 요약(type=summary) 레코드가 섞인 performance.log"""
+    histogram = OperationHistogram()
+    for duration_ms in range(1, 51):
+        histogram.add(duration_ms * 1_000_000)
+    summary = histogram.summary()
+    records = [
+        {'operation': 'load', 'duration_ms': 12.5, 'status': 'success'},
+        {'operation': 'load', 'duration_ms': 80.0, 'status': 'success', 'sampled_count': 10},
+        {'operation': 'query', 'duration_ms': 3.0, 'status': 'success'},
+        {'operation': 'load', 'type': 'summary', 'duration_ms': summary.pop('avg_ms'), 'status': 'success',
+         **summary, 'interval_seconds': 60, 'histogram': histogram.to_state()},
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(f"{timestamp} | PERF | {json.dumps(record)}\n")
+
+
+def test_vectorized_performance_weights_summary_and_sampled_records(tmp_path):
+    """요약 레코드는 count/sum/min/max로, 샘플링 레코드는 sampled_count로 가중 (루프 경로와 같은 결과)"""
+    write_performance_records(tmp_path / "performance.log", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    
+    loop = LogAnalyzer(tmp_path).analyze_performance()
+    vectorized = VectorizedLogAnalyzer(tmp_path).analyze_performance()
+    
+    assert loop['load']['count'] == 1 + 10 + 50
+    assert loop['load']['max_ms'] == 80.0
+    assert loop['load']['min_ms'] == 1.0
+    assert vectorized == loop
+
+
+def test_vectorized_user_activity_weights_sampled_records(tmp_path):
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with open(tmp_path / "access.log", 'w', encoding='utf-8') as f:
+        for record in ({'user_id': 'a', 'session_id': 's1', 'action': 'view', 'sampled_count': 5},
+                       {'user_id': 'b', 'session_id': 's2', 'action': 'click'}):
+            f.write(f"{timestamp} | ACCESS | {json.dumps(record)}\n")
+    
+    loop = LogAnalyzer(tmp_path).analyze_user_activity()
+    vectorized = VectorizedLogAnalyzer(tmp_path).analyze_user_activity()
+    
+    assert loop['total_activities'] == 6
+    assert vectorized == loop
+
+
+def test_performance_history_weights_compacted_records(tmp_path):
+    """Parquet 컴팩션 후에도 요약/샘플링 레코드의 호출 수와 최소/최대가 유지됨"""
+    write_performance_records(tmp_path / "performance.log.1", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    (tmp_path / "performance.log").touch()
+    LogManager(tmp_path).compact_rotated_logs()
+    
+    history = LogAnalyzer(tmp_path).analyze_performance_history()
+    loop = LogAnalyzer(tmp_path).analyze_performance()
+    
+    for operation in ('load', 'query'):
+        assert history[operation] == {key: loop[operation][key] for key in ('count', 'avg_ms', 'max_ms', 'min_ms')}
+
+
+def test_compaction_upgrades_parquet_files_without_weight_columns(tmp_path):
+    """이전 스키마(가중치 컬럼 없음)로 변환된 파일이 있어도 조회가 깨지지 않음"""
+    import pandas as pd
+    
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    partition = tmp_path / PARQUET_DIR / "performance" / f"date={timestamp[:10]}"
+    partition.mkdir(parents=True)
+    pd.DataFrame({
+        'timestamp': pd.to_datetime([timestamp]),
+        'operation': pd.Categorical(['load']),
+        'duration_ms': [20.0],
+        'status': pd.Categorical(['success']),
+        'extra': pd.array([json.dumps({'sampled_count': 4})], dtype='string')
+    }).to_parquet(partition / "old.parquet", index=False)
+    with open(tmp_path / PARQUET_DIR / "_manifest.json", 'w', encoding='utf-8') as f:
+        json.dump({'old': {'stream': 'performance', 'segment': 'performance.log.1', 'rows': 1}}, f)
+    
+    write_performance_records(tmp_path / "performance.log.1", timestamp)
+    LogManager(tmp_path).compact_rotated_logs()
+    
+    history = LogAnalyzer(tmp_path).analyze_performance_history()
+    assert history['load']['count'] == 4 + 1 + 10 + 50
+    assert history['load']['max_ms'] == 80.0
+
+
+# === 실시간 추적 ===
+
+@pytest.mark.parametrize('compress_backups', [False, True])
+def test_tailer_reads_every_segment_rotated_between_polls(tmp_path, compress_backups):
+    """폴링 사이에 여러 번 로테이션되어도 중간 세그먼트의 레코드를 빠뜨리지 않음"""
+    logger = make_logger(tmp_path, compress_backups=compress_backups)
+    tailer = LogTailer(tmp_path, window_seconds=3600)
+    tailer.poll()
+    
+    for i in range(100):
+        logger.access_log(user_id=f"user{i}", session_id=f"s{i}", action="click", page="main")
+    if compress_backups:
+        segment_compressor.wait()
+    assert len(list(tmp_path.glob("access.log.*"))) >= 3
+    
+    tailer.poll()
+    tailer.stop()
+    assert tailer.snapshot()['requests'] == 100
+
+
+# === 에러 지문 ===
+
+def _failing_call(func):
+    with pytest.raises(ValueError) as info:
+        func()
+    return ''.join(traceback.format_exception(info.value)).splitlines()
+
+
+def test_fingerprint_ignores_logging_decorator_frames(tmp_path):
+    """데코레이터를 몇 겹 씌우든 같은 에러는 같은 지문과 같은 최상위 프레임을 가짐"""
+    decorators = LoggingDecorators(StreamlitLogger(log_dir=str(tmp_path), app_name="test_fingerprint"))
+    
+    def fail():
+        raise ValueError("bad value 42")
+    
+    plain = _fingerprint_error('header', _failing_call(fail))
+    wrapped = _fingerprint_error('header', _failing_call(
+        decorators.log_errors()(decorators.log_execution_time(aggregate=False)(fail))))
+    
+    assert wrapped[0] == plain[0]
+    assert not any(frame.startswith('logging_config') for frame in wrapped[2])
+    assert wrapped[2][-1].endswith(':fail')
+
+
+# === 백업 ===
+
+def test_every_backup_snapshot_contains_unchanged_files(tmp_path):
+    """변경 없는 파일도 다시 압축하지 않고 새 스냅샷에 들어가 스냅샷 하나로 복원 가능"""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "app.log").write_text("unchanged\n", encoding='utf-8')
+    (log_dir / "access.log").write_text("first\n", encoding='utf-8')
+    manager = LogManager(log_dir)
+    
+    first_dir, first = manager.backup_logs(tmp_path / "backup")
+    (log_dir / "access.log").write_text("first\nsecond\n", encoding='utf-8')
+    second_dir, second = manager.backup_logs(tmp_path / "backup")
+    
+    assert sorted(first) == [str(log_dir / "access.log"), str(log_dir / "app.log")]
+    assert second == [str(log_dir / "access.log")]
+    assert second_dir != first_dir
+    snapshot = {path.name: gzip.decompress(path.read_bytes()) for path in Path(second_dir).iterdir()}
+    assert snapshot == {'app.log.gz': b"unchanged\n", 'access.log.gz': b"first\nsecond\n"}
+
+
+def test_backup_falls_back_to_gzip_without_zstandard(tmp_path):
+    """zstandard가 없으면 파일마다 실패하지 않고 gzip으로 백업"""
+    if importlib.util.find_spec('zstandard') is not None:
+        pytest.skip("zstandard is installed")
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "app.log").write_text("line\n", encoding='utf-8')
+    
+    backup_dir, backed_up = LogManager(log_dir).backup_logs(tmp_path / "backup", compression='zstd')
+    
+    assert backed_up == [str(log_dir / "app.log")]
+    assert [path.name for path in Path(backup_dir).iterdir()] == ['app.log.gz']
+    with pytest.raises(ValueError):
+        LogManager(log_dir).backup_logs(tmp_path / "backup", compression='lz4')
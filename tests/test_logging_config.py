@@ -0,0 +1,66 @@
+# tests/test_logging_config.py
+import threading
+import time
+
+from logging_config import StreamlitLogger, SystemMonitor
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+# === 주기 작업 스레드 ===
+
+def test_rebuilt_loggers_share_one_periodic_thread(tmp_path):
+    """로거를 여러 번 다시 만들어도 작업 요약/버퍼 플러시/모니터가 스레드를 늘리지 않음"""
+    baseline = threading.active_count()
+    for _ in range(5):
+        logger = StreamlitLogger(log_dir=str(tmp_path), app_name="test_periodic", buffered_streams=('access',),
+                                 metrics_flush_interval=0.05)
+        monitor = SystemMonitor(logger, interval_seconds=0.05)
+        logger.record_operation('load_data', 1_000_000)
+    
+    assert threading.active_count() <= baseline + 1
+    assert wait_until(lambda: '"summary"' in (tmp_path / "performance.log").read_text(encoding='utf-8'))
+    assert wait_until(lambda: len(monitor.samples) >= 2)
+    logger.shutdown()
+
+
+def test_shutdown_stops_periodic_work(tmp_path):
+    """shutdown 이후에는 모니터 샘플링과 작업 요약 기록이 멈춤"""
+    logger = StreamlitLogger(log_dir=str(tmp_path), app_name="test_shutdown", metrics_flush_interval=0.05)
+    monitor = SystemMonitor(logger, interval_seconds=0.05)
+    assert wait_until(lambda: len(monitor.samples) >= 1)
+    
+    logger.shutdown()
+    samples = len(monitor.samples)
+    logger.record_operation('load_data', 1_000_000)
+    time.sleep(0.3)
+    
+    assert len(monitor.samples) == samples
+    assert '"summary"' not in (tmp_path / "performance.log").read_text(encoding='utf-8')
+
+
+# === 비동기 모드 ===
+
+def test_logging_after_async_shutdown_does_not_block(tmp_path):
+    """리스너를 멈춘 뒤의 로그 호출은 큐가 가득 차도 'block' 정책에서 대기하지 않음"""
+    logger = StreamlitLogger(log_dir=str(tmp_path), app_name="test_async_shutdown", async_mode=True,
+                             queue_size=5, overflow_policy='block')
+    logger.info("before shutdown")
+    logger.shutdown()
+    
+    def log_after_shutdown():
+        for i in range(50):
+            logger.access_log(user_id="user", session_id="s", action=f"late{i}")
+    
+    thread = threading.Thread(target=log_after_shutdown, daemon=True)
+    thread.start()
+    thread.join(timeout=3)
+    assert not thread.is_alive()
+    assert "before shutdown" in (tmp_path / "app.log").read_text(encoding='utf-8')
@@ -0,0 +1,196 @@
+# tests/test_logging_config_with_yaml.py
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from log_analyzer import LogAnalyzer
+from logging_config_with_yaml import LoggingDecorators, SensitiveDataMasker, StreamlitLogger, SystemMonitor
+
+SHIPPED_CONFIG = Path(__file__).resolve().parent.parent / "logging_config.yaml"
+
+
+def write_config(tmp_path, update=None):
+    """배포 설정을 기반으로 tmp_path에 로그를 쓰는 설정 파일 생성"""
+    with open(SHIPPED_CONFIG, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['default']['log_dir'] = str(tmp_path / "logs")
+    config['default']['app_name'] = f"test_{tmp_path.name}"
+    config['environments']['development']['console_output'] = False
+    config['hot_reload']['interval_seconds'] = 0.1
+    if update:
+        update(config)
+    config_file = tmp_path / "logging_config.yaml"
+    with open(config_file, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(config, f, allow_unicode=True)
+    return config_file
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+# === 핫 리로드 ===
+
+def set_app_level(level):
+    def update(config):
+        config['loggers']['app']['level'] = level
+    return update
+
+
+def test_hot_reload_applies_changes_until_shutdown(tmp_path):
+    """설정 파일 변경이 살아 있는 로거에 반영되고 shutdown 이후에는 감시가 멈춤"""
+    config_file = write_config(tmp_path)
+    logger = StreamlitLogger(str(config_file))
+    assert logger.log_dir == str(tmp_path / "logs")  # 검증 실패로 기본 설정이 쓰이지 않았는지
+    app_logger = logger.loggers['app']
+    assert app_logger.level == logging.INFO
+    
+    time.sleep(0.01)  # mtime_ns가 확실히 바뀌도록
+    write_config(tmp_path, set_app_level('WARNING'))
+    assert wait_until(lambda: app_logger.level == logging.WARNING)
+    
+    logger.shutdown()
+    write_config(tmp_path, set_app_level('ERROR'))
+    time.sleep(0.3)
+    assert app_logger.level == logging.WARNING
+
+
+def test_hot_reload_keeps_current_settings_on_invalid_file(tmp_path):
+    """검증에 실패한 설정 파일은 무시하고, 다음 올바른 변경(포맷 포함)은 반영"""
+    config_file = write_config(tmp_path)
+    logger = StreamlitLogger(str(config_file))
+    app_logger = logger.loggers['app']
+    
+    time.sleep(0.01)
+    write_config(tmp_path, set_app_level('LOUD'))
+    time.sleep(0.3)
+    assert app_logger.level == logging.INFO
+    assert logger.config_manager.settings.loggers['app'].level == logging.INFO
+    
+    def change_access_format(config):
+        config['formats']['access'] = "%(asctime)s | ACCESS2 | %(message)s"
+    write_config(tmp_path, change_access_format)
+    assert wait_until(lambda: logger.config_manager.settings.formats['access'].startswith("%(asctime)s | ACCESS2"))
+    logger.access_log(user_id='alice', session_id='s', action='view')
+    logger.shutdown()
+    
+    assert "| ACCESS2 |" in (tmp_path / "logs" / "access.log").read_text(encoding='utf-8')
+
+
+def test_rebuilt_loggers_share_one_periodic_thread(tmp_path):
+    """로거를 여러 번 다시 만들어도 설정 감시/모니터가 스레드를 늘리지 않음"""
+    def enable_monitoring(config):
+        config['environments']['development']['system_monitoring']['interval_seconds'] = 0.1
+    config_file = write_config(tmp_path, enable_monitoring)
+    
+    baseline = threading.active_count()
+    for _ in range(5):
+        logger = StreamlitLogger(str(config_file))
+        monitor = SystemMonitor(logger)
+    
+    assert threading.active_count() <= baseline + 1
+    assert wait_until(lambda: len(monitor.samples) >= 1)
+    logger.shutdown()
+
+
+# === 샘플링 ===
+
+def test_shipped_config_logs_every_access_event(tmp_path):
+    """배포 설정은 샘플링/속도 제한 없이 모든 access 이벤트를 기록 (고유 사용자 수 정확)"""
+    logger = StreamlitLogger(str(write_config(tmp_path)))
+    for i in range(500):
+        logger.access_log(user_id=f"user{i}", session_id=f"s{i}", action="app_start")
+    logger.shutdown()
+    
+    activity = LogAnalyzer(logger.log_dir).analyze_user_activity()
+    assert activity['total_activities'] == 500
+    assert activity['unique_users'] == 500
+    assert logger.get_sampling_stats()['access']['app_start']['logged'] == 500
+
+
+def test_sampled_out_events_are_carried_by_next_record(tmp_path):
+    """샘플링으로 버린 이벤트는 다음 기록의 sampled_count로 합산되어 건수 합계가 유지됨"""
+    def sample_noisy_action(config):
+        config['sampling']['access']['rates'] = {'hover': 0.1}
+    logger = StreamlitLogger(str(write_config(tmp_path, sample_noisy_action)))
+    logger.sampler._random.seed(0)
+    for i in range(300):
+        logger.access_log(user_id=f"user{i % 30}", session_id="s", action="hover")
+    logger.shutdown()
+    
+    counters = logger.get_sampling_stats()['access']['hover']
+    pending = logger.sampler._pending[('access', 'hover')]
+    activity = LogAnalyzer(logger.log_dir).analyze_user_activity()
+    assert counters['seen'] == 300
+    assert 0 < counters['logged'] < 100
+    assert activity['total_activities'] + pending == 300
+    # 버려진 이벤트의 사용자는 남지 않으므로 고유 수는 과소 집계될 수 있음
+    assert activity['unique_users'] <= 30
+
+
+# === 민감 정보 마스킹 ===
+
+def test_masker_hides_sensitive_keys_in_nested_records():
+    """키 표기와 관계없이 민감 키 값을 가리고, 가릴 것이 없으면 원본을 그대로 반환"""
+    masker = SensitiveDataMasker(['password', 'api_key', 'token'])
+    record = {
+        'user': 'alice',
+        'apiKey': 'k-123',
+        'profile': {'user_password': 'hunter2', 'theme': 'dark'},
+        'sessions': [{'X-Auth-Token': 't-456'}, 'plain'],
+    }
+    
+    masked = masker.mask(record)
+    
+    assert masked == {
+        'user': 'alice',
+        'apiKey': '***',
+        'profile': {'user_password': '***', 'theme': 'dark'},
+        'sessions': [{'X-Auth-Token': '***'}, 'plain'],
+    }
+    assert record['profile']['user_password'] == 'hunter2'  # 원본은 바꾸지 않음
+    safe = {'user': 'bob', 'page': 'main'}
+    assert masker.mask(safe) is safe
+
+
+def test_masker_hides_values_in_text():
+    masker = SensitiveDataMasker(['password', 'api_key'])
+    text = "login failed: password=hunter2, {'api_key': 'k-123', 'user': 'alice'}"
+    
+    assert masker.mask_text(text) == "login failed: password=***, {'api_key': '***', 'user': 'alice'}"
+    assert masker.mask_text("nothing to hide") == "nothing to hide"
+
+
+@pytest.mark.parametrize('masking', [True, False])
+def test_error_logs_keep_secrets_out_when_masking(tmp_path, masking):
+    """log_errors는 위치 인자를 타입만, 키워드 인자/예외 메시지/트레이스백은 가려서 기록"""
+    def set_masking(config):
+        config['security']['mask_sensitive_data'] = masking
+    logger = StreamlitLogger(str(write_config(tmp_path, set_masking)))
+    decorators = LoggingDecorators(logger)
+    
+    @decorators.log_errors(reraise=False)
+    def login(user, secret, api_key=None):
+        raise ValueError(f"rejected password={secret}")
+    
+    login('alice', 'hunter2', api_key='k-123')
+    logger.access_log(user_id='alice', session_id='s', action='login', password='hunter2')
+    for handler in logging.getLogger(f"{logger.app_name}_error").handlers:
+        handler.flush()
+    
+    logs = (tmp_path / "logs" / "error.log").read_text(encoding='utf-8') + \
+        (tmp_path / "logs" / "access.log").read_text(encoding='utf-8')
+    if masking:
+        assert 'hunter2' not in logs and 'k-123' not in logs
+        assert "['str', 'str']" in logs
+    else:
+        assert 'hunter2' in logs